@@ -0,0 +1,138 @@
+"""
+Per-request batch loading for find_by_id across DAOs
+"""
+import asyncio
+import copy
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from loguru import logger
+
+_current_loader: ContextVar["BatchLoader | None"] = ContextVar("dataops_batch_loader", default=None)
+
+
+class BatchLoader:
+    """Coalesces find_by_id calls into multi-ID queries.
+
+    Calls made within the same event-loop tick for the same (model, storage)
+    are queued and dispatched together through the DAO's ``find_by_ids``
+    (``WHERE id = ANY($1)``, ``MGET``, ``eq(pred, [...])``); each caller
+    receives its own record, also when several asked for the same ID. DAOs without ``find_by_ids`` fall back to
+    concurrent ``find_by_id`` calls.
+    """
+
+    def __init__(self, max_batch_size: int = 1000):
+        self.max_batch_size = max_batch_size
+        self._queues: dict[tuple[Any, str], tuple[Any, dict[str, list[asyncio.Future]]]] = {}
+        # The event loop only holds weak references to tasks
+        self._fetches: set[asyncio.Task] = set()
+        self.stats = {"loads": 0, "batches": 0, "keys": 0}
+
+    async def load(self, dao: Any, item_id: str, storage_name: str) -> Any:
+        """Queue a find_by_id for the next dispatch and wait for its result.
+
+        Args:
+            dao: DAO to load from
+            item_id: Record ID
+            storage_name: Storage name the DAO is configured under
+
+        Returns:
+            Record or None if not found
+        """
+        loop = asyncio.get_running_loop()
+        key = (dao.model_cls, storage_name)
+        future = loop.create_future()
+
+        if key not in self._queues:
+            self._queues[key] = (dao, {})
+            # Runs after every task already scheduled for this tick has queued its ID
+            loop.call_soon(self._dispatch, key)
+
+        self._queues[key][1].setdefault(item_id, []).append(future)
+        self.stats["loads"] += 1
+        return await future
+
+    def _dispatch(self, key: tuple[Any, str]) -> None:
+        """Start fetching everything queued for a (model, storage) pair."""
+        dao, pending = self._queues.pop(key)
+        item_ids = list(pending)
+        for start in range(0, len(item_ids), self.max_batch_size):
+            chunk = {item_id: pending[item_id] for item_id in item_ids[start : start + self.max_batch_size]}
+            task = asyncio.get_running_loop().create_task(self._fetch(dao, chunk))
+            self._fetches.add(task)
+            task.add_done_callback(self._fetches.discard)
+
+    async def _fetch(self, dao: Any, pending: dict[str, list[asyncio.Future]]) -> None:
+        """Run one multi-ID query and resolve the waiting futures."""
+        item_ids = list(pending)
+        self.stats["batches"] += 1
+        self.stats["keys"] += len(item_ids)
+
+        try:
+            if hasattr(dao, "find_by_ids"):
+                found = await dao.find_by_ids(item_ids)
+            else:
+                results = await asyncio.gather(*(dao.find_by_id(item_id) for item_id in item_ids))
+                found = {item_id: result for item_id, result in zip(item_ids, results, strict=True) if result is not None}
+        except Exception as e:
+            logger.error(f"Batch load of {len(item_ids)} IDs failed: {e}")
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for item_id, futures in pending.items():
+            record = found.get(item_id)
+            for index, future in enumerate(futures):
+                if not future.done():
+                    # Callers of the same ID get their own copy, so one caller's changes stay invisible to the others
+                    future.set_result(record if index == 0 or record is None else copy.deepcopy(record))
+
+
+@asynccontextmanager
+async def batch_loading(max_batch_size: int = 1000) -> AsyncIterator[BatchLoader]:
+    """Enable batch loading of find_by_id calls for the enclosed request.
+
+    Args:
+        max_batch_size: Maximum IDs per multi-ID query
+
+    Yields:
+        The active batch loader
+    """
+    loader = _current_loader.get()
+    if loader is not None:
+        # Nested scopes share the outer loader
+        yield loader
+        return
+
+    loader = BatchLoader(max_batch_size)
+    token = _current_loader.set(loader)
+    try:
+        yield loader
+    finally:
+        _current_loader.reset(token)
+
+
+def get_batch_loader() -> BatchLoader | None:
+    """Get the batch loader of the current request, if any."""
+    return _current_loader.get()
+
+
+async def load_by_id(dao: Any, item_id: str, storage_name: str) -> Any:
+    """Find a record by ID, batching with concurrent calls when a loader is active.
+
+    Args:
+        dao: DAO to load from
+        item_id: Record ID
+        storage_name: Storage name the DAO is configured under
+
+    Returns:
+        Record or None if not found
+    """
+    loader = _current_loader.get()
+    if loader is None:
+        return await dao.find_by_id(item_id)
+    return await loader.load(dao, item_id, storage_name)
@@ -10,7 +10,7 @@ from pydantic import Field
 
 from ..utils.uuid_utils import uuid7
 from .security_model import SecuredStorageModel
-from .storage_types import StorageConfig, StorageType
+from .storage_types import ReadConsistency, StorageConfig, StorageType
 
 
 # BPMN Event Types
@@ -152,6 +152,7 @@ class SequenceFlow(BPMNElement):
             "cache": StorageConfig(storage_type=StorageType.CACHE),
         }
         indexes = [{"field": "source_ref", "type": "hash"}, {"field": "target_ref", "type": "hash"}]
+        options = {"cache_ttl": 3600}  # Flows only change on redeployment
 
 
 # Events
@@ -368,6 +369,7 @@ class Role(Resource):
             "graph": StorageConfig(storage_type=StorageType.GRAPH),
             "cache": StorageConfig(storage_type=StorageType.CACHE),
         }
+        options = {"read_consistency": ReadConsistency.BEST_EFFORT, "cache_ttl": 3600}  # Roles change rarely
 
 
 # Process Definition
@@ -409,6 +411,8 @@ class Process(BPMNElement):
         }
         path = "processes"
         indexes = [{"field": "name", "type": "text"}, {"field": "version", "type": "hash"}, {"field": "is_latest", "type": "hash"}]
+        # Definitions tolerate slightly stale reads, so the document replica may serve them
+        options = {"read_consistency": ReadConsistency.BEST_EFFORT, "cache_ttl": 3600, "read_replicas": ["document"]}
 
 
 class ProcessInstance(SecuredStorageModel):
@@ -459,6 +463,7 @@ class ProcessInstance(SecuredStorageModel):
             {"field": "correlation_key", "type": "hash"},
             {"field": "business_key", "type": "hash"},
         ]
+        options = {"cache_ttl": 60}  # Active instances change often
 
 
 # Goals (Extension for goal-oriented BPMN)
@@ -550,6 +555,7 @@ class Message(BPMNElement):
             "document": StorageConfig(storage_type=StorageType.DOCUMENT),  # For persistence
         }
         path = "messages"
+        options = {"cache_ttl": 30, "cache_negative_ttl": 5}  # Messages are short-lived
 
 
 # Monitoring and Metrics
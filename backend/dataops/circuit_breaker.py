@@ -0,0 +1,228 @@
+"""
+Circuit breakers with latency-adaptive timeouts for storage backends
+"""
+import asyncio
+import time
+import weakref
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, TypeVar
+
+import grpc
+from loguru import logger
+
+from .exceptions import CircuitOpenError, StorageConnectionError, StorageTimeoutError
+
+R = TypeVar("R")
+
+# Monotonic deadline of the breaker call in progress (copied into worker threads by asyncio.to_thread)
+_call_deadline: ContextVar[float | None] = ContextVar("circuit_call_deadline", default=None)
+
+# gRPC status codes meaning the backend could not serve the request at all
+BACKEND_FAILURE_STATUS_CODES = {grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.RESOURCE_EXHAUSTED}
+
+# Transport error class names of drivers that do not derive from the builtins (e.g. redis)
+BACKEND_FAILURE_CLASS_NAMES = {"ConnectionError", "TimeoutError"}
+
+
+def remaining_call_timeout() -> float | None:
+    """Seconds left before the current breaker call times out.
+
+    Blocking drivers pass this as their own request timeout so a call
+    abandoned by the breaker also stops in its worker thread.
+
+    Returns:
+        Remaining seconds (at least 0), or None outside a timed call
+    """
+    deadline = _call_deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def is_backend_failure(error: BaseException) -> bool:
+    """Check whether an error means the backend is unreachable, overloaded or too slow.
+
+    DAOs wrap driver errors (``raise StorageError(...) from e``), so the
+    chain of causes is inspected as well. Anything else (bad queries,
+    constraint violations, missing records, validation) is an application
+    error and must not open the circuit.
+    """
+    current: BaseException | None = error
+    while current is not None:
+        if isinstance(current, StorageConnectionError | ConnectionError | TimeoutError):
+            return True
+        if isinstance(current, grpc.RpcError) and current.code() in BACKEND_FAILURE_STATUS_CODES:
+            return True
+        if type(current).__name__ in BACKEND_FAILURE_CLASS_NAMES:
+            return True
+        current = current.__cause__
+    return False
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+
+    CLOSED = "closed"  # Calls flow normally
+    OPEN = "open"  # Calls are rejected until the reset timeout passes
+    HALF_OPEN = "half_open"  # A few trial calls decide whether to close again
+
+
+class CircuitBreaker:
+    """Per-backend circuit breaker with a percentile-based call timeout.
+
+    Calls time out after ``timeout_multiplier`` times the recent
+    ``timeout_percentile`` latency (clamped to ``min_timeout``/``max_timeout``,
+    ``default_timeout`` until ``min_samples`` calls were seen), so a slow
+    backend fails in proportion to its normal speed instead of waiting for
+    the driver's timeout. ``failure_threshold`` consecutive backend failures
+    (see ``is_backend_failure``) open the circuit; after ``reset_timeout`` seconds up to ``half_open_max_calls``
+    trial calls are let through and the first outcome closes or re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        timeout_percentile: float = 0.99,
+        timeout_multiplier: float = 3.0,
+        min_timeout: float = 0.1,
+        max_timeout: float = 30.0,
+        default_timeout: float = 10.0,
+        min_samples: int = 20,
+        window: int = 500,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.timeout_percentile = timeout_percentile
+        self.timeout_multiplier = timeout_multiplier
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.default_timeout = default_timeout
+        self.min_samples = min_samples
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self.stats = {"calls": 0, "failures": 0, "timeouts": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (OPEN turns HALF_OPEN once the reset timeout has passed)."""
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    def allows_calls(self) -> bool:
+        """Check whether a call would currently be let through."""
+        state = self.state
+        return state == CircuitState.CLOSED or (state == CircuitState.HALF_OPEN and self._half_open_calls < self.half_open_max_calls)
+
+    def timeout(self) -> float:
+        """Call timeout derived from recent latencies."""
+        if len(self._latencies) < self.min_samples:
+            return self.default_timeout
+        ordered = sorted(self._latencies)
+        observed = ordered[min(len(ordered) - 1, int(self.timeout_percentile * len(ordered)))]
+        return min(self.max_timeout, max(self.min_timeout, observed * self.timeout_multiplier))
+
+    async def call(self, func: Callable[[], Awaitable[R]], adaptive_timeout: bool = True) -> R:
+        """Run a backend call through the breaker.
+
+        Args:
+            func: Zero-argument coroutine factory
+            adaptive_timeout: Apply the latency-based timeout (disable for
+                calls of unusual size, e.g. bulk chunks)
+
+        Returns:
+            The call's result
+
+        Raises:
+            CircuitOpenError: The circuit is open
+            StorageTimeoutError: The call exceeded the adaptive timeout
+            Exception: Errors raised by the call; only backend failures count
+                towards opening the circuit
+        """
+        if not self.allows_calls():
+            self.stats["rejected"] += 1
+            raise CircuitOpenError(f"Circuit for {self.name} is open")
+        if self._state == CircuitState.HALF_OPEN:
+            self._half_open_calls += 1
+
+        self.stats["calls"] += 1
+        timeout = self.timeout() if adaptive_timeout else None
+        started = time.monotonic()
+        token = _call_deadline.set(started + timeout if timeout is not None else None)
+        try:
+            result = await asyncio.wait_for(func(), timeout)
+        except asyncio.CancelledError:
+            # An abandoned trial call must not use up the half-open budget
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_calls -= 1
+            raise
+        except TimeoutError as e:
+            self.stats["timeouts"] += 1
+            self._on_failure()
+            raise StorageTimeoutError(f"{self.name} did not answer within {timeout:.2f}s") from e
+        except Exception as e:
+            if is_backend_failure(e):
+                self._on_failure()
+            else:
+                # The backend answered; the request itself was wrong
+                self._on_success(time.monotonic() - started, record_latency=False)
+            raise
+        finally:
+            _call_deadline.reset(token)
+
+        self._on_success(time.monotonic() - started, adaptive_timeout)
+        return result
+
+    def _on_success(self, latency: float, record_latency: bool) -> None:
+        if record_latency:
+            self._latencies.append(latency)
+        self._consecutive_failures = 0
+        if self._state == CircuitState.HALF_OPEN:
+            logger.info(f"Circuit for {self.name} closed")
+            self._state = CircuitState.CLOSED
+
+    def _on_failure(self) -> None:
+        self.stats["failures"] += 1
+        self._consecutive_failures += 1
+        if self._state == CircuitState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            if self._state != CircuitState.OPEN:
+                self.stats["opened"] += 1
+                logger.warning(f"Circuit for {self.name} opened after {self._consecutive_failures} consecutive failures")
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get state, current timeout and counters."""
+        return {**self.stats, "state": self.state.value, "timeout": self.timeout()}
+
+
+# One breaker per DAO instance; dropped together with the DAO
+_breakers: "weakref.WeakKeyDictionary[Any, CircuitBreaker]" = weakref.WeakKeyDictionary()
+
+
+def get_circuit_breaker(dao: Any, name: str, **kwargs) -> CircuitBreaker:
+    """Get or create the circuit breaker guarding a DAO.
+
+    Args:
+        dao: DAO instance
+        name: Name used in logs and errors
+        **kwargs: CircuitBreaker settings used when the breaker is created
+    """
+    breaker = _breakers.get(dao)
+    if breaker is None:
+        breaker = CircuitBreaker(name, **kwargs)
+        _breakers[dao] = breaker
+    return breaker
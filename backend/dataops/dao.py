@@ -1,6 +1,7 @@
 """
 Data Access Object base classes and factory
 """
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, TypeVar
 
@@ -36,6 +37,14 @@ class BaseDAO[T: StorageModel](ABC):
     async def find_by_id(self, item_id: str) -> T | None:
         """Find record by ID"""
 
+    async def find_by_ids(self, item_ids: list[str]) -> dict[str, T]:
+        """Find records by ID, keyed by ID (missing IDs are omitted).
+
+        Backends override this with a single multi-ID query.
+        """
+        results = await asyncio.gather(*(self.find_by_id(item_id) for item_id in item_ids))
+        return {item_id: result for item_id, result in zip(item_ids, results, strict=True) if result is not None}
+
     @abstractmethod
     async def find_one(self, query: dict[str, Any]) -> T | None:
         """Find single record matching query"""
@@ -48,6 +57,23 @@ class BaseDAO[T: StorageModel](ABC):
     async def update(self, item_id: str, data: dict[str, Any]) -> bool:
         """Update record by ID"""
 
+    async def upsert(self, instance: T, changes: dict[str, Any] | None = None) -> str:
+        """Write only ``changes`` to an existing record, or the whole instance if it does not exist.
+
+        Takes a single call when the record exists. Backends with a native
+        upsert override this.
+
+        Args:
+            instance: Instance to save
+            changes: Storage values of the changed fields; None writes every field
+
+        Returns:
+            Record ID
+        """
+        if await self.update(instance.id, instance.to_storage_dict() if changes is None else changes):
+            return instance.id
+        return await self.create(instance)
+
     @abstractmethod
     async def delete(self, item_id: str) -> bool:
         """Delete record by ID"""
@@ -126,6 +152,7 @@ class BaseDAO[T: StorageModel](ABC):
         new_instance = self.model_cls(**create_data)
         saved_id = await self.create(new_instance)
         new_instance.id = saved_id
+        new_instance._mark_stored()
         return new_instance, True
 
     async def update_or_create(self, query: dict[str, Any], defaults: dict[str, Any] | None = None) -> tuple[T, bool]:
@@ -139,6 +166,7 @@ class BaseDAO[T: StorageModel](ABC):
         new_instance = self.model_cls(**create_data)
         saved_id = await self.create(new_instance)
         new_instance.id = saved_id
+        new_instance._mark_stored()
         return new_instance, True
 
 
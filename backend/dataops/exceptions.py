@@ -33,3 +33,11 @@ class TransactionError(StorageError):
 
 class ConfigurationError(StorageError):
     """Raised when storage configuration is invalid"""
+
+
+class StorageTimeoutError(StorageConnectionError):
+    """Raised when a storage call exceeds its timeout"""
+
+
+class CircuitOpenError(StorageConnectionError):
+    """Raised when a storage backend's circuit breaker rejects a call"""
@@ -0,0 +1,253 @@
+"""Compact in-memory CSR graph for analytics over Dgraph edge exports."""
+
+import time
+from typing import Any
+
+import numpy as np
+
+INDEX_DTYPE = np.uint32
+
+
+class CSRGraph:
+    """Directed graph stored as compressed sparse rows.
+
+    Nodes are addressed by dense indices; ``uids`` maps indices back to Dgraph
+    uids and ``labels`` to model IDs (None for nodes outside the exported
+    type). Edges are kept as parallel ``src``/``dst`` index arrays so the
+    snapshot can be refreshed incrementally and the CSR rebuilt in O(E).
+    """
+
+    def __init__(self, uids: list[str], labels: list[str | None], src: np.ndarray, dst: np.ndarray, edge_predicates: tuple[str, ...] = ()):
+        """Build the CSR arrays.
+
+        Args:
+            uids: Dgraph uid per node index
+            labels: Model ID per node index (None if unknown)
+            src: Source node index per edge
+            dst: Target node index per edge
+            edge_predicates: Predicates the edges were exported from
+        """
+        self.uids = list(uids)
+        self.labels = list(labels)
+        self.index = {uid: i for i, uid in enumerate(self.uids)}
+        self.label_index = {label: i for i, label in enumerate(self.labels) if label is not None}
+        self.src = np.asarray(src, dtype=INDEX_DTYPE)
+        self.dst = np.asarray(dst, dtype=INDEX_DTYPE)
+        self.edge_predicates = edge_predicates
+        self.built_at = time.time()
+
+        order = np.argsort(self.src, kind="stable")
+        self.indices = self.dst[order]
+        self.indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.src, minlength=self.num_nodes), out=self.indptr[1:])
+        self._undirected: tuple[np.ndarray, np.ndarray] | None = None
+
+    @classmethod
+    def from_edge_list(cls, nodes: list[tuple[str, str | None]], edges: list[tuple[str, str]], edge_predicates: tuple[str, ...] = ()) -> "CSRGraph":
+        """Build a graph from exported nodes and uid pairs.
+
+        Args:
+            nodes: (uid, model ID) pairs
+            edges: (source uid, target uid) pairs
+            edge_predicates: Predicates the edges were exported from
+
+        Returns:
+            New graph
+        """
+        uids: list[str] = []
+        labels: list[str | None] = []
+        index: dict[str, int] = {}
+        cls._add_nodes(uids, labels, index, nodes)
+        src, dst = cls._map_edges(uids, labels, index, edges)
+        return cls(uids, labels, src, dst, edge_predicates)
+
+    @staticmethod
+    def _add_nodes(uids: list[str], labels: list[str | None], index: dict[str, int], nodes: list[tuple[str, str | None]]) -> None:
+        """Register nodes, filling in labels of already known uids."""
+        for uid, label in nodes:
+            position = index.get(uid)
+            if position is None:
+                index[uid] = len(uids)
+                uids.append(uid)
+                labels.append(label)
+            elif label is not None:
+                labels[position] = label
+
+    @staticmethod
+    def _map_edges(uids: list[str], labels: list[str | None], index: dict[str, int], edges: list[tuple[str, str]]) -> tuple[np.ndarray, np.ndarray]:
+        """Map uid pairs to index arrays, registering unseen targets."""
+        src = np.empty(len(edges), dtype=INDEX_DTYPE)
+        dst = np.empty(len(edges), dtype=INDEX_DTYPE)
+        for i, (source, target) in enumerate(edges):
+            for uid in (source, target):
+                if uid not in index:
+                    index[uid] = len(uids)
+                    uids.append(uid)
+                    labels.append(None)
+            src[i] = index[source]
+            dst[i] = index[target]
+        return src, dst
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.uids)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of directed edges."""
+        return len(self.src)
+
+    def with_updates(self, nodes: list[tuple[str, str | None]], edges: list[tuple[str, str]]) -> "CSRGraph":
+        """Return a new graph with the outgoing edges of ``nodes`` replaced.
+
+        Args:
+            nodes: Changed (uid, model ID) pairs
+            edges: Current outgoing (source uid, target uid) pairs of the changed nodes
+
+        Returns:
+            Refreshed graph
+        """
+        uids = list(self.uids)
+        labels = list(self.labels)
+        index = dict(self.index)
+        self._add_nodes(uids, labels, index, nodes)
+
+        changed = np.fromiter((index[uid] for uid, _ in nodes), dtype=INDEX_DTYPE, count=len(nodes))
+        keep = ~np.isin(self.src, changed)
+        new_src, new_dst = self._map_edges(uids, labels, index, edges)
+
+        src = np.concatenate([self.src[keep], new_src])
+        dst = np.concatenate([self.dst[keep], new_dst])
+        return CSRGraph(uids, labels, src, dst, self.edge_predicates)
+
+    def out_degree(self) -> np.ndarray:
+        """Outgoing edge count per node."""
+        return np.diff(self.indptr)
+
+    def in_degree(self) -> np.ndarray:
+        """Incoming edge count per node."""
+        return np.bincount(self.dst, minlength=self.num_nodes).astype(np.int64)
+
+    def _undirected_csr(self) -> tuple[np.ndarray, np.ndarray]:
+        """CSR over edges in both directions, built on first use."""
+        if self._undirected is None:
+            src = np.concatenate([self.src, self.dst])
+            dst = np.concatenate([self.dst, self.src])
+            order = np.argsort(src, kind="stable")
+            indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+            np.cumsum(np.bincount(src, minlength=self.num_nodes), out=indptr[1:])
+            self._undirected = (indptr, dst[order])
+        return self._undirected
+
+    def connected_components(self) -> np.ndarray:
+        """Label weakly connected components with vectorized union-find.
+
+        Each round hooks the larger root of every edge onto the smaller one
+        and then compresses paths by pointer jumping, until all edges join
+        nodes with the same root.
+
+        Returns:
+            Component root index per node
+        """
+        parent = np.arange(self.num_nodes, dtype=np.int64)
+        src = self.src.astype(np.int64)
+        dst = self.dst.astype(np.int64)
+
+        while True:
+            root_src = parent[src]
+            root_dst = parent[dst]
+            pending = root_src != root_dst
+            if not pending.any():
+                return parent
+
+            high = np.maximum(root_src[pending], root_dst[pending])
+            low = np.minimum(root_src[pending], root_dst[pending])
+            np.minimum.at(parent, high, low)
+
+            # Pointer jumping until every node points at its root
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+
+    def pagerank(self, damping: float = 0.85, max_iter: int = 100, tol: float = 1.0e-6) -> np.ndarray:
+        """Compute PageRank by power iteration.
+
+        Args:
+            damping: Damping factor
+            max_iter: Maximum iterations
+            tol: L1 convergence tolerance
+
+        Returns:
+            Rank per node (sums to 1)
+        """
+        n = self.num_nodes
+        if n == 0:
+            return np.zeros(0)
+
+        out_degree = self.out_degree().astype(np.float64)
+        dangling = out_degree == 0
+        inverse_degree = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+        rank = np.full(n, 1.0 / n)
+
+        for _ in range(max_iter):
+            contributions = np.bincount(self.dst, weights=(rank * inverse_degree)[self.src], minlength=n)
+            new_rank = (1.0 - damping) / n + damping * (contributions + rank[dangling].sum() / n)
+            converged = np.abs(new_rank - rank).sum() < tol
+            rank = new_rank
+            if converged:
+                break
+
+        return rank
+
+    def bfs(self, source: int, max_depth: int | None = None, directed: bool = True) -> np.ndarray:
+        """Compute hop distances from a source node, one frontier at a time.
+
+        Args:
+            source: Source node index
+            max_depth: Stop after this many hops (None = unlimited)
+            directed: Follow edges only in their direction
+
+        Returns:
+            Distance per node (-1 if unreachable)
+        """
+        indptr, indices = (self.indptr, self.indices) if directed else self._undirected_csr()
+        distances = np.full(self.num_nodes, -1, dtype=np.int64)
+        distances[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        depth = 0
+
+        while frontier.size and (max_depth is None or depth < max_depth):
+            depth += 1
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+            # Gather all neighbor slices of the frontier in one shot
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+            neighbors = np.unique(indices[offsets])
+            frontier = neighbors[distances[neighbors] < 0].astype(np.int64)
+            distances[frontier] = depth
+
+        return distances
+
+    def components_by_label(self) -> list[list[str]]:
+        """Group labelled nodes by connected component.
+
+        Returns:
+            Components as lists of model IDs, largest first
+        """
+        roots = self.connected_components()
+        groups: dict[int, list[str]] = {}
+        for position, root in enumerate(roots.tolist()):
+            label = self.labels[position]
+            if label is not None:
+                groups.setdefault(root, []).append(label)
+        return sorted(groups.values(), key=len, reverse=True)
+
+    def by_label(self, values: np.ndarray) -> dict[str, Any]:
+        """Map a per-node array to model IDs, skipping unlabelled nodes."""
+        return {label: value for label, value in zip(self.labels, values.tolist(), strict=True) if label is not None}
@@ -0,0 +1,164 @@
+"""Load-balanced Dgraph client spreading transactions across alphas."""
+
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import grpc
+import pydgraph
+from loguru import logger
+
+from ...circuit_breaker import remaining_call_timeout
+
+# gRPC status codes that indicate the alpha itself is unreachable or overloaded
+UNHEALTHY_STATUS_CODES = {grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED}
+
+
+class AlphaNode:
+    """Connection and load state for a single Dgraph alpha."""
+
+    def __init__(self, address: str):
+        """Open a gRPC stub to the alpha.
+
+        Args:
+            address: Alpha address as host:port
+        """
+        self.address = address
+        self.stub = pydgraph.DgraphClientStub(address)
+        self.client = pydgraph.DgraphClient(self.stub)
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.unhealthy_until = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the alpha is currently in rotation."""
+        return time.monotonic() >= self.unhealthy_until
+
+
+class LoadBalancedDgraphClient:
+    """Dgraph client that balances transactions across several alphas.
+
+    Each transaction is pinned to one alpha chosen by least outstanding
+    requests (or round-robin). Alphas failing with connectivity errors are
+    taken out of rotation for ``retry_after`` seconds.
+    """
+
+    POLICIES = ("least_outstanding", "round_robin")
+
+    def __init__(self, addresses: list[str], policy: str = "least_outstanding", retry_after: float = 30.0):
+        """Initialize the client.
+
+        Args:
+            addresses: Alpha addresses as host:port
+            policy: 'least_outstanding' or 'round_robin'
+            retry_after: Seconds an unhealthy alpha stays out of rotation
+        """
+        if not addresses:
+            raise ValueError("At least one Dgraph alpha address is required")
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown load balancing policy: {policy}")
+
+        self.nodes = [AlphaNode(address) for address in addresses]
+        self.policy = policy
+        self.retry_after = retry_after
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def _select(self) -> AlphaNode:
+        """Pick the alpha for the next transaction."""
+        # Fall back to every alpha when none is healthy
+        candidates = [node for node in self.nodes if node.healthy] or self.nodes
+        if self.policy == "round_robin":
+            return candidates[next(self._counter) % len(candidates)]
+        return min(candidates, key=lambda node: (node.outstanding, node.requests))
+
+    def _call(self, node: AlphaNode, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a request against an alpha while tracking load and health."""
+        # Bound the RPC by the circuit breaker's deadline so an abandoned call does not linger in its thread
+        timeout = remaining_call_timeout()
+        if timeout is not None and kwargs.get("timeout") is None:
+            kwargs["timeout"] = timeout
+        with self._lock:
+            node.outstanding += 1
+            node.requests += 1
+        try:
+            result = func(*args, **kwargs)
+        except grpc.RpcError as e:
+            if e.code() in UNHEALTHY_STATUS_CODES:
+                self._mark_unhealthy(node, e)
+            raise
+        else:
+            node.failures = 0
+            return result
+        finally:
+            with self._lock:
+                node.outstanding -= 1
+
+    def _mark_unhealthy(self, node: AlphaNode, error: Exception) -> None:
+        """Take an alpha out of rotation."""
+        node.failures += 1
+        node.unhealthy_until = time.monotonic() + self.retry_after
+        logger.warning(f"Dgraph alpha {node.address} marked unhealthy for {self.retry_after}s: {error}")
+
+    def txn(self, read_only: bool = False, best_effort: bool = False) -> "BalancedTxn":
+        """Create a transaction pinned to the selected alpha.
+
+        Args:
+            read_only: Read-only transaction
+            best_effort: Best-effort read (requires read_only)
+
+        Returns:
+            Transaction wrapper
+        """
+        node = self._select()
+        return BalancedTxn(self, node, node.client.txn(read_only=read_only, best_effort=best_effort))
+
+    def alter(self, operation: Any) -> Any:
+        """Run a schema operation on the selected alpha."""
+        node = self._select()
+        return self._call(node, node.client.alter, operation)
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        """Get per-alpha load and health statistics."""
+        return [
+            {"address": node.address, "healthy": node.healthy, "outstanding": node.outstanding, "requests": node.requests, "failures": node.failures}
+            for node in self.nodes
+        ]
+
+    def close(self) -> None:
+        """Close all alpha stubs."""
+        for node in self.nodes:
+            node.stub.close()
+
+
+class BalancedTxn:
+    """pydgraph transaction pinned to one alpha that reports load and failures."""
+
+    def __init__(self, balancer: LoadBalancedDgraphClient, node: AlphaNode, txn: Any):
+        self._balancer = balancer
+        self._txn = txn
+        self.node = node
+
+    def query(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute a query on the pinned alpha."""
+        return self._balancer._call(self.node, self._txn.query, *args, **kwargs)
+
+    def mutate(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute a mutation on the pinned alpha."""
+        return self._balancer._call(self.node, self._txn.mutate, *args, **kwargs)
+
+    def do_request(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute a query/mutation request on the pinned alpha."""
+        return self._balancer._call(self.node, self._txn.do_request, *args, **kwargs)
+
+    def commit(self, *args: Any, **kwargs: Any) -> Any:
+        """Commit the transaction on the pinned alpha."""
+        return self._balancer._call(self.node, self._txn.commit, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # create_mutation, create_request, discard, ...
+        return getattr(self._txn, name)
@@ -1,16 +1,42 @@
 """Dgraph CREATE operations."""
 
+import asyncio
 import json
+import time
+from collections.abc import AsyncIterable, Callable
+from typing import Any
 
+import pydgraph
 from loguru import logger
 
+from ....utils.uuid_utils import uuid7
 from ...exceptions import StorageError
 from ...storage_model import StorageModel
 
+# (source ID, edge field, target ID) as accepted by import_stream
+GraphEdge = tuple[str, str, str]
+
 
 class DgraphCreateMixin:
     """Mixin for Dgraph CREATE operations."""
 
+    def _to_dgraph_create(self, instance: StorageModel) -> dict[str, Any]:
+        """Convert a model instance to a prefixed Dgraph node.
+
+        Args:
+            instance: Model instance
+
+        Returns:
+            Prefixed predicate dictionary including dgraph.type and id
+        """
+        data = self._to_dgraph_format(instance)
+        if not data.get("id"):
+            data["id"] = uuid7()
+
+        prefixed_data = {f"{self.collection_name}.{k}": v for k, v in data.items() if v is not None}
+        prefixed_data["dgraph.type"] = self.collection_name
+        return prefixed_data
+
     async def create(self, instance: StorageModel) -> str:
         """Create a new item in Dgraph.
 
@@ -25,43 +51,25 @@ class DgraphCreateMixin:
 
         txn = self.client.txn()
         try:
-            # Convert to Dgraph format
-            data = self._to_dgraph_format(instance)
-
-            # Set the type
-            data["dgraph.type"] = self.collection_name
-
-            # Ensure ID is set
-            if "id" not in data or not data["id"]:
-                data["id"] = instance.generate_id()
-
-            # Prefix all fields with collection name
-            prefixed_data = {f"{self.collection_name}.{k}" if not k.startswith("dgraph.") else k: v for k, v in data.items()}
-
-            # Create mutation
-            mutation = json.dumps(prefixed_data)
-
-            # Execute mutation
-            response = txn.mutate(set_json=mutation)
-
-            # Commit transaction
-            txn.commit()
-
-            # Return the ID
-            return data["id"]
+            data = self._to_dgraph_create(instance)
+            await asyncio.to_thread(txn.mutate, set_obj=data, commit_now=True)
+            return data[f"{self.collection_name}.id"]
 
         except Exception as e:
-            txn.discard()
             logger.error(f"Failed to create item: {e}")
             raise StorageError(f"Failed to create item: {e}") from e
         finally:
             txn.discard()
 
-    async def bulk_create(self, instances: list[StorageModel]) -> list[str]:
+    async def bulk_create(self, instances: list[StorageModel], chunk_size: int | None = None) -> list[str]:
         """Create multiple items in Dgraph.
 
+        Items are written in chunks (options["bulk_chunk_size"]), one
+        committed mutation per chunk.
+
         Args:
             instances: List of model instances to create
+            chunk_size: Items per mutation
 
         Returns:
             List of created item IDs
@@ -72,41 +80,219 @@ class DgraphCreateMixin:
         if not instances:
             return []
 
-        txn = self.client.txn()
+        ids: list[str] = []
         try:
-            items = []
-            ids = []
+            for chunk in self._chunks(instances, chunk_size):
+                items = [self._to_dgraph_create(instance) for instance in chunk]
+                txn = self.client.txn()
+                try:
+                    await asyncio.to_thread(txn.mutate, set_obj=items, commit_now=True)
+                finally:
+                    txn.discard()
+                ids.extend(item[f"{self.collection_name}.id"] for item in items)
 
-            for instance in instances:
-                data = self._to_dgraph_format(instance)
-                data["dgraph.type"] = self.collection_name
+            return ids
 
-                if "id" not in data or not data["id"]:
-                    data["id"] = instance.generate_id()
+        except Exception as e:
+            logger.error(f"Failed to bulk create items after {len(ids)} created: {e}")
+            raise StorageError(f"Failed to bulk create items: {e}") from e
 
-                ids.append(data["id"])
+    def _node_nquads(self, label: str, instance: StorageModel) -> tuple[str, list[str]]:
+        """Render a model instance as N-Quads on a blank node.
 
-                # Prefix fields
-                prefixed_data = {f"{self.collection_name}.{k}" if not k.startswith("dgraph.") else k: v for k, v in data.items()}
-                items.append(prefixed_data)
+        Args:
+            label: Blank node label (without ``_:``)
+            instance: Model instance
 
-            # Create bulk mutation
-            mutation = json.dumps(items)
+        Returns:
+            Model ID and N-Quad lines
+        """
+        data = self._to_dgraph_create(instance)
+        lines = []
+        for predicate, value in data.items():
+            literal = ("true" if value else "false") if isinstance(value, bool) else str(value)
+            lines.append(f"_:{label} <{predicate}> {json.dumps(literal, ensure_ascii=False)} .")
+        return data[f"{self.collection_name}.id"], lines
 
-            # Execute mutation
-            txn.mutate(set_json=mutation)
+    def _commit_nquads(self, nquads: str, max_retries: int) -> tuple[dict[str, str], int]:
+        """Commit an N-Quad chunk in its own transaction, retrying on conflict.
 
-            # Commit transaction
-            txn.commit()
+        Args:
+            nquads: N-Quad lines to set
+            max_retries: Retries after aborted/retriable errors
 
-            return ids
+        Returns:
+            Blank node label to uid mapping and the number of retries used
+        """
+        attempt = 0
+        while True:
+            txn = self.client.txn()
+            try:
+                response = txn.mutate(set_nquads=nquads, commit_now=True)
+                return dict(response.uids), attempt
+            except (pydgraph.errors.AbortedError, pydgraph.errors.RetriableError):
+                if attempt >= max_retries:
+                    raise
+            finally:
+                txn.discard()
+            time.sleep(min(0.05 * 2**attempt, 2.0))
+            attempt += 1
+
+    def _resolve_uids(self, node_ids: list[str]) -> dict[str, str]:
+        """Look up the uids of existing nodes by model ID.
+
+        Args:
+            node_ids: Model IDs
+
+        Returns:
+            Mapping of model ID to uid for the IDs that exist
+        """
+        uids: dict[str, str] = {}
+        for chunk in self._chunks(node_ids):
+            query = f"""
+            {{
+                nodes(func: {self._id_func(chunk)}) @filter(type({self.collection_name})) {{
+                    uid
+                    {self.collection_name}.id
+                }}
+            }}
+            """
+            txn = self.client.txn(read_only=True)
+            response = txn.query(query)
+            for node in json.loads(response.json).get("nodes", []):
+                uids[node[f"{self.collection_name}.id"]] = node["uid"]
+        return uids
+
+    async def import_stream(  # noqa: C901
+        self,
+        items: AsyncIterable[StorageModel | GraphEdge],
+        chunk_size: int | None = None,
+        concurrency: int | None = None,
+        max_retries: int = 5,
+        progress: Callable[[dict[str, Any]], None] | None = None,
+    ) -> dict[str, Any]:
+        """Stream nodes and edges into Dgraph as chunked N-Quad mutations.
+
+        Nodes become blank nodes; the uids Dgraph assigns are remembered so
+        later chunks can reference earlier nodes. Edges whose endpoints are
+        already known (committed or in the current chunk) are written with
+        the chunk; the rest are resolved by ID after all nodes are in.
+        Chunks are committed by up to ``concurrency`` transactions at a time
+        and retried with backoff on conflicts.
+
+        Args:
+            items: Model instances and (source ID, edge field, target ID) tuples
+            chunk_size: Nodes and edges per mutation (default: options["bulk_chunk_size"])
+            concurrency: Concurrent transactions (default: options["import_concurrency"] or 4)
+            max_retries: Retries per chunk on aborted transactions
+            progress: Called with a stats snapshot after every committed chunk
+
+        Returns:
+            Import statistics: nodes, edges, skipped_edges, chunks, retries, seconds, rate
+        """
+        if not self.client:
+            raise StorageError("Not connected to Dgraph")
+
+        options = self.config.options if self.config else {}
+        chunk_size = chunk_size or int(options.get("bulk_chunk_size", self.DEFAULT_BULK_CHUNK_SIZE))
+        concurrency = concurrency or int(options.get("import_concurrency", 4))
+
+        stats: dict[str, Any] = {"nodes": 0, "edges": 0, "skipped_edges": 0, "chunks": 0, "retries": 0, "seconds": 0.0, "rate": 0.0}
+        started = time.monotonic()
+        uid_map: dict[str, str] = {}
+        deferred: list[GraphEdge] = []
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks: list[asyncio.Task] = []
+        label_counter = 0
+
+        lines: list[str] = []
+        labels: dict[str, str] = {}
+        edge_count = 0
+
+        async def commit(chunk_lines: list[str], chunk_labels: dict[str, str], chunk_edges: int) -> None:
+            try:
+                uids, retries = await asyncio.to_thread(self._commit_nquads, "\n".join(chunk_lines), max_retries)
+            finally:
+                semaphore.release()
+
+            uid_map.update({node_id: uids[label] for node_id, label in chunk_labels.items() if label in uids})
+            stats["nodes"] += len(chunk_labels)
+            stats["edges"] += chunk_edges
+            stats["chunks"] += 1
+            stats["retries"] += retries
+            stats["seconds"] = time.monotonic() - started
+            stats["rate"] = (stats["nodes"] + stats["edges"]) / stats["seconds"] if stats["seconds"] else 0.0
+            logger.info(f"Imported {stats['nodes']} nodes, {stats['edges']} edges into {self.collection_name} ({stats['rate']:.0f} items/s)")
+            if progress:
+                progress(dict(stats))
+
+        async def flush() -> None:
+            nonlocal lines, labels, edge_count
+            if not lines:
+                return
+            # Fail fast and keep the task list short
+            for task in [task for task in tasks if task.done()]:
+                task.result()
+                tasks.remove(task)
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(commit(lines, labels, edge_count)))
+            lines, labels, edge_count = [], {}, 0
+
+        def reference(node_id: str) -> str | None:
+            if node_id in uid_map:
+                return f"<{uid_map[node_id]}>"
+            if node_id in labels:
+                return f"_:{labels[node_id]}"
+            return None
+
+        try:
+            async for item in items:
+                if isinstance(item, StorageModel):
+                    label_counter += 1
+                    label = f"n{label_counter}"
+                    node_id, node_lines = self._node_nquads(label, item)
+                    labels[node_id] = label
+                    lines.extend(node_lines)
+                else:
+                    source, edge, target = item
+                    source_ref, target_ref = reference(source), reference(target)
+                    if source_ref and target_ref:
+                        lines.append(f"{source_ref} <{self.collection_name}.{edge}> {target_ref} .")
+                        edge_count += 1
+                    else:
+                        deferred.append(item)
+
+                if len(labels) + edge_count >= chunk_size:
+                    await flush()
+
+            await flush()
+            await asyncio.gather(*tasks)
+            tasks.clear()
+
+            # Edges referencing nodes from in-flight chunks or outside the stream
+            unknown = sorted({node_id for source, _, target in deferred for node_id in (source, target) if node_id not in uid_map})
+            if unknown:
+                uid_map.update(await asyncio.to_thread(self._resolve_uids, unknown))
+
+            for source, edge, target in deferred:
+                if source in uid_map and target in uid_map:
+                    lines.append(f"<{uid_map[source]}> <{self.collection_name}.{edge}> <{uid_map[target]}> .")
+                    edge_count += 1
+                    if edge_count >= chunk_size:
+                        await flush()
+                else:
+                    stats["skipped_edges"] += 1
+                    logger.warning(f"Skipping edge {source} -[{edge}]-> {target}: unknown endpoint")
+
+            await flush()
+            await asyncio.gather(*tasks)
+            return stats
 
         except Exception as e:
-            txn.discard()
-            logger.error(f"Failed to bulk create items: {e}")
-            raise StorageError(f"Failed to bulk create items: {e}") from e
-        finally:
-            txn.discard()
+            for task in tasks:
+                task.cancel()
+            logger.error(f"Failed to import graph stream after {stats['nodes']} nodes, {stats['edges']} edges: {e}")
+            raise StorageError(f"Failed to import graph stream: {e}") from e
 
     async def create_indexes(self) -> None:
         """Create indexes in Dgraph (handled by schema)."""
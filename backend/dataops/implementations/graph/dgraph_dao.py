@@ -1,12 +1,15 @@
 """Dgraph DAO implementation combining all CRUD and graph operations."""
 
-import pydgraph
+import asyncio
+
 from loguru import logger
 
 from ...dao import BaseDAO
 from ...exceptions import StorageError
 from ...storage_model import StorageModel
 from ...storage_types import StorageConfig
+from .csr_graph import CSRGraph
+from .dgraph_client import LoadBalancedDgraphClient
 from .dgraph_create import DgraphCreateMixin
 from .dgraph_delete import DgraphDeleteMixin
 from .dgraph_graph import DgraphGraphMixin
@@ -17,7 +20,6 @@ from .dgraph_utils import DgraphUtilsMixin
 
 
 class DgraphDAO(
-    BaseDAO,
     DgraphCreateMixin,
     DgraphReadMixin,
     DgraphUpdateMixin,
@@ -25,6 +27,7 @@ class DgraphDAO(
     DgraphGraphMixin,
     DgraphSchemaMixin,
     DgraphUtilsMixin,
+    BaseDAO,
 ):
     """DAO implementation for Dgraph graph database.
 
@@ -36,6 +39,9 @@ class DgraphDAO(
     - DgraphGraphMixin: Graph-specific operations (k-hop, shortest path, etc.)
     - DgraphSchemaMixin: Schema and metadata operations
     - DgraphUtilsMixin: Utility and helper methods
+
+    BaseDAO comes last so the mixin implementations take precedence over
+    its abstract method declarations in the MRO.
     """
 
     def __init__(self, model_cls: type[StorageModel], config: StorageConfig):
@@ -46,30 +52,54 @@ class DgraphDAO(
             config: Storage configuration
         """
         super().__init__(model_cls, config)
-        self.client: pydgraph.DgraphClient | None = None
-        self.stub = None
+        self.client: LoadBalancedDgraphClient | None = None
+        # DQL selection blocks keyed by (field set, expand_edges)
+        self._projection_cache: dict[tuple[frozenset[str] | None, bool], str] = {}
+        # CSR analytics snapshots keyed by (type, edge predicates)
+        self._graph_snapshots: dict[tuple[str, tuple[str, ...]], CSRGraph] = {}
+
+    def _alpha_addresses(self) -> list[str]:
+        """Get the alpha addresses to connect to.
+
+        Uses options["alpha_addresses"] (list or comma-separated string) and
+        falls back to host:port.
+
+        Returns:
+            List of host:port addresses
+        """
+        addresses = self.config.options.get("alpha_addresses")
+        if isinstance(addresses, str):
+            addresses = addresses.split(",")
+        addresses = [address.strip() for address in addresses or [] if address and address.strip()]
+        if addresses:
+            return addresses
+
+        host = self.config.host or "localhost"
+        port = self.config.port or 9080
+        return [f"{host}:{port}"]
 
     async def connect(self) -> None:
-        """Establish connection to Dgraph."""
+        """Establish connection to all configured Dgraph alphas."""
         try:
-            # Create gRPC stub
-            host = self.config.host or "localhost"
-            port = self.config.port or 9080
-            self.stub = pydgraph.DgraphClientStub(f"{host}:{port}")
+            addresses = self._alpha_addresses()
 
-            # Create client
-            self.client = pydgraph.DgraphClient(self.stub)
+            # Create client with one gRPC stub per alpha
+            self.client = LoadBalancedDgraphClient(
+                addresses,
+                policy=self.config.options.get("load_balancing", "least_outstanding"),
+                retry_after=float(self.config.options.get("unhealthy_retry_after", 30.0)),
+            )
 
             # Set schema if defined
-            self._ensure_schema()
+            await asyncio.to_thread(self._ensure_schema)
 
-            logger.info(f"Connected to Dgraph at {host}:{port}")
+            logger.info(f"Connected to Dgraph at {', '.join(addresses)}")
         except Exception as e:
             raise StorageError(f"Failed to connect to Dgraph: {e}") from e
 
     async def disconnect(self) -> None:
         """Close connection to Dgraph."""
-        if self.stub:
-            self.stub.close()
+        if self.client:
+            self.client.close()
             self.client = None
             logger.info("Disconnected from Dgraph")
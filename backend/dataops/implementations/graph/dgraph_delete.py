@@ -1,6 +1,8 @@
 """Dgraph DELETE operations."""
 
+import asyncio
 import json
+from typing import Any
 
 from loguru import logger
 
@@ -22,42 +24,25 @@ class DgraphDeleteMixin:
         if not self.client:
             raise StorageError("Not connected to Dgraph")
 
-        # First, find the item to get its UID
+        # Resolve the UID and delete all its predicates in a single upsert block
         query = f"""
         {{
-            item(func: eq({self.collection_name}.id, "{item_id}")) @filter(type({self.collection_name})) {{
-                uid
-                expand(_all_)
+            item(func: {self._id_func(item_id)}) @filter(type({self.collection_name})) {{
+                v as uid
             }}
         }}
         """
 
         txn = self.client.txn()
         try:
-            response = txn.query(query)
-            result = json.loads(response.json)
-
-            if not result.get("item") or len(result["item"]) == 0:
-                return False
-
-            item = result["item"][0]
-            uid = item["uid"]
-
-            # Build delete mutation
-            # Delete all predicates for this node
-            delete_obj = {"uid": uid}
+            mutation = txn.create_mutation(del_nquads="uid(v) * * .", cond="@if(gt(len(v), 0))")
 
-            # Delete the node and all its predicates
-            txn.mutate(del_json=json.dumps(delete_obj))
-
-            # Also delete all predicates explicitly
-            delete_nquads = f"<{uid}> * * ."
-            txn.mutate(del_nquads=delete_nquads)
-
-            # Commit transaction
-            txn.commit()
+            # Execute upsert and commit in the same round trip
+            request = txn.create_request(query=query, mutations=[mutation], commit_now=True)
+            response = await asyncio.to_thread(txn.do_request, request)
+            result = json.loads(response.json)
 
-            return True
+            return bool(result.get("item"))
 
         except Exception as e:
             txn.discard()
@@ -66,11 +51,16 @@ class DgraphDeleteMixin:
         finally:
             txn.discard()
 
-    async def bulk_delete(self, ids: list[str]) -> int:
+    async def bulk_delete(self, ids: list[str], chunk_size: int | None = None, atomic: bool = False) -> int:
         """Delete multiple items from Dgraph.
 
+        Each chunk is a single upsert block that resolves all UIDs with one
+        ``eq(pred, [...])`` query and deletes them in one mutation.
+
         Args:
             ids: List of item IDs to delete
+            chunk_size: Items per chunk (defaults to options["bulk_chunk_size"])
+            atomic: Commit the whole batch in one transaction instead of per chunk
 
         Returns:
             Number of items deleted
@@ -82,8 +72,50 @@ class DgraphDeleteMixin:
             return 0
 
         deleted_count = 0
-        for item_id in ids:
-            if await self.delete(item_id):
-                deleted_count += 1
+        batch_txn = self.client.txn() if atomic else None
+        try:
+            for chunk in self._chunks(ids, chunk_size):
+                txn = batch_txn or self.client.txn()
+                try:
+                    deleted_count += await asyncio.to_thread(self._bulk_delete_chunk, txn, chunk, commit_now=not atomic)
+                finally:
+                    if not atomic:
+                        txn.discard()
+
+            if batch_txn:
+                await asyncio.to_thread(batch_txn.commit)
+
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"Failed to bulk delete items after {deleted_count} deletes: {e}")
+            raise StorageError(f"Failed to bulk delete items: {e}") from e
+        finally:
+            if batch_txn:
+                batch_txn.discard()
+
+    def _bulk_delete_chunk(self, txn: Any, chunk: list[str], commit_now: bool) -> int:
+        """Delete a chunk of items with one upsert block.
+
+        Args:
+            txn: Open Dgraph transaction
+            chunk: Item IDs to delete
+            commit_now: Commit together with the mutation
+
+        Returns:
+            Number of items found and deleted
+        """
+        query = f"""
+        {{
+            items(func: {self._id_func(chunk)}) @filter(type({self.collection_name})) {{
+                v as uid
+            }}
+        }}
+        """
+
+        mutation = txn.create_mutation(del_nquads="uid(v) * * .", cond="@if(gt(len(v), 0))")
+        request = txn.create_request(query=query, mutations=[mutation], commit_now=commit_now)
+        response = txn.do_request(request)
+        result = json.loads(response.json)
 
-        return deleted_count
+        return len(result.get("items", []))
@@ -1,26 +1,37 @@
 """Dgraph graph-specific operations."""
 
+import asyncio
 import json
+import time
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from typing import Any
 
 from loguru import logger
 
 from ...exceptions import StorageError
+from .csr_graph import CSRGraph
 
 
 class DgraphGraphMixin:
     """Mixin for Dgraph graph-specific operations."""
 
-    async def k_hop_query(self, start_id: str, k: int, edge_types: list[str] | None = None) -> dict[str, Any]:
-        """Execute k-hop traversal from a starting node.
+    async def iter_k_hop(self, start_id: str, k: int, edge_types: list[str] | None = None, max_fanout: int | None = None) -> AsyncIterator[dict[str, Any]]:
+        """Traverse up to k hops from a node, yielding one level at a time.
+
+        Each level is a single query that expands the current frontier along
+        the requested edge predicates only. Dgraph unions the targets, drops
+        already visited uids and returns at most ``max_fanout`` new nodes, so
+        every response is a flat, bounded list.
 
         Args:
             start_id: Starting node ID
             k: Number of hops
-            edge_types: Edge types to follow (None = all)
+            edge_types: Edge field names to follow (None = all)
+            max_fanout: Maximum new nodes per level (default: options["k_hop_max_fanout"] or 1000)
 
-        Returns:
-            Graph traversal results
+        Yields:
+            {"depth": int, "nodes": [{"uid": str, "id": str | None}]} per level, starting at depth 0
         """
         if not self.client:
             raise StorageError("Not connected to Dgraph")
@@ -28,43 +39,75 @@ class DgraphGraphMixin:
         if k <= 0:
             raise ValueError("k must be positive")
 
-        # Build recursive query
-        depth_queries = []
-        for i in range(1, k + 1):
-            if edge_types:
-                edges = " ".join([f"{self.collection_name}.{edge}" for edge in edge_types])
-                depth_queries.append(f"@recurse(depth: {i}, loop: false)")
-            else:
-                depth_queries.append(f"@recurse(depth: {i}, loop: false)")
-
-        query = f"""
-        {{
-            start(func: eq({self.collection_name}.id, "{start_id}")) @filter(type({self.collection_name})) {{
-                uid
-                {self.collection_name}.id
-                expand(_all_) {depth_queries[-1] if depth_queries else ""} {{
-                    uid
-                    {self.collection_name}.id
-                    expand(_all_)
-                }}
-            }}
-        }}
-        """
+        max_fanout = max_fanout or int(self.metadata.options.get("k_hop_max_fanout", 1000))
+        id_predicate = f"{self.collection_name}.id"
 
         try:
+            edge_predicates = await asyncio.to_thread(self._edge_predicates, edge_types)
             txn = self.client.txn(read_only=True)
-            response = txn.query(query)
-            data = json.loads(response.json)
 
-            if data.get("start") and len(data["start"]) > 0:
-                return {"start_node": start_id, "hops": k, "traversal": data["start"][0]}
+            query = f"""
+            {{
+                level(func: eq({id_predicate}, {json.dumps(start_id)})) @filter(type({self.collection_name})) {{
+                    uid
+                    {id_predicate}
+                }}
+            }}
+            """
+            response = await asyncio.to_thread(txn.query, query)
+            level = json.loads(response.json).get("level", [])[:1]
+            if not level:
+                return
+
+            visited = {level[0]["uid"]}
+            frontier = [level[0]["uid"]]
+            yield {"depth": 0, "nodes": [{"uid": level[0]["uid"], "id": level[0].get(id_predicate)}]}
+
+            if not edge_predicates:
+                return
+
+            for depth in range(1, k + 1):
+                edge_vars = [f"e{i}" for i in range(len(edge_predicates))]
+                edge_blocks = "\n".join(f"{var} as {predicate}" for var, predicate in zip(edge_vars, edge_predicates, strict=True))
+                query = f"""
+                {{
+                    var(func: uid({", ".join(frontier)})) {{
+                        {edge_blocks}
+                    }}
+                    level(func: uid({", ".join(edge_vars)}), first: {max_fanout}) @filter(NOT uid({", ".join(visited)})) {{
+                        uid
+                        {id_predicate}
+                    }}
+                }}
+                """
+                response = await asyncio.to_thread(txn.query, query)
+                level = json.loads(response.json).get("level", [])
+                if not level:
+                    return
 
-            return {"start_node": start_id, "hops": k, "traversal": {}}
+                frontier = [node["uid"] for node in level]
+                visited.update(frontier)
+                yield {"depth": depth, "nodes": [{"uid": node["uid"], "id": node.get(id_predicate)} for node in level]}
 
         except Exception as e:
             logger.error(f"Failed to execute k-hop query: {e}")
             raise StorageError(f"Failed to execute k-hop query: {e}") from e
 
+    async def k_hop_query(self, start_id: str, k: int, edge_types: list[str] | None = None, max_fanout: int | None = None) -> dict[str, Any]:
+        """Execute k-hop traversal from a starting node.
+
+        Args:
+            start_id: Starting node ID
+            k: Number of hops
+            edge_types: Edge types to follow (None = all)
+            max_fanout: Maximum new nodes per level
+
+        Returns:
+            Start node, hop count and the nodes reached at each depth
+        """
+        levels = [level["nodes"] async for level in self.iter_k_hop(start_id, k, edge_types, max_fanout)]
+        return {"start_node": start_id, "hops": k, "levels": levels}
+
     async def shortest_path(self, start_id: str, end_id: str, max_depth: int = 10) -> list[str]:
         """Find shortest path between two nodes.
 
@@ -95,7 +138,7 @@ class DgraphGraphMixin:
 
         try:
             txn = self.client.txn(read_only=True)
-            response = txn.query(query)
+            response = await asyncio.to_thread(txn.query, query)
             data = json.loads(response.json)
 
             path = []
@@ -110,164 +153,300 @@ class DgraphGraphMixin:
             logger.error(f"Failed to find shortest path: {e}")
             raise StorageError(f"Failed to find shortest path: {e}") from e
 
-    async def find_connected_components(self, node_type: str | None = None) -> list[list[str]]:
-        """Find all connected components in the graph.
+    def _edge_predicates(self, edge_types: list[str] | None = None, node_type: str | None = None) -> list[str]:
+        """Resolve the edge predicates of a type.
+
+        Uses ``edge_types`` when given, then Meta.options["edge_predicates"],
+        and otherwise the uid predicates declared in the Dgraph schema.
 
         Args:
-            node_type: Filter by node type (None = all types)
+            edge_types: Edge field names (without type prefix)
+            node_type: Dgraph type (defaults to the model type)
 
         Returns:
-            List of components, each component is a list of node IDs
+            Prefixed predicate names
         """
-        if not self.client:
-            raise StorageError("Not connected to Dgraph")
+        prefix = node_type or self.collection_name
+        edge_types = edge_types or self.metadata.options.get("edge_predicates")
+        if edge_types:
+            return [f"{prefix}.{edge}" for edge in edge_types]
+
+        txn = self.client.txn(read_only=True)
+        response = txn.query("schema {type}")
+        data = json.loads(response.json)
+        return sorted(item["predicate"] for item in data.get("schema", []) if item.get("type") == "uid" and item.get("predicate", "").startswith(f"{prefix}."))
+
+    def _export_edges(
+        self, node_type: str, edge_predicates: list[str], since: datetime | None = None
+    ) -> tuple[list[tuple[str, str | None]], list[tuple[str, str]]]:
+        """Page nodes and their outgoing edges out of Dgraph.
+
+        Nodes are paged by uid with ``first``/``after`` so no single response
+        holds the whole graph; only uids are selected on edge targets.
+
+        Args:
+            node_type: Dgraph type to export
+            edge_predicates: Prefixed edge predicates to follow
+            since: Only export nodes updated at or after this time
+
+        Returns:
+            (uid, model ID) pairs and (source uid, target uid) pairs
+        """
+        page_size = int(self.metadata.options.get("graph_export_page_size", 10000))
+        edge_selection = "\n".join(f"{predicate} {{ uid }}" for predicate in edge_predicates)
+        node_filter = f"type({node_type})"
+        if since is not None:
+            node_filter += f" AND ge({node_type}.updated_at, {json.dumps(since.isoformat())})"
+
+        nodes: list[tuple[str, str | None]] = []
+        edges: list[tuple[str, str]] = []
+        after = ""
 
-        # Get all nodes
-        if node_type:
+        while True:
             query = f"""
             {{
-                nodes(func: type({node_type})) {{
+                nodes(func: type({node_type}), first: {page_size}{after}) @filter({node_filter}) {{
                     uid
                     {node_type}.id
-                    expand(_all_)
-                }}
-            }}
-            """
-        else:
-            query = f"""
-            {{
-                nodes(func: type({self.collection_name})) {{
-                    uid
-                    {self.collection_name}.id
-                    expand(_all_)
+                    {edge_selection}
                 }}
             }}
             """
+            txn = self.client.txn(read_only=True, best_effort=True)
+            response = txn.query(query)
+            page = json.loads(response.json).get("nodes", [])
+
+            for node in page:
+                uid = node["uid"]
+                nodes.append((uid, node.get(f"{node_type}.id")))
+                for predicate in edge_predicates:
+                    targets = node.get(predicate) or []
+                    if isinstance(targets, dict):
+                        targets = [targets]
+                    edges.extend((uid, target["uid"]) for target in targets if "uid" in target)
+
+            if len(page) < page_size:
+                return nodes, edges
+            after = f", after: {page[-1]['uid']}"
+
+    async def get_graph_snapshot(
+        self, node_type: str | None = None, edge_types: list[str] | None = None, refresh: bool = False, max_age: float | None = None
+    ) -> CSRGraph:
+        """Get the cached CSR snapshot of the graph, building it on first use.
+
+        With ``refresh`` only nodes updated since the snapshot was built are
+        re-exported and their outgoing edges replaced. Deletions are picked up
+        by a full rebuild once the snapshot is older than ``max_age`` seconds.
 
+        Args:
+            node_type: Dgraph type to snapshot (defaults to the model type)
+            edge_types: Edge field names to include (None = all uid predicates)
+            refresh: Apply changes made since the snapshot was built
+            max_age: Rebuild the snapshot when older than this many seconds
+
+        Returns:
+            Graph snapshot
+        """
+        if not self.client:
+            raise StorageError("Not connected to Dgraph")
+
+        node_type = node_type or self.collection_name
         try:
-            txn = self.client.txn(read_only=True)
-            response = txn.query(query)
-            data = json.loads(response.json)
+            edge_predicates = await asyncio.to_thread(self._edge_predicates, edge_types, node_type)
+            key = (node_type, tuple(edge_predicates))
+            snapshot = self._graph_snapshots.get(key)
+
+            if snapshot is not None and max_age is not None and time.time() - snapshot.built_at > max_age:
+                snapshot = None
+
+            # Stamp snapshots with the export start so concurrent writes are re-read on refresh
+            started = time.time()
+            if snapshot is None:
+                nodes, edges = await asyncio.to_thread(self._export_edges, node_type, edge_predicates)
+                snapshot = CSRGraph.from_edge_list(nodes, edges, key[1])
+                snapshot.built_at = started
+                logger.debug(f"Built graph snapshot for {node_type}: {snapshot.num_nodes} nodes, {snapshot.num_edges} edges")
+            elif refresh:
+                since = datetime.fromtimestamp(snapshot.built_at, tz=UTC)
+                nodes, edges = await asyncio.to_thread(self._export_edges, node_type, edge_predicates, since=since)
+                if nodes:
+                    snapshot = snapshot.with_updates(nodes, edges)
+                snapshot.built_at = started
+
+            self._graph_snapshots[key] = snapshot
+            return snapshot
 
-            if not data.get("nodes"):
-                return []
+        except Exception as e:
+            logger.error(f"Failed to build graph snapshot: {e}")
+            raise StorageError(f"Failed to build graph snapshot: {e}") from e
 
-            # Build adjacency list
-            adjacency = {}
-            node_ids = {}
+    async def find_connected_components(self, node_type: str | None = None, edge_types: list[str] | None = None) -> list[list[str]]:
+        """Find all connected components in the graph.
 
-            for node in data["nodes"]:
-                uid = node.get("uid")
-                node_id = node.get(f"{self.collection_name}.id") or node.get(f"{node_type}.id") if node_type else None
+        Args:
+            node_type: Filter by node type (None = model type)
+            edge_types: Edge field names to follow (None = all)
 
-                if uid and node_id:
-                    node_ids[uid] = node_id
-                    adjacency[uid] = []
+        Returns:
+            List of components, each component is a list of node IDs
+        """
+        snapshot = await self.get_graph_snapshot(node_type, edge_types)
+        return snapshot.components_by_label()
 
-                    # Find connections
-                    for key, value in node.items():
-                        if isinstance(value, list):
-                            for item in value:
-                                if isinstance(item, dict) and "uid" in item:
-                                    adjacency[uid].append(item["uid"])
-                        elif isinstance(value, dict) and "uid" in value:
-                            adjacency[uid].append(value["uid"])
+    async def get_degrees(self, node_type: str | None = None, edge_types: list[str] | None = None) -> dict[str, dict[str, int]]:
+        """Get in/out degree of every node from the graph snapshot.
 
-            # Find connected components using DFS
-            visited = set()
-            components = []
+        Args:
+            node_type: Node type (None = model type)
+            edge_types: Edge field names to count (None = all)
 
-            def dfs(uid: str, component: list[str]) -> None:
-                if uid in visited or uid not in node_ids:
-                    return
-                visited.add(uid)
-                component.append(node_ids[uid])
-                for neighbor in adjacency.get(uid, []):
-                    dfs(neighbor, component)
+        Returns:
+            Mapping of node ID to degree information
+        """
+        snapshot = await self.get_graph_snapshot(node_type, edge_types)
+        in_degree = snapshot.in_degree()
+        out_degree = snapshot.out_degree()
+        return {
+            label: {"in": int(in_degree[i]), "out": int(out_degree[i]), "total": int(in_degree[i] + out_degree[i])} for label, i in snapshot.label_index.items()
+        }
+
+    async def get_pagerank(
+        self, node_type: str | None = None, edge_types: list[str] | None = None, damping: float = 0.85, max_iter: int = 100
+    ) -> dict[str, float]:
+        """Compute PageRank over the graph snapshot.
 
-            for uid in node_ids:
-                if uid not in visited:
-                    component = []
-                    dfs(uid, component)
-                    if component:
-                        components.append(component)
+        Args:
+            node_type: Node type (None = model type)
+            edge_types: Edge field names to follow (None = all)
+            damping: Damping factor
+            max_iter: Maximum power iterations
 
-            return components
+        Returns:
+            Mapping of node ID to rank
+        """
+        snapshot = await self.get_graph_snapshot(node_type, edge_types)
+        return snapshot.by_label(snapshot.pagerank(damping=damping, max_iter=max_iter))
 
-        except Exception as e:
-            logger.error(f"Failed to find connected components: {e}")
-            raise StorageError(f"Failed to find connected components: {e}") from e
+    async def get_bfs_distances(
+        self, start_id: str, max_depth: int | None = None, directed: bool = True, node_type: str | None = None, edge_types: list[str] | None = None
+    ) -> dict[str, int]:
+        """Get hop distances from a node over the graph snapshot.
 
-    async def get_node_degree(self, node_id: str, direction: str = "all") -> dict[str, int]:
-        """Get degree of a node (in/out/all).
+        Args:
+            start_id: Starting node ID
+            max_depth: Maximum number of hops (None = unlimited)
+            directed: Follow edges only in their direction
+            node_type: Node type (None = model type)
+            edge_types: Edge field names to follow (None = all)
+
+        Returns:
+            Mapping of reachable node ID to distance
+        """
+        snapshot = await self.get_graph_snapshot(node_type, edge_types)
+        if start_id not in snapshot.label_index:
+            return {}
+
+        distances = snapshot.bfs(snapshot.label_index[start_id], max_depth=max_depth, directed=directed)
+        return {label: distance for label, distance in snapshot.by_label(distances).items() if distance >= 0}
+
+    def _reverse_predicates(self, predicates: list[str]) -> set[str]:
+        """Get the predicates among ``predicates`` that have a @reverse index.
 
         Args:
-            node_id: Node ID
-            direction: 'in', 'out', or 'all'
+            predicates: Prefixed predicate names
 
         Returns:
-            Dictionary with degree information
+            Predicates whose incoming edges can be counted with ``~``
+        """
+        if not predicates:
+            return set()
+
+        txn = self.client.txn(read_only=True)
+        response = txn.query(f"schema(pred: [{', '.join(predicates)}]) {{reverse}}")
+        data = json.loads(response.json)
+        return {item["predicate"] for item in data.get("schema", []) if item.get("reverse")}
+
+    async def get_node_degrees(self, node_ids: list[str], edge_types: list[str] | None = None, incoming: bool = True) -> dict[str, dict[str, int]]:
+        """Get in/out degree of many nodes in a single aggregate query.
+
+        Degrees are computed by Dgraph with ``count(pred)`` and ``count(~pred)``
+        over the model's edge predicates, so no neighbour uids are transferred.
+        ``~pred`` needs a @reverse index, which the schema declares for
+        Meta.options["edge_predicates"]; in-degrees over other predicates are
+        refused rather than computed from a full edge export.
+
+        Args:
+            node_ids: Node IDs
+            edge_types: Edge field names to count (None = all)
+            incoming: Also count incoming edges (False leaves "in" at zero)
+
+        Returns:
+            Mapping of node ID to degree information (zero for unknown IDs)
+
+        Raises:
+            StorageError: Incoming edges were requested for a predicate without @reverse
         """
         if not self.client:
             raise StorageError("Not connected to Dgraph")
 
-        query = f"""
-        {{
-            node(func: eq({self.collection_name}.id, "{node_id}")) @filter(type({self.collection_name})) {{
-                uid
-                {self.collection_name}.id
-                ~has.edge @facets {{
-                    count(uid)
-                }}
-                has.edge @facets {{
-                    count(uid)
-                }}
-                expand(_all_) {{
-                    uid
-                }}
-            }}
-        }}
-        """
+        degrees = {node_id: {"in": 0, "out": 0, "total": 0} for node_id in node_ids}
+        if not node_ids:
+            return degrees
 
         try:
+            edge_predicates = await asyncio.to_thread(self._edge_predicates, edge_types)
+            if not edge_predicates:
+                return degrees
+            reverse_predicates = await asyncio.to_thread(self._reverse_predicates, edge_predicates) if incoming else set()
+            forward_only = [predicate for predicate in edge_predicates if predicate not in reverse_predicates]
+            if incoming and forward_only:
+                raise StorageError(f"In-degree needs a @reverse index on {', '.join(forward_only)}; declare them in Meta.options['edge_predicates']")
+
+            out_aliases = [f"out{i}" for i in range(len(edge_predicates))]
+            in_aliases = [f"in{i}" for i, predicate in enumerate(edge_predicates) if predicate in reverse_predicates]
+            counts = [f"out{i}: count({predicate})" for i, predicate in enumerate(edge_predicates)]
+            counts += [f"in{i}: count(~{predicate})" for i, predicate in enumerate(edge_predicates) if predicate in reverse_predicates]
+            count_block = "\n".join(counts)
+
+            query = f"""
+            {{
+                nodes(func: {self._id_func(node_ids)}) @filter(type({self.collection_name})) {{
+                    {self.collection_name}.id
+                    {count_block}
+                }}
+            }}
+            """
             txn = self.client.txn(read_only=True)
-            response = txn.query(query)
+            response = await asyncio.to_thread(txn.query, query)
             data = json.loads(response.json)
 
-            if not data.get("node") or len(data["node"]) == 0:
-                return {"in": 0, "out": 0, "total": 0}
+            for node in data.get("nodes", []):
+                in_degree = sum(node.get(alias, 0) for alias in in_aliases)
+                out_degree = sum(node.get(alias, 0) for alias in out_aliases)
+                degrees[node[f"{self.collection_name}.id"]] = {"in": in_degree, "out": out_degree, "total": in_degree + out_degree}
 
-            node = data["node"][0]
+            return degrees
 
-            # Count edges
-            in_degree = 0
-            out_degree = 0
-
-            # Count incoming edges (reverse edges)
-            for key, value in node.items():
-                if key.startswith("~"):
-                    if isinstance(value, list):
-                        in_degree += len(value)
-                    elif isinstance(value, dict):
-                        in_degree += 1
+        except Exception as e:
+            logger.error(f"Failed to get node degrees: {e}")
+            raise StorageError(f"Failed to get node degrees: {e}") from e
 
-            # Count outgoing edges
-            for key, value in node.items():
-                if not key.startswith("~") and key not in ["uid", f"{self.collection_name}.id", "dgraph.type"]:
-                    if isinstance(value, list):
-                        out_degree += len([v for v in value if isinstance(v, dict) and "uid" in v])
-                    elif isinstance(value, dict) and "uid" in value:
-                        out_degree += 1
+    async def get_node_degree(self, node_id: str, direction: str = "all", edge_types: list[str] | None = None) -> dict[str, int]:
+        """Get degree of a node (in/out/all).
 
-            result = {"in": in_degree, "out": out_degree, "total": in_degree + out_degree}
+        Args:
+            node_id: Node ID
+            direction: 'in', 'out', or 'all'
+            edge_types: Edge field names to count (None = all)
 
-            if direction == "in":
-                return {"in": result["in"]}
-            if direction == "out":
-                return {"out": result["out"]}
+        Returns:
+            Dictionary with degree information
+        """
+        result = (await self.get_node_degrees([node_id], edge_types, incoming=direction != "out"))[node_id]
 
-            return result
+        if direction == "in":
+            return {"in": result["in"]}
+        if direction == "out":
+            return {"out": result["out"]}
 
-        except Exception as e:
-            logger.error(f"Failed to get node degree: {e}")
-            raise StorageError(f"Failed to get node degree: {e}") from e
+        return result
@@ -1,5 +1,6 @@
 """Dgraph READ operations."""
 
+import asyncio
 import json
 from typing import Any
 
@@ -7,16 +8,22 @@ from loguru import logger
 
 from ...exceptions import StorageError
 from ...storage_model import StorageModel
+from ...storage_types import ReadConsistency
 
 
 class DgraphReadMixin:
     """Mixin for Dgraph READ operations."""
 
-    async def find_by_id(self, item_id: str) -> StorageModel | None:
+    async def find_by_id(
+        self, item_id: str, fields: list[str] | None = None, expand_edges: bool = False, consistency: ReadConsistency | str | None = None
+    ) -> StorageModel | None:
         """Find item by ID in Dgraph.
 
         Args:
             item_id: Item ID to find
+            fields: Model fields to fetch (None = all model fields)
+            expand_edges: Also expand outgoing edges one level deep
+            consistency: Read consistency (defaults to Meta.options["read_consistency"])
 
         Returns:
             Model instance or None if not found
@@ -27,23 +34,19 @@ class DgraphReadMixin:
         # Query by ID with type filter
         query = f"""
         {{
-            item(func: eq({self.collection_name}.id, "{item_id}")) @filter(type({self.collection_name})) {{
-                uid
-                expand(_all_) {{
-                    uid
-                    expand(_all_)
-                }}
+            item(func: {self._id_func(item_id)}) @filter(type({self.collection_name})) {{
+                {self._build_projection(fields, expand_edges)}
             }}
         }}
         """
 
         try:
-            txn = self.client.txn(read_only=True)
-            response = txn.query(query)
+            txn = self._read_txn(consistency)
+            response = await asyncio.to_thread(txn.query, query)
             data = json.loads(response.json)
 
             if data.get("item") and len(data["item"]) > 0:
-                return self._from_dgraph_format(data["item"][0])
+                return self._from_dgraph_format(data["item"][0], partial=fields is not None)
 
             return None
 
@@ -51,11 +54,57 @@ class DgraphReadMixin:
             logger.error(f"Failed to find item by ID: {e}")
             raise StorageError(f"Failed to find item by ID: {e}") from e
 
-    async def find_one(self, query: dict[str, Any]) -> StorageModel | None:
+    async def find_by_ids(
+        self, item_ids: list[str], fields: list[str] | None = None, consistency: ReadConsistency | str | None = None
+    ) -> dict[str, StorageModel]:
+        """Find many items by ID with one ``eq`` list query per chunk.
+
+        Args:
+            item_ids: Item IDs to find
+            fields: Model fields to fetch (None = all model fields)
+            consistency: Read consistency (defaults to Meta.options["read_consistency"])
+
+        Returns:
+            Found model instances keyed by ID
+        """
+        if not self.client:
+            raise StorageError("Not connected to Dgraph")
+
+        found: dict[str, StorageModel] = {}
+        try:
+            for chunk in self._chunks(list(dict.fromkeys(item_ids))):
+                query = f"""
+                {{
+                    items(func: {self._id_func(chunk)}) @filter(type({self.collection_name})) {{
+                        {self._build_projection(fields)}
+                    }}
+                }}
+                """
+                txn = self._read_txn(consistency)
+                response = await asyncio.to_thread(txn.query, query)
+                data = json.loads(response.json)
+
+                for item in data.get("items", []):
+                    instance = self._from_dgraph_format(item, partial=fields is not None)
+                    if instance is not None:
+                        found[instance.id] = instance
+
+            return found
+
+        except Exception as e:
+            logger.error(f"Failed to find items by ID: {e}")
+            raise StorageError(f"Failed to find items by ID: {e}") from e
+
+    async def find_one(
+        self, query: dict[str, Any], fields: list[str] | None = None, expand_edges: bool = False, consistency: ReadConsistency | str | None = None
+    ) -> StorageModel | None:
         """Find single item matching query.
 
         Args:
             query: Query parameters
+            fields: Model fields to fetch (None = all model fields)
+            expand_edges: Also expand outgoing edges one level deep
+            consistency: Read consistency (defaults to Meta.options["read_consistency"])
 
         Returns:
             Model instance or None if not found
@@ -64,15 +113,15 @@ class DgraphReadMixin:
             raise StorageError("Not connected to Dgraph")
 
         # Build DQL query
-        dql = self._build_dql_query(query, limit=1)
+        dql = self._build_dql_query(query, limit=1, fields=fields, expand_edges=expand_edges)
 
         try:
-            txn = self.client.txn(read_only=True)
-            response = txn.query(dql)
+            txn = self._read_txn(consistency)
+            response = await asyncio.to_thread(txn.query, dql)
             data = json.loads(response.json)
 
             if data.get("items") and len(data["items"]) > 0:
-                return self._from_dgraph_format(data["items"][0])
+                return self._from_dgraph_format(data["items"][0], partial=fields is not None)
 
             return None
 
@@ -80,13 +129,24 @@ class DgraphReadMixin:
             logger.error(f"Failed to find item: {e}")
             raise StorageError(f"Failed to find item: {e}") from e
 
-    async def find(self, query: dict[str, Any], limit: int | None = None, skip: int = 0) -> list[StorageModel]:
+    async def find(
+        self,
+        query: dict[str, Any],
+        limit: int | None = None,
+        skip: int = 0,
+        fields: list[str] | None = None,
+        expand_edges: bool = False,
+        consistency: ReadConsistency | str | None = None,
+    ) -> list[StorageModel]:
         """Find items matching query.
 
         Args:
             query: Query parameters
             limit: Maximum number of results
             skip: Number of results to skip
+            fields: Model fields to fetch (None = all model fields)
+            expand_edges: Also expand outgoing edges one level deep
+            consistency: Read consistency (defaults to Meta.options["read_consistency"])
 
         Returns:
             List of model instances
@@ -95,17 +155,17 @@ class DgraphReadMixin:
             raise StorageError("Not connected to Dgraph")
 
         # Build DQL query
-        dql = self._build_dql_query(query, limit=limit, offset=skip)
+        dql = self._build_dql_query(query, limit=limit, offset=skip, fields=fields, expand_edges=expand_edges)
 
         try:
-            txn = self.client.txn(read_only=True)
-            response = txn.query(dql)
+            txn = self._read_txn(consistency)
+            response = await asyncio.to_thread(txn.query, dql)
             data = json.loads(response.json)
 
             results = []
             if data.get("items"):
                 for item in data["items"]:
-                    model = self._from_dgraph_format(item)
+                    model = self._from_dgraph_format(item, partial=fields is not None)
                     if model:
                         results.append(model)
 
@@ -115,11 +175,12 @@ class DgraphReadMixin:
             logger.error(f"Failed to find items: {e}")
             raise StorageError(f"Failed to find items: {e}") from e
 
-    async def count(self, query: dict[str, Any]) -> int:
+    async def count(self, query: dict[str, Any], consistency: ReadConsistency | str | None = None) -> int:
         """Count items matching query.
 
         Args:
             query: Query parameters
+            consistency: Read consistency (defaults to Meta.options["read_consistency"])
 
         Returns:
             Number of matching items
@@ -131,8 +192,8 @@ class DgraphReadMixin:
         dql = self._build_count_query(query)
 
         try:
-            txn = self.client.txn(read_only=True)
-            response = txn.query(dql)
+            txn = self._read_txn(consistency)
+            response = await asyncio.to_thread(txn.query, dql)
             data = json.loads(response.json)
 
             if data.get("count") and len(data["count"]) > 0:
@@ -165,8 +226,8 @@ class DgraphReadMixin:
         """
 
         try:
-            txn = self.client.txn(read_only=True)
-            response = txn.query(query)
+            txn = self._read_txn()
+            response = await asyncio.to_thread(txn.query, query)
             data = json.loads(response.json)
 
             return bool(data.get("exists") and len(data["exists"]) > 0)
@@ -190,7 +251,7 @@ class DgraphReadMixin:
 
         try:
             txn = self.client.txn(read_only=True)
-            response = txn.query(query, variables=params)
+            response = await asyncio.to_thread(txn.query, query, variables=params)
             data = json.loads(response.json)
 
             # Return the first key's data (DQL queries return data under custom keys)
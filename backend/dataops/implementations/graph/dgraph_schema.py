@@ -1,22 +1,38 @@
 """Dgraph schema and metadata operations."""
 
+import asyncio
+import hashlib
 import json
-from typing import Any
+from typing import Any, ClassVar
 
 import pydgraph
 from loguru import logger
 
 from ...exceptions import StorageError
 
+# Meta type recording the fingerprint of the schema applied for each model type
+SCHEMA_META_TYPE = "dataops_schema"
+SCHEMA_META_SCHEMA = f"""{SCHEMA_META_TYPE}.type: string @index(exact) .
+{SCHEMA_META_TYPE}.fingerprint: string .
+
+type {SCHEMA_META_TYPE} {{
+  {SCHEMA_META_TYPE}.type
+  {SCHEMA_META_TYPE}.fingerprint
+}}"""
+
 
 class DgraphSchemaMixin:
     """Mixin for Dgraph schema and metadata operations."""
 
-    def _ensure_schema(self) -> None:
-        """Ensure Dgraph schema is set up for the model."""
-        if not self.client:
-            raise StorageError("Not connected to Dgraph")
+    # (address, type, fingerprint) schemas applied or verified by this process
+    _applied_schemas: ClassVar[set[tuple[str, str, str]]] = set()
+
+    def _build_schema(self) -> str:
+        """Build the Dgraph schema for the model.
 
+        Returns:
+            Predicate definitions followed by the type definition
+        """
         # Build schema from model fields
         schema_parts = []
 
@@ -59,21 +75,103 @@ class DgraphSchemaMixin:
             # Add to type definition
             type_def += f"\n  {self.collection_name}.{field_name}"
 
+        # Declared edges get a reverse index so incoming edges can be counted and followed with ~
+        for edge in self.metadata.options.get("edge_predicates", []):
+            if edge not in self.model_cls.model_fields:
+                schema_parts.append(f"{self.collection_name}.{edge}: [uid] @reverse .")
+                type_def += f"\n  {self.collection_name}.{edge}"
+
         type_def += "\n}"
 
         # Combine schema
-        schema = "\n".join(schema_parts) + "\n\n" + type_def
+        return "\n".join(schema_parts) + "\n\n" + type_def
+
+    def _ensure_schema(self) -> None:
+        """Ensure Dgraph schema is set up for the model.
+
+        The schema is only altered when its fingerprint differs from the one
+        recorded in Dgraph, so repeated connects do not re-send it.
+        """
+        if not self.client:
+            raise StorageError("Not connected to Dgraph")
+
+        schema = self._build_schema()
+        fingerprint = hashlib.sha256(schema.encode("utf-8")).hexdigest()
+        cache_key = (f"{self.config.host}:{self.config.port}" if self.config else "", self.collection_name, fingerprint)
+
+        # Already applied or verified by this process
+        if cache_key in self._applied_schemas:
+            return
+
+        if self._get_schema_fingerprint() == fingerprint:
+            self._applied_schemas.add(cache_key)
+            logger.debug(f"Schema for {self.collection_name} is up to date")
+            return
 
         try:
-            # Apply schema
-            operation = pydgraph.Operation(schema=schema)
+            # Apply schema together with the fingerprint bookkeeping predicates
+            operation = pydgraph.Operation(schema=schema + "\n\n" + SCHEMA_META_SCHEMA)
             self.client.alter(operation)
+            self._set_schema_fingerprint(fingerprint)
+            self._applied_schemas.add(cache_key)
             logger.info(f"Schema applied for {self.collection_name}")
 
         except Exception as e:
             logger.error(f"Failed to apply schema: {e}")
             # Continue anyway - schema might already exist
 
+    def _get_schema_fingerprint(self) -> str | None:
+        """Get the schema fingerprint recorded in Dgraph for this type.
+
+        Returns:
+            Stored fingerprint, or None if missing or not yet queryable
+        """
+        query = f"""
+        {{
+            meta(func: eq({SCHEMA_META_TYPE}.type, {json.dumps(self.collection_name)})) {{
+                {SCHEMA_META_TYPE}.fingerprint
+            }}
+        }}
+        """
+
+        try:
+            txn = self.client.txn(read_only=True)
+            response = txn.query(query)
+            data = json.loads(response.json)
+        except Exception as e:
+            # Fingerprint predicates are not indexed until the first alter
+            logger.debug(f"No schema fingerprint for {self.collection_name}: {e}")
+            return None
+
+        if data.get("meta"):
+            return data["meta"][0].get(f"{SCHEMA_META_TYPE}.fingerprint")
+        return None
+
+    def _set_schema_fingerprint(self, fingerprint: str) -> None:
+        """Record the applied schema fingerprint in Dgraph.
+
+        Args:
+            fingerprint: Hash of the applied schema
+        """
+        query = f"""
+        {{
+            m as var(func: eq({SCHEMA_META_TYPE}.type, {json.dumps(self.collection_name)}))
+        }}
+        """
+        meta = {
+            "uid": "uid(m)",
+            "dgraph.type": SCHEMA_META_TYPE,
+            f"{SCHEMA_META_TYPE}.type": self.collection_name,
+            f"{SCHEMA_META_TYPE}.fingerprint": fingerprint,
+        }
+
+        txn = self.client.txn()
+        try:
+            request = txn.create_request(query=query, mutations=[txn.create_mutation(set_obj=meta)], commit_now=True)
+            txn.do_request(request)
+        finally:
+            txn.discard()
+
     async def list_databases(self) -> list[str]:
         """List available databases (namespaces in Dgraph).
 
@@ -106,7 +204,7 @@ class DgraphSchemaMixin:
 
         try:
             txn = self.client.txn(read_only=True)
-            response = txn.query(query)
+            response = await asyncio.to_thread(txn.query, query)
             data = json.loads(response.json)
 
             type_set = set()
@@ -149,7 +247,7 @@ class DgraphSchemaMixin:
         """
 
         try:
-            response = self.client.query(query)
+            response = await asyncio.to_thread(self.client.query, query)
             schema_info = json.loads(response.json)
 
             return {
@@ -223,7 +321,7 @@ class DgraphSchemaMixin:
             # Simple query to test connection
             query = "{ test(func: has(dgraph.type), first: 1) { uid } }"
             txn = self.client.txn(read_only=True)
-            txn.query(query)
+            await asyncio.to_thread(txn.query, query)
             return True
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
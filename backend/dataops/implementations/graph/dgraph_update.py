@@ -1,5 +1,6 @@
 """Dgraph UPDATE operations."""
 
+import asyncio
 import json
 from typing import Any
 
@@ -24,46 +25,29 @@ class DgraphUpdateMixin:
         if not self.client:
             raise StorageError("Not connected to Dgraph")
 
-        # First, find the item to get its UID
+        # Resolve the UID and apply the mutation in a single upsert block
         query = f"""
         {{
-            item(func: eq({self.collection_name}.id, "{item_id}")) @filter(type({self.collection_name})) {{
-                uid
+            item(func: {self._id_func(item_id)}) @filter(type({self.collection_name})) {{
+                v as uid
             }}
         }}
         """
 
+        update_data = self._to_dgraph_update(data)
+
         txn = self.client.txn()
         try:
-            response = txn.query(query)
-            result = json.loads(response.json)
-
-            if not result.get("item") or len(result["item"]) == 0:
-                return False
-
-            uid = result["item"][0]["uid"]
-
-            # Prepare update data
-            update_data = {"uid": uid}
-
-            # Add prefixed fields
-            for key, value in data.items():
-                if key not in ["id", "uid", "dgraph.type"]:  # Don't update these
-                    # Handle JSON fields
-                    if isinstance(value, (dict, list)):
-                        value = json.dumps(value)
-                    update_data[f"{self.collection_name}.{key}"] = value
-
-            # Create mutation
-            mutation = json.dumps(update_data)
-
-            # Execute mutation
-            txn.mutate(set_json=mutation)
+            mutations = []
+            if update_data:
+                mutations.append(txn.create_mutation(set_obj={"uid": "uid(v)", **update_data}, cond="@if(gt(len(v), 0))"))
 
-            # Commit transaction
-            txn.commit()
+            # Execute upsert and commit in the same round trip
+            request = txn.create_request(query=query, mutations=mutations, commit_now=True)
+            response = await asyncio.to_thread(txn.do_request, request)
+            result = json.loads(response.json)
 
-            return True
+            return bool(result.get("item"))
 
         except Exception as e:
             txn.discard()
@@ -72,11 +56,16 @@ class DgraphUpdateMixin:
         finally:
             txn.discard()
 
-    async def bulk_update(self, updates: list[dict[str, Any]]) -> int:
+    async def bulk_update(self, updates: list[dict[str, Any]], chunk_size: int | None = None, atomic: bool = False) -> int:
         """Update multiple items in Dgraph.
 
+        Each chunk is a single upsert block: the UID lookups and every
+        change go to Dgraph in one request.
+
         Args:
             updates: List of update dicts with 'id' and fields to update
+            chunk_size: Items per chunk (defaults to options["bulk_chunk_size"])
+            atomic: Commit the whole batch in one transaction instead of per chunk
 
         Returns:
             Number of items updated
@@ -84,18 +73,71 @@ class DgraphUpdateMixin:
         if not self.client:
             raise StorageError("Not connected to Dgraph")
 
+        updates = [update for update in updates if update.get("id")]
         if not updates:
             return 0
 
         updated_count = 0
-        for update in updates:
-            item_id = update.get("id")
-            if item_id:
-                data = {k: v for k, v in update.items() if k != "id"}
-                if await self.update(item_id, data):
-                    updated_count += 1
+        batch_txn = self.client.txn() if atomic else None
+        try:
+            for chunk in self._chunks(updates, chunk_size):
+                txn = batch_txn or self.client.txn()
+                try:
+                    updated_count += await asyncio.to_thread(self._bulk_update_chunk, txn, chunk, commit_now=not atomic)
+                finally:
+                    if not atomic:
+                        txn.discard()
+
+            if batch_txn:
+                await asyncio.to_thread(batch_txn.commit)
+
+            return updated_count
+
+        except Exception as e:
+            logger.error(f"Failed to bulk update items after {updated_count} updates: {e}")
+            raise StorageError(f"Failed to bulk update items: {e}") from e
+        finally:
+            if batch_txn:
+                batch_txn.discard()
+
+    def _bulk_update_chunk(self, txn: Any, chunk: list[dict[str, Any]], commit_now: bool) -> int:
+        """Apply a chunk of updates with one upsert block.
+
+        One ``uid(vN)`` variable per item lets every mutation run in the same
+        request as the lookup, guarded by its item being found.
+
+        Args:
+            txn: Open Dgraph transaction
+            chunk: Update dicts with 'id'
+            commit_now: Commit together with the mutations
+
+        Returns:
+            Number of items found and updated
+        """
+        blocks = []
+        mutations = []
+        for index, update in enumerate(chunk):
+            update_data = self._to_dgraph_update(update)
+            if not update_data:
+                continue
+            blocks.append(f"u{index} as var(func: {self._id_func(update['id'])}) @filter(type({self.collection_name}))")
+            mutations.append(txn.create_mutation(set_obj={"uid": f"uid(u{index})", **update_data}, cond=f"@if(gt(len(u{index}), 0))"))
+
+        block_lines = "\n            ".join(blocks)
+        query = f"""
+        {{
+            items(func: {self._id_func([update["id"] for update in chunk])}) @filter(type({self.collection_name})) {{
+                {self.collection_name}.id
+            }}
+            {block_lines}
+        }}
+        """
+
+        request = txn.create_request(query=query, mutations=mutations, commit_now=commit_now)
+        response = txn.do_request(request)
+        result = json.loads(response.json)
 
-        return updated_count
+        return len({item[f"{self.collection_name}.id"] for item in result.get("items", [])})
 
     async def raw_write_query(self, query: str, _params: dict[str, Any] | None = None) -> int:
         """Execute raw DQL write query (mutation).
@@ -114,10 +156,10 @@ class DgraphUpdateMixin:
         try:
             # In Dgraph, mutations are done via RDF or JSON
             # For raw mutations, we expect RDF format
-            response = txn.mutate(set_nquads=query)
+            response = await asyncio.to_thread(txn.mutate, set_nquads=query)
 
             # Commit transaction
-            txn.commit()
+            await asyncio.to_thread(txn.commit)
 
             # Return number of UIDs created/modified
             return len(response.uids)
@@ -1,17 +1,22 @@
 """Dgraph utility and helper methods."""
 
 import json
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from loguru import logger
 
 from ...storage_model import StorageModel
+from ...storage_types import ReadConsistency
 
 
 class DgraphUtilsMixin:
     """Mixin for Dgraph utility operations."""
 
+    # Default number of items per bulk mutation (override with options["bulk_chunk_size"])
+    DEFAULT_BULK_CHUNK_SIZE: ClassVar[int] = 1000
+
     def _get_dgraph_type(self, python_type: Any) -> str:
         """Map Python type to Dgraph type.
 
@@ -120,11 +125,12 @@ class DgraphUtilsMixin:
         # Return scalar values as-is
         return value
 
-    def _from_dgraph_format(self, data: dict[str, Any]) -> StorageModel | None:
+    def _from_dgraph_format(self, data: dict[str, Any], partial: bool = False) -> StorageModel | None:
         """Convert Dgraph format to model instance.
 
         Args:
             data: Dgraph-formatted dictionary
+            partial: Data holds a field projection; build without validation
 
         Returns:
             Model instance or None
@@ -147,19 +153,124 @@ class DgraphUtilsMixin:
                 clean_data[key] = value
 
         try:
-            return self.model_cls(**clean_data)
+            if partial:
+                # Projected results lack required fields, so skip validation
+                return self.model_cls.get_codec().construct(clean_data)
+            # Validated (the cleanup above is lossy) and change-tracked
+            return self.model_cls.get_codec().load(clean_data)
         except Exception as e:
             logger.error(f"Failed to create model instance: {e}")
             logger.debug(f"Data: {clean_data}")
             return None
 
-    def _build_dql_query(self, query: dict[str, Any], limit: int | None = None, offset: int = 0) -> str:
+    def _id_func(self, item_ids: str | list[str]) -> str:
+        """Build a DQL root function matching nodes by model ID.
+
+        Args:
+            item_ids: Single ID or list of IDs
+
+        Returns:
+            DQL ``eq`` function string with safely quoted IDs
+        """
+        return f"eq({self.collection_name}.id, {json.dumps(item_ids)})"
+
+    def _read_txn(self, consistency: ReadConsistency | str | None = None) -> Any:
+        """Create a transaction for reads at the requested consistency.
+
+        Args:
+            consistency: Consistency level (defaults to Meta.options["read_consistency"], else read-only)
+
+        Returns:
+            Dgraph transaction
+        """
+        level = ReadConsistency(consistency or self.metadata.options.get("read_consistency", ReadConsistency.READ_ONLY))
+        if level == ReadConsistency.STRONG:
+            return self.client.txn()
+        # Best-effort reads skip fetching the latest timestamp from Zero
+        return self.client.txn(read_only=True, best_effort=level == ReadConsistency.BEST_EFFORT)
+
+    def _chunks(self, items: list[Any], chunk_size: int | None = None) -> Iterator[list[Any]]:
+        """Split items into bulk operation chunks.
+
+        Args:
+            items: Items to split
+            chunk_size: Items per chunk (defaults to the configured bulk_chunk_size)
+
+        Yields:
+            Consecutive slices of items
+        """
+        options = self.config.options if self.config else {}
+        size = chunk_size or int(options.get("bulk_chunk_size", self.DEFAULT_BULK_CHUNK_SIZE))
+        for start in range(0, len(items), size):
+            yield items[start : start + size]
+
+    def _to_dgraph_update(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert a partial update dict to prefixed Dgraph predicates.
+
+        Args:
+            data: Fields to update
+
+        Returns:
+            Prefixed predicate dictionary (without uid)
+        """
+        update_data = {}
+        for key, value in data.items():
+            if key in ["id", "uid", "dgraph.type"]:  # Don't update these
+                continue
+            if isinstance(value, datetime):
+                value = value.isoformat()  # noqa: PLW2901
+            elif isinstance(value, dict | list):
+                # Store complex types as JSON strings
+                value = json.dumps(value, default=str)  # noqa: PLW2901
+            update_data[f"{self.collection_name}.{key}"] = value
+        return update_data
+
+    def _build_projection(self, fields: list[str] | None = None, expand_edges: bool = False) -> str:
+        """Build the DQL selection block for a field projection.
+
+        Selections are cached per (field set, expand_edges) on the DAO.
+
+        Args:
+            fields: Model fields to fetch (None = all model fields)
+            expand_edges: Also expand outgoing edges one level deep
+
+        Returns:
+            DQL predicate list for use inside a query block
+        """
+        key = (frozenset(fields) if fields is not None else None, expand_edges)
+        projection = self._projection_cache.get(key)
+        if projection is not None:
+            return projection
+
+        model_fields = self.model_cls.model_fields
+        if fields is None:
+            selected = list(model_fields)
+        else:
+            unknown = [field for field in fields if field not in model_fields]
+            if unknown:
+                raise ValueError(f"Unknown fields for {self.model_cls.__name__}: {unknown}")
+            # Always fetch the ID so results can be identified
+            selected = ["id"] + [field for field in model_fields if field in fields and field != "id"]
+
+        lines = ["uid"] + [f"{self.collection_name}.{field}" for field in selected]
+        if expand_edges:
+            lines.append("expand(_all_) {\n    uid\n    expand(_all_)\n}")
+
+        projection = "\n".join(lines)
+        self._projection_cache[key] = projection
+        return projection
+
+    def _build_dql_query(
+        self, query: dict[str, Any], limit: int | None = None, offset: int = 0, fields: list[str] | None = None, expand_edges: bool = False
+    ) -> str:
         """Build DQL query from dict parameters.
 
         Args:
             query: Query parameters
             limit: Result limit
             offset: Result offset
+            fields: Model fields to fetch (None = all model fields)
+            expand_edges: Also expand outgoing edges one level deep
 
         Returns:
             DQL query string
@@ -178,11 +289,7 @@ class DgraphUtilsMixin:
         dql = f"""
         {{
             items(func: type({self.collection_name}){pagination}) {filter_str} {{
-                uid
-                expand(_all_) {{
-                    uid
-                    expand(_all_)
-                }}
+                {self._build_projection(fields, expand_edges)}
             }}
         }}
         """
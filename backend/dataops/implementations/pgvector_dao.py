@@ -143,13 +143,32 @@ class PgVectorDAO(BaseDAO):
 
                 if row:
                     data = json.loads(row["data"])
-                    return self.model_cls.from_storage_dict(data)
+                    return self.model_cls.from_storage_dict(data, trusted=True)
                 return None
 
         except Exception as e:
             logger.exception(f"Failed to find by ID: {e}")
             raise StorageError(f"Find failed: {e}") from e
 
+    async def find_by_ids(self, item_ids: list[str]) -> dict[str, StorageModel]:
+        """Find records by ID in one query, keyed by ID"""
+        if not self.connection_pool:
+            await self.connect()
+
+        try:
+            async with self.connection_pool.acquire() as conn:
+                table_name = self._get_safe_table_name()
+                query = f"""
+                    SELECT id, data FROM "{table_name}"
+                    WHERE id = ANY($1)
+                """
+                rows = await conn.fetch(query, list(item_ids))
+                return {row["id"]: self.model_cls.from_storage_dict(json.loads(row["data"]), trusted=True) for row in rows}
+
+        except Exception as e:
+            logger.exception(f"Failed to find by IDs: {e}")
+            raise StorageError(f"Find failed: {e}") from e
+
     async def find_one(self, query: dict[str, Any]) -> StorageModel | None:
         """Find single record matching query"""
         if not self.connection_pool:
@@ -170,7 +189,7 @@ class PgVectorDAO(BaseDAO):
 
                 if row:
                     data = json.loads(row["data"])
-                    return self.model_cls.from_storage_dict(data)
+                    return self.model_cls.from_storage_dict(data, trusted=True)
                 return None
 
         except Exception as e:
@@ -203,7 +222,7 @@ class PgVectorDAO(BaseDAO):
                 results = []
                 for row in rows:
                     data = json.loads(row["data"])
-                    results.append(self.model_cls.from_storage_dict(data))
+                    results.append(self.model_cls.from_storage_dict(data, trusted=True))
 
                 return results
 
@@ -246,6 +265,37 @@ class PgVectorDAO(BaseDAO):
             logger.exception(f"Failed to update: {e}")
             raise StorageError(f"Update failed: {e}") from e
 
+    async def upsert(self, instance: StorageModel, changes: dict[str, Any] | None = None) -> str:
+        """Merge changed fields into the stored JSONB in one statement, or create the record"""
+        if changes is None:
+            # create already inserts or replaces in one statement
+            return await self.create(instance)
+
+        if not self.connection_pool:
+            await self.connect()
+
+        try:
+            # The embedding covers the whole record, which the instance holds
+            embedding = await self._generate_embedding(instance.to_storage_dict())
+
+            async with self.connection_pool.acquire() as conn:
+                table_name = self._get_safe_table_name()
+                query = f"""
+                    UPDATE "{table_name}"
+                    SET data = data || $2::jsonb, embedding = $3, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = $1
+                """
+                embedding_str = f"[{','.join(map(str, embedding))}]"
+                result = await conn.execute(query, instance.id, json.dumps(changes), embedding_str)
+
+        except Exception as e:
+            logger.exception(f"Failed to upsert: {e}")
+            raise StorageError(f"Upsert failed: {e}") from e
+
+        if result.split()[-1] == "0":
+            return await self.create(instance)
+        return instance.id
+
     async def delete(self, item_id: str) -> bool:
         """Delete record by ID"""
         if not self.connection_pool:
@@ -467,7 +517,7 @@ class PgVectorDAO(BaseDAO):
                 results = []
                 for row in rows:
                     data = json.loads(row["data"])
-                    instance = self.model_cls.from_storage_dict(data)
+                    instance = self.model_cls.from_storage_dict(data, trusted=True)
                     # Add distance as metadata
                     instance._distance = row["distance"]
                     results.append(instance)
@@ -14,6 +14,7 @@ from asyncpg.exceptions import UndefinedTableError
 
 if TYPE_CHECKING:
     pass
+from ..storage_model import StorageModel
 from ..storage_types import StorageConfig, StorageError
 
 logger = logging.getLogger(__name__)
@@ -33,10 +34,19 @@ class PostgreSQLDAO:
         list: "JSONB",
     }
 
-    def __init__(self, config: StorageConfig, collection_name: str):
+    def __init__(self, model_cls_or_config: type[StorageModel] | StorageConfig, collection_name_or_config: str | StorageConfig | None = None):
         """Initialize PostgreSQL DAO."""
-        self.config = config
-        self.collection_name = collection_name
+        # Handle both signatures for compatibility (as RedisDAO does)
+        if isinstance(model_cls_or_config, type) and issubclass(model_cls_or_config, StorageModel):
+            # Called as (model_cls, storage_config) from DAOFactory; lookups by ID return model instances
+            self.model_cls: type[StorageModel] | None = model_cls_or_config
+            self.config: StorageConfig = collection_name_or_config  # type: ignore[assignment]
+            self.collection_name = getattr(getattr(model_cls_or_config, "Meta", None), "path", model_cls_or_config.__name__.lower())
+        else:
+            # Called as (config, collection_name) directly; records stay dicts
+            self.config = model_cls_or_config
+            self.collection_name = collection_name_or_config  # type: ignore[assignment]
+            self.model_cls = None
         self.pool: Pool | None = None
         self._table_created = False
 
@@ -320,6 +330,26 @@ class PostgreSQLDAO:
                 logger.exception(f"Failed to read record {item_id}")
                 raise StorageError(f"Failed to read record: {e}") from e
 
+    async def read_many(self, item_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Read many records by ID in one query."""
+        await self._ensure_table_exists()
+
+        if not self.pool:
+            await self.connect()
+
+        table_name = self._get_safe_table_name()
+
+        async with self.pool.acquire() as conn:  # type: ignore[union-attr]
+            try:
+                rows = await conn.fetch(f"SELECT * FROM {table_name} WHERE id = ANY($1)", list(item_ids))
+                return {row["id"]: self._deserialize_row(dict(row)) for row in rows}
+            except UndefinedTableError:
+                logger.warning(f"Table {table_name} does not exist")
+                return {}
+            except Exception as e:
+                logger.exception("Failed to read records")
+                raise StorageError(f"Failed to read records: {e}") from e
+
     async def update(self, item_id: str, data: dict[str, Any]) -> bool:
         """Update a record."""
         await self._ensure_table_exists(data)
@@ -510,9 +540,19 @@ class PostgreSQLDAO:
                 result[key] = value
         return result
 
-    async def find_by_id(self, item_id: str) -> dict[str, Any] | None:
-        """Find a record by ID."""
-        return await self.read(item_id)
+    async def find_by_id(self, item_id: str) -> StorageModel | dict[str, Any] | None:
+        """Find a record by ID (a model instance when the DAO has a model)."""
+        record = await self.read(item_id)
+        if record is None or self.model_cls is None:
+            return record
+        return self.model_cls.from_storage_dict(record, trusted=True)
+
+    async def find_by_ids(self, item_ids: list[str]) -> dict[str, StorageModel] | dict[str, dict[str, Any]]:
+        """Find records by ID, keyed by ID (model instances when the DAO has a model)."""
+        records = await self.read_many(item_ids)
+        if self.model_cls is None:
+            return records
+        return {item_id: self.model_cls.from_storage_dict(record, trusted=True) for item_id, record in records.items()}
 
     async def find(self, filters: dict[str, Any] | None = None, limit: int | None = None, skip: int = 0) -> list[dict[str, Any]]:  # noqa: ARG002
         """Find records with filters."""
@@ -164,6 +164,43 @@ class RedisDAO:
             logger.exception(f"Failed to read cache entry {item_id}")
             raise StorageError(f"Failed to read cache entry: {e}") from e
 
+    async def read_many(self, item_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Read many cache entries with a single MGET."""
+        if not self.client:
+            await self.connect()
+
+        if not item_ids:
+            return {}
+
+        try:
+            values = await self.client.mget([self._make_key(item_id) for item_id in item_ids])  # type: ignore[union-attr]
+            results = {item_id: json.loads(value) for item_id, value in zip(item_ids, values, strict=True) if value}
+            if results:
+                # Update access metadata in one round trip
+                now = datetime.utcnow().isoformat()
+                async with self.client.pipeline(transaction=False) as pipe:  # type: ignore[union-attr]
+                    for item_id in results:
+                        pipe.hset(self._make_metadata_key(item_id), "last_accessed", now)
+                    await pipe.execute()
+            return results
+        except Exception as e:
+            logger.exception("Failed to read cache entries")
+            raise StorageError(f"Failed to read cache entries: {e}") from e
+
+    async def find_by_id(self, item_id: str) -> StorageModel | dict[str, Any] | None:
+        """Find a cache entry by ID (a model instance when the DAO has a model)."""
+        record = await self.read(item_id)
+        if record is None or self.model_cls is None:
+            return record
+        return self.model_cls.from_storage_dict(record, trusted=True)
+
+    async def find_by_ids(self, item_ids: list[str]) -> dict[str, StorageModel] | dict[str, dict[str, Any]]:
+        """Find cache entries by ID, keyed by ID (model instances when the DAO has a model)."""
+        records = await self.read_many(item_ids)
+        if self.model_cls is None:
+            return records
+        return {item_id: self.model_cls.from_storage_dict(record, trusted=True) for item_id, record in records.items()}
+
     async def update(self, item_id: str, data: dict[str, Any]) -> bool:
         """Update a cache entry."""
         if not self.client:
@@ -345,6 +382,29 @@ class RedisDAO:
 
     # Cache-specific methods
 
+    async def get_cached(self, item_id: str) -> dict[str, Any] | None:
+        """Get a cache entry with a single GET (no access metadata)."""
+        if not self.client:
+            await self.connect()
+
+        try:
+            data = await self.client.get(self._make_key(item_id))  # type: ignore[union-attr]
+            return json.loads(data) if data else None
+        except Exception as e:
+            logger.exception(f"Failed to get cache entry {item_id}")
+            raise StorageError(f"Failed to get cache entry: {e}") from e
+
+    async def set_cached(self, item_id: str, data: dict[str, Any], ttl: int) -> None:
+        """Store a cache entry as-is with a TTL (no timestamps, metadata or indexes)."""
+        if not self.client:
+            await self.connect()
+
+        try:
+            await self.client.setex(self._make_key(item_id), ttl, json.dumps(data, default=str))  # type: ignore[union-attr]
+        except Exception as e:
+            logger.exception(f"Failed to set cache entry {item_id}")
+            raise StorageError(f"Failed to set cache entry: {e}") from e
+
     async def expire(self, item_id: str, ttl: int) -> bool:
         """Set TTL for a cache entry."""
         if not self.client:
@@ -0,0 +1,120 @@
+"""
+Per-model storage serializers compiled once per class
+"""
+import types
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Literal, Union, get_args, get_origin
+
+from pydantic import TypeAdapter
+
+if TYPE_CHECKING:
+    from .storage_model import StorageModel
+
+# Values of these types come back from storage exactly as they were written
+_PLAIN_TYPES = (str, int, float, bool, type(None), list, dict)
+
+
+def _mentions_datetime(annotation: Any) -> bool:
+    """Whether a field is a (possibly optional) datetime."""
+    if annotation is datetime:
+        return True
+    return get_origin(annotation) in (Union, types.UnionType) and any(_mentions_datetime(arg) for arg in get_args(annotation))
+
+
+def _is_plain(annotation: Any) -> bool:
+    """Whether stored values of a field need no conversion to become the field's value."""
+    if annotation is Any or annotation is datetime or annotation in _PLAIN_TYPES:
+        return True
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        # Models use enum values (use_enum_values)
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return True
+    if origin in (Union, types.UnionType, list, dict):
+        return all(_is_plain(arg) for arg in get_args(annotation) if arg is not Ellipsis)
+    return False
+
+
+class ModelCodec:
+    """Converts one model class to and from storage dicts.
+
+    Everything that depends only on the class is worked out once: which
+    fields hold datetimes (stored as ISO strings), which fields are
+    required, and a cached ``TypeAdapter`` for every field whose stored form
+    differs from its value (nested models, tuples, sets, ...).
+
+    Records written by our own storages can be hydrated without validation
+    (``trusted=True``) through ``model_construct``; only the fields with
+    adapters are converted, and records missing a required field fall back
+    to full validation.
+
+    Loaded instances start change tracking (``StorageModel.get_changes``)
+    against their storage dict.
+    """
+
+    def __init__(self, model_cls: type["StorageModel"]):
+        self.model_cls = model_cls
+        fields = model_cls.model_fields
+        self.datetime_fields = tuple(name for name, info in fields.items() if _mentions_datetime(info.annotation))
+        # Any-typed fields may hold datetimes too, which are stored as ISO strings as well
+        self.dump_datetime_fields = self.datetime_fields + tuple(name for name, info in fields.items() if info.annotation is Any)
+        self.required_fields = frozenset(name for name, info in fields.items() if info.is_required())
+        self.adapters = {name: TypeAdapter(info.annotation) for name, info in fields.items() if not _is_plain(info.annotation)}
+        # Empty lists need no conversion for list-typed fields (e.g. an unshared ACL)
+        self._list_fields = frozenset(name for name in self.adapters if get_origin(fields[name].annotation) is list)
+
+    def dump(self, instance: "StorageModel", fields: Any = None) -> dict[str, Any]:
+        """Storage dict of an instance (datetimes as ISO strings).
+
+        Args:
+            instance: Model instance
+            fields: Only dump these fields
+        """
+        data = instance.model_dump(include=fields)
+        for name in self.dump_datetime_fields:
+            value = data.get(name)
+            if isinstance(value, datetime):
+                data[name] = value.isoformat()
+        return data
+
+    def load(self, data: dict[str, Any], trusted: bool = False) -> "StorageModel":
+        """Build an instance from a storage dict.
+
+        Args:
+            data: Storage dict (not modified)
+            trusted: The record was written by this model (skip validation)
+        """
+        values = self.parse_datetimes(data)
+
+        if not trusted or not self.required_fields <= values.keys():
+            instance = self.model_cls(**values)
+            instance._mark_stored()
+            return instance
+
+        for name, adapter in self.adapters.items():
+            value = values.get(name)
+            if value is not None:
+                # A new empty list keeps the stored one unshared
+                values[name] = adapter.validate_python(value) if value or name not in self._list_fields else []
+
+        instance = self.model_cls.model_construct(**values)
+        instance._mark_stored()
+        return instance
+
+    def parse_datetimes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Copy of a storage dict with its ISO datetime strings parsed."""
+        values = dict(data)
+        for name in self.datetime_fields:
+            value = values.get(name)
+            if isinstance(value, str):
+                values[name] = datetime.fromisoformat(value)
+        return values
+
+    def construct(self, data: dict[str, Any]) -> "StorageModel":
+        """Build an instance from a partial storage dict (a field projection) without validation.
+
+        The instance is not change-tracked: it does not hold the whole record.
+        """
+        return self.model_cls.model_construct(**self.parse_datetimes(data))
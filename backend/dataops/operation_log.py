@@ -0,0 +1,134 @@
+"""
+Bounded storage operations log with aggregated per-storage metrics
+"""
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is unbounded
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_OPERATIONS_LOG_SIZE = 1000
+# Longer error messages are cut so one bad payload cannot bloat the log
+MAX_ERROR_LENGTH = 200
+
+
+@dataclass(slots=True)
+class StorageOperation:
+    """Outcome of one call to a storage backend (no payload is kept)"""
+
+    storage_name: str
+    operation: str  # create, update, delete, bulk_create, ...
+    status: str  # success, failed, skipped
+    item_id: str | None = None
+    error: str | None = None
+    latency: float = 0.0  # seconds
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass(slots=True)
+class OperationMetrics:
+    """Counters and latency histogram of one (storage, operation) pair"""
+
+    count: int = 0
+    failed: int = 0
+    skipped: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def observe(self, status: str, latency: float) -> None:
+        """Count one call."""
+        self.count += 1
+        if status == "failed":
+            self.failed += 1
+        elif status == "skipped":
+            self.skipped += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Estimate a latency percentile as the upper bound of its bucket."""
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max_latency
+        return 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summarize as plain values."""
+        return {
+            "count": self.count,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "mean_latency": self.total_latency / self.count if self.count else 0.0,
+            "max_latency": self.max_latency,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "histogram": dict(zip([*map(str, LATENCY_BUCKETS), "+Inf"], self.buckets, strict=True)),
+        }
+
+
+class OperationLog:
+    """Ring buffer of recent storage operations plus running metrics.
+
+    Only the last ``capacity`` entries are kept, so memory stays flat however
+    many operations run. Metrics cover every observed call since the last
+    ``clear`` and cost a fixed amount per (storage, operation) pair.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_OPERATIONS_LOG_SIZE):
+        """Create an empty log.
+
+        Args:
+            capacity: Number of recent entries kept
+        """
+        self._entries: deque[StorageOperation] = deque(maxlen=capacity)
+        self._metrics: dict[tuple[str, str], OperationMetrics] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def observe(self, storage_name: str, operation: str, status: str, latency: float) -> None:
+        """Count a call in the metrics without adding a log entry (e.g. reads)."""
+        metrics = self._metrics.get((storage_name, operation))
+        if metrics is None:
+            metrics = self._metrics[(storage_name, operation)] = OperationMetrics()
+        metrics.observe(status, latency)
+
+    def record(self, storage_name: str, operation: str, status: str, latency: float = 0.0, item_id: str | None = None, error: str | None = None) -> None:
+        """Count a call and keep it as a log entry.
+
+        Args:
+            storage_name: Storage the call went to
+            operation: Operation name
+            status: "success", "failed" or "skipped"
+            latency: Duration in seconds
+            item_id: Affected record, if a single one
+            error: Error message (truncated)
+        """
+        self.observe(storage_name, operation, status, latency)
+        if error is not None and len(error) > MAX_ERROR_LENGTH:
+            error = error[:MAX_ERROR_LENGTH] + "..."
+        self._entries.append(StorageOperation(storage_name, operation, status, item_id, error, latency))
+
+    def entries(self) -> list[StorageOperation]:
+        """Get the retained entries, oldest first."""
+        return list(self._entries)
+
+    def get_metrics(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Get metrics by storage, then operation."""
+        metrics: dict[str, dict[str, dict[str, Any]]] = {}
+        for (storage_name, operation), values in self._metrics.items():
+            metrics.setdefault(storage_name, {})[operation] = values.as_dict()
+        return metrics
+
+    def clear(self) -> None:
+        """Drop all entries and metrics."""
+        self._entries.clear()
+        self._metrics.clear()
@@ -0,0 +1,337 @@
+"""
+Durable local outbox for eventually consistent secondary-storage writes
+"""
+import asyncio
+import contextlib
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .storage_model import StorageModel
+
+# Overrides the outbox file used when no outbox is passed to UnifiedCRUD in EVENTUAL mode
+OUTBOX_PATH_ENV = "DATAOPS_OUTBOX_PATH"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    model TEXT NOT NULL,
+    storage TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_group ON outbox (model, storage, seq);
+"""
+
+
+def default_outbox_path() -> Path:
+    """Outbox file from $DATAOPS_OUTBOX_PATH, else in the user's state directory (outside the source tree)."""
+    configured = os.environ.get(OUTBOX_PATH_ENV)
+    if configured:
+        return Path(configured).expanduser()
+    state_home = os.environ.get("XDG_STATE_HOME") or Path.home() / ".local" / "state"
+    return Path(state_home) / "dataops" / "outbox.db"
+
+
+class SyncOutbox:
+    """SQLite-backed queue of pending secondary-storage writes.
+
+    Entries survive restarts and are applied by a background drainer in
+    FIFO order per (model, storage). Consecutive entries with the same
+    operation are sent as one ``bulk_create``/``bulk_update``/``bulk_delete``
+    call. A failed batch backs off its whole (model, storage) group
+    exponentially so later writes never overtake it; entries are retried
+    until they succeed, so a batch may be applied more than once.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        batch_size: int = 500,
+        concurrency: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 60.0,
+        poll_interval: float = 1.0,
+        autostart: bool = True,
+    ):
+        """Open (or create) the outbox database.
+
+        Args:
+            path: SQLite file (default: ``default_outbox_path()``)
+            batch_size: Maximum entries per DAO call
+            concurrency: Maximum (model, storage) groups applied at once
+            base_delay: First retry delay in seconds
+            max_delay: Retry delay cap in seconds
+            poll_interval: Idle wait between drain passes in seconds
+            autostart: Start the background drainer on the first enqueue
+                (otherwise call ``drain_once``/``flush`` yourself)
+        """
+        self.path = Path(path) if path is not None else default_outbox_path()
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.autostart = autostart
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+        self._models: dict[str, type[StorageModel]] = {}
+        self._drainer: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._drain_lock = asyncio.Lock()
+        self._depth = self._conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+        self.stats = {"enqueued": 0, "applied": 0, "batches": 0, "failed_batches": 0}
+
+    def register(self, model_cls: type[StorageModel]) -> None:
+        """Make a model's DAOs available to the drainer (entries of unknown models wait)."""
+        self._models[model_cls.__name__] = model_cls
+
+    @property
+    def depth(self) -> int:
+        """Number of entries not yet applied."""
+        return self._depth
+
+    def get_stats(self) -> dict[str, int]:
+        """Get outbox counters and queue depth."""
+        return {**self.stats, "depth": self._depth}
+
+    async def enqueue(self, model_cls: type[StorageModel], operation: str, item_id: str, payload: dict[str, Any], storages: list[str]) -> None:
+        """Durably record one write per storage and wake the drainer.
+
+        Args:
+            model_cls: Model the write belongs to
+            operation: "create", "update" or "delete"
+            item_id: Record ID
+            payload: Storage dict (create) or patch (update)
+            storages: Storage names to write to
+        """
+        await self.enqueue_many(model_cls, [(operation, item_id, payload)], storages)
+
+    async def enqueue_many(self, model_cls: type[StorageModel], writes: list[tuple[str, str, dict[str, Any]]], storages: list[str]) -> None:
+        """Durably record several writes per storage in one transaction, keeping their order.
+
+        Args:
+            model_cls: Model the writes belong to
+            writes: Operation, record ID and payload of each write (see ``enqueue``)
+            storages: Storage names to write to
+        """
+        if not storages or not writes:
+            return
+
+        self.register(model_cls)
+        rows = [
+            (model_cls.__name__, storage_name, operation, item_id, json.dumps(payload, default=str))
+            for operation, item_id, payload in writes
+            for storage_name in storages
+        ]
+        await asyncio.to_thread(self._insert, rows)
+        self._depth += len(rows)
+        self.stats["enqueued"] += len(rows)
+        if self.autostart:
+            self._ensure_drainer()
+
+    def _insert(self, rows: list[tuple[str, str, str, str, str]]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("INSERT INTO outbox (model, storage, operation, item_id, payload) VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.execute("COMMIT")
+
+    def _ensure_drainer(self) -> None:
+        """Start the background drainer on the running loop, or wake it."""
+        if self._drainer is None or self._drainer.done():
+            self._wakeup = asyncio.Event()
+            self._drainer = asyncio.get_running_loop().create_task(self._drain_loop())
+        elif self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _drain_loop(self) -> None:
+        """Drain until stopped, sleeping when nothing is due."""
+        while True:
+            try:
+                applied = await self.drain_once()
+            except Exception as e:
+                # Keep draining; the failed pass is retried after the idle wait
+                logger.exception(f"Outbox drain pass failed: {e}")
+                applied = 0
+            if applied:
+                continue
+            self._wakeup.clear()  # type: ignore[union-attr]
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)  # type: ignore[union-attr]
+
+    def _fetch_due(self, now: float, models: list[str]) -> list[tuple[Any, ...]]:
+        """Oldest entries of every group of the given models that is not backing off.
+
+        Filtering by model in SQL keeps entries of unregistered models from
+        filling the limit and starving the groups that can be applied.
+        """
+        if not models:
+            return []
+        placeholders = ", ".join("?" * len(models))
+        with self._lock:
+            return self._conn.execute(
+                f"""
+                SELECT seq, model, storage, operation, item_id, payload, attempts FROM outbox
+                WHERE model IN ({placeholders})
+                AND (model, storage) NOT IN (SELECT model, storage FROM outbox WHERE next_attempt > ?)
+                ORDER BY seq LIMIT ?
+                """,  # noqa: S608
+                (*models, now, self.batch_size * self.concurrency),
+            ).fetchall()
+
+    def _count_pending(self, models: list[str]) -> int:
+        """Number of entries of the given models not yet applied."""
+        if not models:
+            return 0
+        placeholders = ", ".join("?" * len(models))
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM outbox WHERE model IN ({placeholders})", models).fetchone()[0]  # noqa: S608
+
+    async def drain_once(self) -> int:
+        """Apply every currently due entry once.
+
+        Returns:
+            Number of entries applied
+        """
+        async with self._drain_lock:
+            return await self._drain_due()
+
+    async def _drain_due(self) -> int:
+        rows = await asyncio.to_thread(self._fetch_due, time.time(), list(self._models))
+        groups: dict[tuple[str, str], list[tuple[Any, ...]]] = {}
+        for row in rows:
+            groups.setdefault((row[1], row[2]), []).append(row)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def apply_group(model_name: str, storage_name: str, entries: list[tuple[Any, ...]]) -> int:
+            async with semaphore:
+                return await self._apply_group(self._models[model_name], storage_name, entries)
+
+        counts = await asyncio.gather(*(apply_group(model, storage, entries) for (model, storage), entries in groups.items()))
+        return sum(counts)
+
+    async def _apply_group(self, model_cls: type[StorageModel], storage_name: str, entries: list[tuple[Any, ...]]) -> int:
+        """Apply a group's entries in order, one DAO call per run of equal operations."""
+        applied = 0
+        start = 0
+        while start < len(entries):
+            operation = entries[start][3]
+            end = start
+            while end < len(entries) and entries[end][3] == operation and end - start < self.batch_size:
+                end += 1
+            batch = entries[start:end]
+
+            try:
+                # Resolved here so a storage that cannot be reached backs off like a failed write
+                dao = model_cls.get_dao(storage_name)
+                await self._apply_batch(model_cls, dao, operation, batch)
+            except Exception as e:
+                self.stats["failed_batches"] += 1
+                attempts = batch[0][6] + 1
+                delay = min(self.base_delay * 2 ** (attempts - 1), self.max_delay) * random.uniform(0.5, 1.0)  # noqa: S311
+                logger.warning(f"Outbox {operation} of {len(batch)} {model_cls.__name__} entries in {storage_name} failed, retrying in {delay:.1f}s: {e}")
+                await asyncio.to_thread(self._back_off, [entry[0] for entry in entries[start:]], attempts, time.time() + delay, str(e))
+                return applied
+
+            await asyncio.to_thread(self._delete, [entry[0] for entry in batch])
+            self._depth -= len(batch)
+            self.stats["applied"] += len(batch)
+            self.stats["batches"] += 1
+            applied += len(batch)
+            start = end
+
+        return applied
+
+    @staticmethod
+    async def _apply_batch(model_cls: type[StorageModel], dao: Any, operation: str, batch: list[tuple[Any, ...]]) -> None:
+        """Send one batch through the DAO's bulk method, or item by item without one."""
+        payloads = [json.loads(entry[5]) for entry in batch]
+        item_ids = [entry[4] for entry in batch]
+        bulk = getattr(dao, f"bulk_{operation}", None)
+
+        if operation == "create":
+            instances = [model_cls.from_storage_dict(payload, trusted=True) for payload in payloads]
+            if bulk is not None:
+                await bulk(instances)
+            else:
+                await asyncio.gather(*(dao.create(instance) for instance in instances))
+        elif operation == "update":
+            if bulk is not None:
+                await bulk([{**payload, "id": item_id} for item_id, payload in zip(item_ids, payloads, strict=True)])
+            else:
+                await asyncio.gather(*(dao.update(item_id, payload) for item_id, payload in zip(item_ids, payloads, strict=True)))
+        elif operation == "delete":
+            if bulk is not None:
+                await bulk(item_ids)
+            else:
+                await asyncio.gather(*(dao.delete(item_id) for item_id in item_ids))
+        else:
+            raise ValueError(f"Unknown outbox operation: {operation}")
+
+    def _delete(self, seqs: list[int]) -> None:
+        with self._lock:
+            self._conn.executemany("DELETE FROM outbox WHERE seq = ?", [(seq,) for seq in seqs])
+
+    def _back_off(self, seqs: list[int], attempts: int, next_attempt: float, error: str) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? WHERE seq = ?", [(attempts, next_attempt, error, seq) for seq in seqs]
+            )
+
+    async def flush(self, timeout: float | None = None) -> None:
+        """Wait until every entry of the registered models is applied.
+
+        Entries of models not registered in this process cannot be applied
+        here and are left in place.
+
+        Args:
+            timeout: Give up after this many seconds (raises TimeoutError)
+        """
+
+        async def wait_empty() -> None:
+            while await asyncio.to_thread(self._count_pending, list(self._models)):
+                if not await self.drain_once():
+                    await asyncio.sleep(min(self.poll_interval, 0.05))
+
+        await asyncio.wait_for(wait_empty(), timeout)
+
+    async def stop(self) -> None:
+        """Stop the background drainer (pending entries stay on disk)."""
+        if self._drainer is not None:
+            self._drainer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._drainer
+            self._drainer = None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_outboxes: dict[Path, SyncOutbox] = {}
+
+
+def get_outbox(path: str | Path | None = None, **kwargs) -> SyncOutbox:
+    """Get or open the shared outbox for a file (default: ``default_outbox_path()``)"""
+    resolved = Path(path if path is not None else default_outbox_path()).resolve()
+    if resolved not in _outboxes:
+        _outboxes[resolved] = SyncOutbox(resolved, **kwargs)
+    return _outboxes[resolved]
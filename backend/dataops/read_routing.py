@@ -0,0 +1,119 @@
+"""
+Latency-aware routing of reads across replicated storages
+"""
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ReplicaStats:
+    """Observed behaviour of one (model, storage) pair"""
+
+    latency: float | None = None  # EWMA in seconds
+    error_rate: float = 0.0  # EWMA of failures (0..1)
+    samples: int = 0
+    last_update: float = 0.0
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=200))
+
+    def percentile(self, fraction: float) -> float | None:
+        """Latency percentile over recent successful reads."""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class ReadRouter:
+    """Ranks the storages able to serve a read by observed latency and health.
+
+    Every read reports its latency and outcome; reads then go to the fastest
+    storage whose error rate is below ``max_error_rate``. Unhealthy storages
+    are probed again once they have been left alone for ``probe_interval``
+    seconds, and the ground-truth storage is always the last resort.
+    """
+
+    def __init__(self, alpha: float = 0.2, max_error_rate: float = 0.5, probe_interval: float = 5.0, min_hedge_samples: int = 20):
+        """Create a router.
+
+        Args:
+            alpha: EWMA weight of the newest sample
+            max_error_rate: Error rate above which a storage is skipped
+            probe_interval: Seconds after which a skipped storage is tried again
+            min_hedge_samples: Samples needed before a p95 hedge deadline is used
+        """
+        self.alpha = alpha
+        self.max_error_rate = max_error_rate
+        self.probe_interval = probe_interval
+        self.min_hedge_samples = min_hedge_samples
+        self._stats: dict[tuple[str, str], ReplicaStats] = {}
+
+    def stats_for(self, model_name: str, storage_name: str) -> ReplicaStats:
+        """Get (or start) the stats of a (model, storage) pair."""
+        return self._stats.setdefault((model_name, storage_name), ReplicaStats())
+
+    def record(self, model_name: str, storage_name: str, latency: float, ok: bool) -> None:
+        """Report the outcome of one read.
+
+        Args:
+            model_name: Model class name
+            storage_name: Storage the read went to
+            latency: Duration in seconds
+            ok: Whether the read succeeded
+        """
+        stats = self.stats_for(model_name, storage_name)
+        stats.samples += 1
+        stats.last_update = time.monotonic()
+        stats.error_rate += self.alpha * ((0.0 if ok else 1.0) - stats.error_rate)
+        if ok:
+            stats.latency = latency if stats.latency is None else stats.latency + self.alpha * (latency - stats.latency)
+            stats.recent.append(latency)
+
+    def is_healthy(self, model_name: str, storage_name: str) -> bool:
+        """Check whether a storage may receive reads (or is due for a probe)."""
+        stats = self.stats_for(model_name, storage_name)
+        return stats.error_rate < self.max_error_rate or time.monotonic() - stats.last_update >= self.probe_interval
+
+    def rank(self, model_name: str, storages: list[str], ground_truth: str) -> list[str]:
+        """Order storages for a read: healthy ones fastest first, then the ground truth.
+
+        Storages without samples rank first so they get measured.
+
+        Args:
+            model_name: Model class name
+            storages: Storages able to serve the read
+            ground_truth: Authoritative storage
+
+        Returns:
+            Storage names to try, ending with the ground truth
+        """
+        healthy = [name for name in storages if name != ground_truth and self.is_healthy(model_name, name)]
+        if self.is_healthy(model_name, ground_truth):
+            healthy.append(ground_truth)
+        healthy.sort(key=lambda name: self.stats_for(model_name, name).latency or 0.0)
+
+        if ground_truth in healthy:
+            return healthy
+        return [*healthy, ground_truth]
+
+    def hedge_deadline(self, model_name: str, storage_name: str) -> float | None:
+        """p95 latency of a storage, once enough reads have been seen."""
+        stats = self.stats_for(model_name, storage_name)
+        if len(stats.recent) < self.min_hedge_samples:
+            return None
+        return stats.percentile(0.95)
+
+    def get_stats(self) -> dict[str, dict[str, float | int | None]]:
+        """Get latency and error rate per "model.storage"."""
+        return {
+            f"{model}.{storage}": {"latency": stats.latency, "p95": stats.percentile(0.95), "error_rate": stats.error_rate, "samples": stats.samples}
+            for (model, storage), stats in self._stats.items()
+        }
+
+
+_router = ReadRouter()
+
+
+def get_read_router() -> ReadRouter:
+    """Get the process-wide read router"""
+    return _router
@@ -0,0 +1,239 @@
+"""
+Digest-based reconciliation of a model's records across storages
+"""
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from .storage_model import StorageModel
+
+# Leaf buckets use this many hex digits of the uuid7 timestamp (8 digits ~ 65 second buckets)
+DEFAULT_BUCKET_PREFIX = 8
+DEFAULT_SCAN_BATCH_SIZE = 1000
+DEFAULT_MOVE_BATCH_SIZE = 500
+
+
+def content_digest(instance: StorageModel) -> str:
+    """Hash of a record's canonical storage form (equal in every storage holding the same data)"""
+    canonical = json.dumps(instance.to_storage_dict(), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def time_bucket(item_id: str, prefix_length: int) -> str:
+    """Bucket key of an ID: its uuid7 timestamp prefix, or a hash prefix for other IDs.
+
+    Prefixed IDs ("instance_<uuid7>") are bucketed by their uuid7 part.
+    """
+    value = item_id.split("_", 1)[1] if "_" in item_id else item_id
+    hex_digits = value.replace("-", "")
+    if len(hex_digits) == 32 and hex_digits[12] == "7":  # noqa: PLR2004
+        return hex_digits[:prefix_length].lower()
+    # "~" keeps hashed buckets apart from time buckets
+    return "~" + hashlib.sha1(item_id.encode()).hexdigest()[: prefix_length - 1]  # noqa: S324
+
+
+async def scan_digests(dao: Any, batch_size: int = DEFAULT_SCAN_BATCH_SIZE) -> AsyncIterator[tuple[str, str]]:
+    """Yield (ID, content digest) for every record of a DAO, paging through ``find``."""
+    skip = 0
+    while True:
+        page = await dao.find({}, limit=batch_size, skip=skip)
+        for instance in page:
+            yield instance.id, content_digest(instance)
+        if len(page) < batch_size:
+            return
+        skip += batch_size
+
+
+class DigestTree:
+    """Order-independent digests of one storage's records, bucketed by ID time prefix.
+
+    Each leaf bucket XOR-combines the hashes of its (ID, digest) pairs and
+    keeps the pairs themselves, so the records of differing buckets can be
+    compared without scanning the storage again. Parent levels are shorter
+    prefixes of the leaf keys; comparing two trees descends only into
+    parents that differ.
+    """
+
+    def __init__(self, prefix_length: int = DEFAULT_BUCKET_PREFIX):
+        self.prefix_length = prefix_length
+        self.leaves: dict[str, int] = {}
+        self.records: dict[str, dict[str, str]] = {}
+        self.count = 0
+
+    def add(self, item_id: str, digest: str) -> None:
+        """Fold one record into its bucket."""
+        value = int.from_bytes(hashlib.sha256(f"{item_id}:{digest}".encode()).digest()[:16], "big")
+        key = time_bucket(item_id, self.prefix_length)
+        self.leaves[key] = self.leaves.get(key, 0) ^ value
+        self.records.setdefault(key, {})[item_id] = digest
+        self.count += 1
+
+    def digests(self, buckets: set[str]) -> dict[str, str]:
+        """Per-record digests in the given leaf buckets."""
+        return {item_id: digest for key in buckets for item_id, digest in self.records.get(key, {}).items()}
+
+    def level(self, length: int, parents: set[str] | None = None, parent_length: int = 0) -> dict[str, int]:
+        """Bucket digests at a prefix length, limited to the given parent buckets."""
+        buckets: dict[str, int] = {}
+        for key, value in self.leaves.items():
+            if parents is None or key[:parent_length] in parents:
+                buckets[key[:length]] = buckets.get(key[:length], 0) ^ value
+        return buckets
+
+    def diff(self, other: "DigestTree", step: int = 2) -> set[str]:
+        """Leaf buckets whose records differ between two trees.
+
+        Args:
+            other: Tree of the other storage (same prefix length)
+            step: Prefix digits added per level
+        """
+        parents: set[str] | None = None
+        parent_length = 0
+        for length in [*range(step, self.prefix_length, step), self.prefix_length]:
+            mine, theirs = self.level(length, parents, parent_length), other.level(length, parents, parent_length)
+            parents = {key for key in mine.keys() | theirs.keys() if mine.get(key, 0) != theirs.get(key, 0)}
+            parent_length = length
+            if not parents:
+                break
+        return parents or set()
+
+
+class ReconcileReport(BaseModel):
+    """Outcome of reconciling one target storage against the source"""
+
+    source: str
+    target: str
+    source_records: int = 0
+    target_records: int = 0
+    differing_buckets: int = 0
+    created: list[str] = Field(default_factory=list)  # missing in the target
+    updated: list[str] = Field(default_factory=list)  # content differed
+    extra: list[str] = Field(default_factory=list)  # only in the target
+    deleted: list[str] = Field(default_factory=list)
+    failed: dict[str, str] = Field(default_factory=dict)
+
+
+class Reconciler:
+    """Finds and repairs drift between a model's storages.
+
+    Each storage is scanned once into a DigestTree; trees are compared
+    against the source (ground truth) bucket by bucket. Per-record digests
+    of the differing buckets come from the trees, and only the records that
+    differ are read from the source and written to the target, in batches.
+    """
+
+    def __init__(
+        self,
+        model_cls: type[StorageModel],
+        prefix_length: int = DEFAULT_BUCKET_PREFIX,
+        scan_batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+        move_batch_size: int = DEFAULT_MOVE_BATCH_SIZE,
+    ):
+        """Create a reconciler.
+
+        Args:
+            model_cls: Model to reconcile
+            prefix_length: Hex digits of the uuid7 timestamp per leaf bucket
+            scan_batch_size: Records per page when scanning a storage
+            move_batch_size: Records per read/write when repairing
+        """
+        self.model_cls = model_cls
+        self.prefix_length = prefix_length
+        self.scan_batch_size = scan_batch_size
+        self.move_batch_size = move_batch_size
+
+    async def build_tree(self, storage_name: str) -> DigestTree:
+        """Scan a storage into a digest tree."""
+        tree = DigestTree(self.prefix_length)
+        async for item_id, digest in scan_digests(self.model_cls.get_dao(storage_name), self.scan_batch_size):
+            tree.add(item_id, digest)
+        return tree
+
+    async def reconcile(self, source: str, targets: list[str], delete_extra: bool = False, dry_run: bool = False) -> dict[str, ReconcileReport]:
+        """Bring target storages in line with the source.
+
+        Args:
+            source: Ground-truth storage
+            targets: Storages to repair
+            delete_extra: Delete records found only in a target
+            dry_run: Only report the differences
+
+        Returns:
+            Report by target storage
+        """
+        trees = await asyncio.gather(*(self.build_tree(name) for name in [source, *targets]))
+        source_tree = trees[0]
+        reports = {}
+        for target, target_tree in zip(targets, trees[1:], strict=True):
+            report = ReconcileReport(source=source, target=target, source_records=source_tree.count, target_records=target_tree.count)
+            buckets = source_tree.diff(target_tree)
+            report.differing_buckets = len(buckets)
+            if buckets:
+                await self._repair(source, target, source_tree.digests(buckets), target_tree.digests(buckets), report, delete_extra, dry_run)
+            logger.info(
+                f"Reconciled {self.model_cls.__name__} {target} against {source}: {len(buckets)} differing buckets, "
+                f"{len(report.created)} missing, {len(report.updated)} changed, {len(report.extra)} extra, {len(report.failed)} failed"
+            )
+            reports[target] = report
+        return reports
+
+    async def _repair(
+        self,
+        source: str,
+        target: str,
+        source_digests: dict[str, str],
+        target_digests: dict[str, str],
+        report: ReconcileReport,
+        delete_extra: bool,
+        dry_run: bool,
+    ) -> None:
+        """Compare per-record digests of the differing buckets and move what differs."""
+        missing = [item_id for item_id in source_digests if item_id not in target_digests]
+        changed = [item_id for item_id, digest in source_digests.items() if item_id in target_digests and target_digests[item_id] != digest]
+        extra = [item_id for item_id in target_digests if item_id not in source_digests]
+        report.extra = extra
+        if dry_run:
+            report.created, report.updated = missing, changed
+            return
+
+        source_dao, target_dao = self.model_cls.get_dao(source), self.model_cls.get_dao(target)
+        for operation, item_ids, done in (("create", missing, report.created), ("update", changed, report.updated)):
+            for start in range(0, len(item_ids), self.move_batch_size):
+                batch = item_ids[start : start + self.move_batch_size]
+                try:
+                    records = await source_dao.find_by_ids(batch)
+                    await self._write_batch(target_dao, operation, [records[item_id] for item_id in batch if item_id in records])
+                    done.extend(item_id for item_id in batch if item_id in records)
+                except Exception as e:
+                    report.failed.update(dict.fromkeys(batch, str(e)))
+
+        if delete_extra:
+            for start in range(0, len(extra), self.move_batch_size):
+                batch = extra[start : start + self.move_batch_size]
+                try:
+                    await self._write_batch(target_dao, "delete", batch)
+                    report.deleted.extend(batch)
+                except Exception as e:
+                    report.failed.update(dict.fromkeys(batch, str(e)))
+
+    @staticmethod
+    async def _write_batch(dao: Any, operation: str, items: list[Any]) -> None:
+        """Write a batch through the DAO's bulk method, or item by item without one."""
+        if not items:
+            return
+        bulk = getattr(dao, f"bulk_{operation}", None)
+        if operation == "update":
+            payloads = [instance.to_storage_dict() for instance in items]
+            if bulk is not None:
+                await bulk(payloads)
+            else:
+                await asyncio.gather(*(dao.update(payload["id"], payload) for payload in payloads))
+        elif bulk is not None:
+            await bulk(items)
+        else:
+            await asyncio.gather(*(getattr(dao, operation)(item) for item in items))
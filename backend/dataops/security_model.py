@@ -8,7 +8,7 @@ from typing import Any, Optional
 from pydantic import BaseModel, Field
 
 from .storage_model import StorageModel
-from .storage_types import StorageConfig, StorageType
+from .storage_types import ReadConsistency, StorageConfig, StorageType
 
 
 class Permission(str, Enum):
@@ -99,9 +99,9 @@ class SecuredStorageModel(StorageModel):
             # Additional storages can be added in subclasses
         }
 
-    @classmethod
-    async def create_with_security(cls, context: SecurityContext, **kwargs) -> "SecuredStorageModel":
-        """Create instance with security context"""
+    @staticmethod
+    def apply_owner_fields(kwargs: dict[str, Any], context: SecurityContext) -> dict[str, Any]:
+        """Set owner, audit fields and the owner's admin ACL entry on creation kwargs"""
         # Set security fields
         kwargs["owner_id"] = context.user_id
         kwargs["created_by"] = context.user_id
@@ -110,9 +110,13 @@ class SecuredStorageModel(StorageModel):
         # Create default ACL for owner
         owner_acl = ACLEntry(principal_id=context.user_id, principal_type="user", permissions=[Permission.ADMIN], granted_by="system")
         kwargs.setdefault("acl", []).append(owner_acl)
+        return kwargs
 
+    @classmethod
+    async def create_with_security(cls, context: SecurityContext, **kwargs) -> "SecuredStorageModel":
+        """Create instance with security context"""
         # Create instance
-        instance = cls(**kwargs)
+        instance = cls(**cls.apply_owner_fields(kwargs, context))
 
         # First create in Dgraph to get security key
         graph_dao = cls.get_dao("graph")
@@ -261,6 +265,7 @@ class Role(SecuredStorageModel):
             "cache": StorageConfig(storage_type=StorageType.CACHE),  # Cache for fast lookup
         }
         path = "roles"
+        options = {"read_consistency": ReadConsistency.BEST_EFFORT, "cache_ttl": 3600}  # Roles change rarely
 
 
 class SecurityGroup(SecuredStorageModel):
@@ -0,0 +1,253 @@
+"""
+Per-request unit of work with an identity map
+"""
+from contextvars import ContextVar, Token
+from typing import Any
+
+from .batch_loader import batch_loading
+from .exceptions import StorageError
+from .security_model import Permission, SecuredStorageModel, SecurityContext
+from .storage_model import StorageModel
+
+_current_session: ContextVar["Session | None"] = ContextVar("dataops_session", default=None)
+
+# Marks fields missing from a snapshot
+_MISSING = object()
+
+
+class Session:
+    """Identity map and unit of work for one request or job.
+
+    While a session is active, records loaded through ``UnifiedCRUD.read``,
+    ``StorageModel.find_by_id`` or ``Session.get`` are kept by (model, ID);
+    later loads of the same record return the same instance without a
+    backend call. Lookups are also batched (see ``batch_loading``).
+
+    Instances added with ``add``, marked with ``delete`` or changed in place
+    after loading are written on ``flush``/``commit`` through
+    ``UnifiedCRUD.apply_bulk``: one chunked ``bulk_create``/``bulk_update``/
+    ``bulk_delete`` per (model, storage) following the model's sync strategy,
+    updates carrying only the changed fields. Leaving the ``async with``
+    block commits, unless it raised, in which case pending changes are
+    dropped.
+    """
+
+    def __init__(self, context: SecurityContext | None = None):
+        """Create a session.
+
+        Args:
+            context: Security context for loads and for permission checks
+                of secured models on flush
+        """
+        self.context = context
+        self._identity: dict[tuple[type[StorageModel], str], StorageModel | None] = {}
+        self._snapshots: dict[tuple[type[StorageModel], str], dict[str, Any]] = {}
+        self._new: dict[tuple[type[StorageModel], str], StorageModel] = {}
+        self._deleted: dict[tuple[type[StorageModel], str], StorageModel | None] = {}
+        self._token: Token | None = None
+        self._loading: Any = None
+        self.stats = {"hits": 0, "flushes": 0, "created": 0, "updated": 0, "deleted": 0}
+
+    async def __aenter__(self) -> "Session":
+        self._token = _current_session.set(self)
+        self._loading = batch_loading()
+        await self._loading.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                self.rollback()
+        finally:
+            await self._loading.__aexit__(exc_type, exc, tb)
+            _current_session.reset(self._token)  # type: ignore[arg-type]
+
+    def lookup(self, model_cls: type[StorageModel], item_id: str) -> tuple[bool, StorageModel | None]:
+        """Get a record from the identity map.
+
+        Returns:
+            Whether the session knows the record, and the instance (None if
+            it does not exist or is scheduled for deletion)
+        """
+        key = (model_cls, item_id)
+        if key in self._deleted:
+            self.stats["hits"] += 1
+            return True, None
+        if key not in self._identity:
+            return False, None
+        self.stats["hits"] += 1
+        return True, self._identity[key]
+
+    def register(self, model_cls: type[StorageModel], item_id: str, instance: StorageModel | None) -> StorageModel | None:
+        """Keep a record loaded from (or just written to) storage as clean.
+
+        Returns:
+            The instance already mapped for the ID if there is one, so
+            callers always share a single instance
+        """
+        key = (model_cls, item_id)
+        current = self._identity.get(key)
+        if current is not None and instance is not None and current is not instance and self._changes(key):
+            # Unflushed in-place changes win over a fresh load
+            return current
+        self._identity[key] = instance
+        if instance is None:
+            self._snapshots.pop(key, None)
+        else:
+            self._snapshots[key] = instance.to_storage_dict()
+        return instance
+
+    def forget(self, model_cls: type[StorageModel], item_id: str) -> None:
+        """Drop a record from the session (e.g. after it was deleted directly)."""
+        key = (model_cls, item_id)
+        for mapping in (self._identity, self._snapshots, self._new, self._deleted):
+            mapping.pop(key, None)
+
+    async def get(self, model_cls: type[StorageModel], item_id: str) -> StorageModel | None:
+        """Load a record once per session.
+
+        Args:
+            model_cls: Model class
+            item_id: Record ID
+
+        Returns:
+            The session's instance, or None if the record does not exist
+        """
+        from .unified_crud import get_crud  # noqa: PLC0415 - unified_crud imports this module
+
+        known, instance = self.lookup(model_cls, item_id)
+        if known:
+            return instance
+        # UnifiedCRUD.read registers the result with this session
+        return await get_crud(model_cls).read(item_id, self.context)
+
+    def add(self, instance: StorageModel) -> StorageModel:
+        """Schedule a new instance for creation.
+
+        Secured instances without an owner get the session user as owner.
+        """
+        if self.context and isinstance(instance, SecuredStorageModel) and not instance.owner_id:
+            for field_name, value in SecuredStorageModel.apply_owner_fields({"acl": list(instance.acl)}, self.context).items():
+                setattr(instance, field_name, value)
+        key = (type(instance), instance.id)
+        self._new[key] = instance  # type: ignore[index]
+        self._identity[key] = instance  # type: ignore[index]
+        return instance
+
+    def delete(self, instance: StorageModel) -> None:
+        """Schedule an instance for deletion."""
+        key = (type(instance), instance.id)
+        if self._new.pop(key, None) is not None:  # type: ignore[arg-type]
+            # Never written, nothing to delete
+            self._identity.pop(key, None)  # type: ignore[arg-type]
+            return
+        self._deleted[key] = instance  # type: ignore[index]
+
+    def _changes(self, key: tuple[type[StorageModel], str]) -> dict[str, Any]:
+        """Fields of a loaded instance that differ from its snapshot."""
+        instance = self._identity.get(key)
+        snapshot = self._snapshots.get(key)
+        if instance is None or snapshot is None:
+            return {}
+        current = instance.to_storage_dict()
+        return {name: value for name, value in current.items() if snapshot.get(name, _MISSING) != value}
+
+    @property
+    def dirty(self) -> list[StorageModel]:
+        """Loaded instances changed in place since they were loaded or flushed."""
+        return [instance for key, instance in self._identity.items() if instance is not None and key not in self._new and self._changes(key)]
+
+    async def flush(self) -> None:
+        """Write all pending creates, updates and deletes, grouped per model and storage.
+
+        Raises:
+            PermissionError: The context may not change a secured record
+            StorageError: Items failed in a model's primary storage (secondary
+                failures are logged)
+        """
+        plans = self._plan()
+        if not plans:
+            return
+
+        await self._check_permissions(plans)
+        errors: dict[str, str] = {}
+        for model_cls, plan in plans.items():
+            errors.update(await self._flush_model(model_cls, plan))
+
+        self.stats["flushes"] += 1
+        for model_cls, plan in plans.items():
+            for item_id in plan["create"]:
+                self.register(model_cls, item_id, self._new.pop((model_cls, item_id)))
+            for item_id in plan["update"]:
+                self.register(model_cls, item_id, self._identity[(model_cls, item_id)])
+            for item_id in plan["delete"]:
+                self._deleted.pop((model_cls, item_id), None)
+                self._identity[(model_cls, item_id)] = None
+                self._snapshots.pop((model_cls, item_id), None)
+            self.stats["created"] += len(plan["create"])
+            self.stats["updated"] += len(plan["update"])
+            self.stats["deleted"] += len(plan["delete"])
+
+        if errors:
+            raise StorageError(f"Session flush failed for {len(errors)} records: {errors}")
+
+    def _plan(self) -> dict[type[StorageModel], dict[str, dict[str, Any]]]:
+        """Pending creates (instances), updates (changed fields) and deletes (IDs) by model."""
+        plans: dict[type[StorageModel], dict[str, dict[str, Any]]] = {}
+        for (model_cls, item_id), instance in self._new.items():
+            plans.setdefault(model_cls, {"create": {}, "update": {}, "delete": {}})["create"][item_id] = instance
+        for key in list(self._identity):
+            if key in self._new or key in self._deleted:
+                continue
+            changes = self._changes(key)
+            if changes:
+                plans.setdefault(key[0], {"create": {}, "update": {}, "delete": {}})["update"][key[1]] = changes
+        for model_cls, item_id in self._deleted:
+            plans.setdefault(model_cls, {"create": {}, "update": {}, "delete": {}})["delete"][item_id] = item_id
+        return plans
+
+    async def _check_permissions(self, plans: dict[type[StorageModel], dict[str, dict[str, Any]]]) -> None:
+        """Check write/delete permission on secured records before anything is written."""
+        from .unified_crud import get_crud  # noqa: PLC0415 - unified_crud imports this module
+
+        for model_cls, plan in plans.items():
+            if not (plan["update"] or plan["delete"]) or not get_crud(model_cls).security_enabled:
+                continue
+            if not self.context:
+                raise ValueError("Security context required")
+            for operation, permission in (("update", Permission.WRITE), ("delete", Permission.DELETE)):
+                for item_id in plan[operation]:
+                    instance = self._identity.get((model_cls, item_id)) or self._deleted.get((model_cls, item_id))
+                    if instance is not None and not await instance.check_permission(self.context, permission):  # type: ignore[attr-defined]
+                        raise PermissionError(f"No {permission.value} permission on {model_cls.__name__} {item_id}")
+                    if operation == "update":
+                        plan["update"][item_id]["modified_by"] = self.context.user_id
+
+    @staticmethod
+    async def _flush_model(model_cls: type[StorageModel], plan: dict[str, dict[str, Any]]) -> dict[str, str]:
+        """Write one model's changes through its UnifiedCRUD, returning primary storage errors by ID."""
+        from .unified_crud import get_crud  # noqa: PLC0415 - unified_crud imports this module
+
+        result = await get_crud(model_cls).apply_bulk(plan["create"], plan["update"], list(plan["delete"]))
+        return result.failed
+
+    async def commit(self) -> None:
+        """Flush pending changes."""
+        await self.flush()
+
+    def rollback(self) -> None:
+        """Drop pending changes and in-place edits (nothing written is undone)."""
+        for key in self._new:
+            self._identity.pop(key, None)
+        self._new.clear()
+        self._deleted.clear()
+        for key in [key for key in self._identity if self._changes(key)]:
+            self._identity.pop(key, None)
+            self._snapshots.pop(key, None)
+
+
+def get_current_session() -> Session | None:
+    """Get the session of the current request, if any."""
+    return _current_session.get()
@@ -4,10 +4,12 @@ Base StorageModel class that all models inherit from
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from ..utils.uuid_utils import uuid7
+from .batch_loader import load_by_id
 from .exceptions import ConfigurationError
+from .model_codec import ModelCodec
 from .storage_types import ModelMetadata, StorageConfig, StorageType
 
 if TYPE_CHECKING:
@@ -19,8 +21,12 @@ class StorageModel(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True, use_enum_values=True, validate_assignment=True)
 
+    # Storage dict as of the last load or save (None until then), for change tracking
+    _stored_state: dict[str, Any] | None = PrivateAttr(default=None)
+
     _metadata: ClassVar[ModelMetadata]
     _daos: ClassVar[dict[str, "BaseDAO"]] = {}
+    _codec: ClassVar[ModelCodec | None] = None
 
     # Common fields that can be overridden
     id: str | None = Field(default_factory=uuid7)
@@ -58,6 +64,40 @@ class StorageModel(BaseModel):
             # Default metadata if not inherited
             cls._metadata = ModelMetadata(storage_configs={"primary": StorageConfig(storage_type=StorageType.DOCUMENT)}, path=cls.__name__.lower() + "s")
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        """Compile the storage codec once the subclass' fields are complete"""
+        super().__pydantic_init_subclass__(**kwargs)
+        # Models with unresolved forward references compile on first use
+        cls._codec = ModelCodec(cls) if cls.__pydantic_complete__ else None
+
+    @classmethod
+    def get_codec(cls) -> ModelCodec:
+        """Get the class' compiled storage codec"""
+        codec = cls.__dict__.get("_codec")
+        if codec is None:
+            codec = cls._codec = ModelCodec(cls)
+        return codec
+
+    def _mark_stored(self) -> None:
+        """Start tracking changes against the instance's current (stored) state."""
+        self._stored_state = self.to_storage_dict()
+
+    def get_changes(self) -> dict[str, Any] | None:
+        """Storage values of the fields changed since the instance was loaded or saved.
+
+        Fields edited in place (e.g. ``instance.acl.append(...)``) count as
+        changed as well as assigned ones.
+
+        Returns:
+            Changed fields (empty if none), or None if the instance was never
+            loaded or saved, so its stored state is unknown
+        """
+        if self._stored_state is None:
+            return None
+        current = self.to_storage_dict()
+        return {name: value for name, value in current.items() if name not in self._stored_state or self._stored_state[name] != value}
+
     @classmethod
     def get_metadata(cls) -> ModelMetadata:
         """Get model metadata"""
@@ -123,13 +163,25 @@ class StorageModel(BaseModel):
         dao = cls.get_dao()
         saved_id = await dao.create(instance)
         instance.id = saved_id
+        instance._mark_stored()
         return instance
 
     @classmethod
     async def find_by_id(cls, item_id: str) -> Optional["StorageModel"]:
-        """Find instance by ID"""
-        dao = cls.get_dao()
-        return await dao.find_by_id(item_id)
+        """Find instance by ID (once per active Session)"""
+        from .session import get_current_session  # noqa: PLC0415 - session imports this module
+
+        session = get_current_session()
+        if session is not None:
+            known, instance = session.lookup(cls, item_id)
+            if known:
+                return instance
+
+        storage_name = next(iter(cls.get_metadata().storage_configs))
+        instance = await load_by_id(cls.get_dao(storage_name), item_id, storage_name)
+        if session is not None:
+            return session.register(cls, item_id, instance)
+        return instance
 
     @classmethod
     async def find_one(cls, query: dict[str, Any]) -> Optional["StorageModel"]:
@@ -150,16 +202,21 @@ class StorageModel(BaseModel):
         return await dao.count(query or {})
 
     async def save(self) -> "StorageModel":
-        """Save current instance to storage"""
-        self.updated_at = datetime.utcnow()
-        dao = self.get_dao()
+        """Save current instance to storage.
 
-        if await dao.exists(self.id):
-            await dao.update(self.id, self.model_dump())
-        else:
-            saved_id = await dao.create(self)
-            self.id = saved_id
+        Instances loaded from (or already saved to) storage send only the
+        fields changed since, in one upsert, and nothing at all if no field
+        changed. Other instances are written whole.
+        """
+        changes = self.get_changes()
+        if changes == {}:
+            return self
 
+        self.updated_at = datetime.utcnow()
+        if changes is not None:
+            changes["updated_at"] = self.updated_at.isoformat()
+        self.id = await self.get_dao().upsert(self, changes)
+        self._mark_stored()
         return self
 
     async def update(self, **kwargs) -> "StorageModel":
@@ -180,25 +237,20 @@ class StorageModel(BaseModel):
         if fresh:
             for field in self.model_fields:
                 setattr(self, field, getattr(fresh, field))
+            self._mark_stored()
         return self
 
     def to_storage_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage"""
-        data = self.model_dump()
-
-        # Handle datetime serialization
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                data[key] = value.isoformat()
-
-        return data
+        return self.get_codec().dump(self)
 
     @classmethod
-    def from_storage_dict(cls, data: dict[str, Any]) -> "StorageModel":
-        """Create instance from storage dictionary"""
-        # Handle datetime deserialization
-        for field_name, field_info in cls.model_fields.items():
-            if field_name in data and field_info.annotation == datetime and isinstance(data[field_name], str):
-                data[field_name] = datetime.fromisoformat(data[field_name])
-
-        return cls(**data)
+    def from_storage_dict(cls, data: dict[str, Any], trusted: bool = False) -> "StorageModel":
+        """Create instance from storage dictionary.
+
+        Args:
+            data: Storage dictionary
+            trusted: The record was written by this model to our own storage,
+                so validation is skipped (see ``ModelCodec.load``)
+        """
+        return cls.get_codec().load(data, trusted)
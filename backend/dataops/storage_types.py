@@ -25,6 +25,14 @@ class StorageType(Enum):
     FILE = "file"  # File-based storage (local/S3/etc)
 
 
+class ReadConsistency(str, Enum):
+    """Consistency levels for storage reads"""
+
+    STRONG = "strong"  # Linearizable read in a regular transaction
+    READ_ONLY = "read_only"  # Read-only transaction at the latest timestamp
+    BEST_EFFORT = "best_effort"  # Possibly stale read without a timestamp round trip
+
+
 class StorageConfig(IPConfig):
     """Configuration for storage backends"""
 
@@ -2,20 +2,43 @@
 Unified CRUD API with automatic storage synchronization
 """
 import asyncio
+import time
+import weakref
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from typing import Any, TypeVar
 
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from .batch_loader import batch_loading, load_by_id
+from .circuit_breaker import CircuitBreaker, get_circuit_breaker
 from .dao import BaseDAO
-from .exceptions import StorageError
+from .exceptions import CircuitOpenError, StorageError
+from .operation_log import DEFAULT_OPERATIONS_LOG_SIZE, OperationLog, StorageOperation
+from .outbox import SyncOutbox, get_outbox
+from .read_routing import ReadRouter, get_read_router
+from .reconciliation import Reconciler, ReconcileReport
 from .security_model import Permission, SecuredStorageModel, SecurityContext
+from .session import get_current_session
 from .storage_model import StorageModel
+from .storage_types import StorageType
 
-T = TypeVar("T", bound=StorageModel)
 S = TypeVar("S", bound=SecuredStorageModel)
 
+# Read-through cache defaults, overridable per model via Meta.options["cache_ttl"] / ["cache_negative_ttl"]
+DEFAULT_CACHE_TTL = 300
+DEFAULT_NEGATIVE_CACHE_TTL = 30
+# Marks a cached "not found" result
+NEGATIVE_CACHE_MARKER = "_dataops_missing"
+# Items per DAO bulk call, overridable per model via Meta.options["bulk_chunk_size"]
+DEFAULT_BULK_CHUNK_SIZE = 1000
+# Operations counted in the metrics but not kept in the operations log
+READ_OPERATIONS = frozenset({"read", "find"})
+
 
 class SyncStrategy(str, Enum):
     """Synchronization strategies for multi-storage operations"""
@@ -26,29 +49,79 @@ class SyncStrategy(str, Enum):
     EVENTUAL = "eventual"  # Async background sync
 
 
-class StorageOperation(BaseModel):
-    """Represents an operation on a storage backend"""
+class BulkResult(BaseModel):
+    """Per-item outcome of a bulk operation"""
+
+    succeeded: list[str] = Field(default_factory=list)
+    failed: dict[str, str] = Field(default_factory=dict)  # item ID (or "#index" for invalid input) -> error
+    count: int = 0  # records created or deleted in the primary storage
+
 
-    storage_name: str
-    operation: str  # create, update, delete, etc.
-    data: dict[str, Any] = Field(default_factory=dict)
-    status: str = "pending"  # pending, success, failed
-    error: str | None = None
-    result: Any = None
+@dataclass
+class PendingWrite:
+    """Updates to one record buffered in write-behind mode"""
 
+    instance: Any  # Record with every buffered patch applied
+    storages: tuple[str, ...]  # Target storages (empty: all)
+    patch: dict[str, Any] = field(default_factory=dict)  # Merged patches, newest value wins
+    timer: asyncio.TimerHandle | None = None
 
-class UnifiedCRUD:
+
+class UnifiedCRUD[T: StorageModel]:
     """
     Unified CRUD operations across multiple storage backends
     with automatic synchronization and security
     """
 
-    def __init__(self, model_cls: type[T], sync_strategy: SyncStrategy = SyncStrategy.PRIMARY_FIRST, security_enabled: bool = True):
+    def __init__(
+        self,
+        model_cls: type[T],
+        sync_strategy: SyncStrategy = SyncStrategy.PRIMARY_FIRST,
+        security_enabled: bool = True,
+        outbox: SyncOutbox | None = None,
+        read_router: ReadRouter | None = None,
+        write_behind_window: float | None = None,
+    ):
         self.model_cls = model_cls
         self.sync_strategy = sync_strategy
+        # Durable queue for EVENTUAL secondary writes
+        self.outbox = outbox or (get_outbox() if sync_strategy == SyncStrategy.EVENTUAL else None)
+        if self.outbox:
+            self.outbox.register(model_cls)
         self.security_enabled = security_enabled and issubclass(model_cls, SecuredStorageModel)
-        self._operations_log: list[StorageOperation] = []
         self._connected_daos: set[str] = set()
+        # In-flight primary reads shared by concurrent callers (singleflight)
+        self._inflight_reads: dict[tuple[str, str, str], asyncio.Future] = {}
+        self._read_stats = {"reads": 0, "backend_reads": 0, "coalesced": 0, "errors": 0}
+
+        # CACHE-type storages act as a read-through tier in front of the other storages
+        storage_configs = model_cls.get_storage_configs()
+        cache_storages = [name for name, config in storage_configs.items() if config.storage_type == StorageType.CACHE]
+        self._cache_storages = cache_storages if len(cache_storages) < len(storage_configs) else []
+        options = model_cls.get_metadata().options
+        # Recent writes (Meta.options["operations_log_size"]) and per-storage metrics
+        self._operations_log = OperationLog(int(options.get("operations_log_size", DEFAULT_OPERATIONS_LOG_SIZE)))
+        self.cache_ttl = int(options.get("cache_ttl", DEFAULT_CACHE_TTL))
+        self.negative_cache_ttl = int(options.get("cache_negative_ttl", DEFAULT_NEGATIVE_CACHE_TTL))
+        self._cache_stats = {"hits": 0, "misses": 0, "negative_hits": 0, "fills": 0, "invalidations": 0, "errors": 0}
+
+        # Storages besides the primary that may serve reads (Meta.options["read_replicas"]), ranked by latency
+        self.read_router = read_router or get_read_router()
+        self._read_replicas = [name for name in options.get("read_replicas", []) if name in storage_configs and name not in self._cache_storages]
+        self.hedged_reads = bool(options.get("hedged_reads", False))
+        self._routing_stats = {"routed": 0, "hedged": 0, "fallbacks": 0}
+
+        # Circuit breaker settings for this model's DAOs (Meta.options["circuit_breaker"])
+        self._breaker_settings: dict[str, Any] = dict(options.get("circuit_breaker", {}))
+
+        # Write-behind: updates are buffered per record and written once per window
+        # (Meta.options["write_behind_window"] in seconds; None writes immediately)
+        window = write_behind_window if write_behind_window is not None else options.get("write_behind_window")
+        self.write_behind_window: float | None = float(window) if window is not None else None
+        self._pending_writes: dict[str, PendingWrite] = {}
+        self._flush_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._write_behind_stats = {"updates": 0, "coalesced": 0, "flushes": 0, "failed_flushes": 0, "pending_reads": 0}
 
     async def _ensure_dao_connected(self, dao: BaseDAO, name: str) -> None:
         """Ensure a DAO is connected before use"""
@@ -56,6 +129,55 @@ class UnifiedCRUD:
             await dao.connect()
             self._connected_daos.add(name)
 
+    def _breaker(self, storage_name: str, dao: BaseDAO) -> CircuitBreaker:
+        """Get the circuit breaker guarding a storage's DAO"""
+        return get_circuit_breaker(dao, f"{self.model_cls.__name__}.{storage_name}", **self._breaker_settings)
+
+    async def _guarded(
+        self,
+        storage_name: str,
+        dao: BaseDAO,
+        operation: str,
+        func: Callable[[], Awaitable[Any]],
+        adaptive_timeout: bool = True,
+        item_id: str | None = None,
+    ) -> Any:
+        """Run a DAO call through the storage's circuit breaker (fails fast while open).
+
+        The outcome and latency go to the operation metrics; writes are also
+        kept in the operations log.
+        """
+        started = time.perf_counter()
+        status, error = "failed", None
+        try:
+            result = await self._breaker(storage_name, dao).call(func, adaptive_timeout)
+            status = "success"
+        except CircuitOpenError as e:
+            status, error = "skipped", str(e)
+            raise
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            if operation in READ_OPERATIONS:
+                self._operations_log.observe(storage_name, operation, status, time.perf_counter() - started)
+            else:
+                self._operations_log.record(storage_name, operation, status, time.perf_counter() - started, item_id, error)
+        return result
+
+    def get_circuit_stats(self) -> dict[str, dict[str, Any]]:
+        """Get circuit breaker state, timeout and counters per storage"""
+        return {name: self._breaker(name, dao).get_stats() for name, dao in self.model_cls.get_all_daos().items()}
+
+    def _primary_storage_name(self) -> str:
+        """Get the first configured storage that is not part of the cache tier"""
+        return next(name for name in self.model_cls.get_storage_configs() if name not in self._cache_storages)
+
+    def _target_daos(self, storages: list[str] | None) -> dict[str, BaseDAO]:
+        """Get DAOs to write to (cache storages are kept by the read-through tier)"""
+        all_daos = self.model_cls.get_all_daos()
+        return {name: dao for name, dao in all_daos.items() if name not in self._cache_storages and (not storages or name in storages)}
+
     async def create(self, data: dict[str, Any], context: SecurityContext | None = None, storages: list[str] | None = None) -> T:
         """
         Create instance across specified or all configured storages
@@ -71,18 +193,26 @@ class UnifiedCRUD:
             instance = self.model_cls(**data)
 
         # Get target storages
-        all_daos = self.model_cls.get_all_daos()
-        target_daos = {name: dao for name, dao in all_daos.items() if not storages or name in storages}
+        target_daos = self._target_daos(storages)
 
         # Execute based on strategy
         if self.sync_strategy == SyncStrategy.SEQUENTIAL:
-            return await self._create_sequential(instance, target_daos)
-        if self.sync_strategy == SyncStrategy.PARALLEL:
-            return await self._create_parallel(instance, target_daos)
-        if self.sync_strategy == SyncStrategy.PRIMARY_FIRST:
-            return await self._create_primary_first(instance, target_daos)
-        # EVENTUAL
-        return await self._create_eventual(instance, target_daos)
+            instance = await self._create_sequential(instance, target_daos)
+        elif self.sync_strategy == SyncStrategy.PARALLEL:
+            instance = await self._create_parallel(instance, target_daos)
+        elif self.sync_strategy == SyncStrategy.PRIMARY_FIRST:
+            instance = await self._create_primary_first(instance, target_daos)
+        else:
+            # EVENTUAL
+            instance = await self._create_eventual(instance, target_daos)
+
+        # Write-through, replacing any cached "not found"
+        await self._cache_fill(instance.id, instance)
+        instance._mark_stored()
+        session = get_current_session()
+        if session is not None:
+            session.register(self.model_cls, instance.id, instance)
+        return instance
 
     async def _create_sequential(self, instance: T, daos: dict[str, BaseDAO]) -> T:
         """Create sequentially in each storage"""
@@ -90,26 +220,19 @@ class UnifiedCRUD:
             # Ensure DAO is connected
             await self._ensure_dao_connected(dao, storage_name)
 
-            operation = StorageOperation(storage_name=storage_name, operation="create", data=instance.to_storage_dict())
             try:
-                result_id = await dao.create(instance)
-                operation.status = "success"
-                operation.result = result_id
+                result_id = await self._guarded(storage_name, dao, "create", partial(dao.create, instance), item_id=instance.id)
 
                 # Update instance ID from first successful create
                 if not instance.id:
                     instance_dict = instance.to_storage_dict()
                     instance_dict["id"] = result_id
-                    instance = self.model_cls.from_storage_dict(instance_dict)  # type: ignore[assignment]
+                    instance = self.model_cls.from_storage_dict(instance_dict, trusted=True)  # type: ignore[assignment]
             except Exception as e:
-                operation.status = "failed"
-                operation.error = str(e)
                 logger.error(f"Failed to create in {storage_name}: {e}")
                 # Rollback previous creates
                 await self._rollback_creates(instance.id, daos, storage_name)
                 raise StorageError(f"Create failed in {storage_name}: {e}") from e
-            finally:
-                self._operations_log.append(operation)
 
         return instance
 
@@ -137,7 +260,7 @@ class UnifiedCRUD:
         if not instance.id and results:
             instance_dict = instance.to_storage_dict()
             instance_dict["id"] = str(results[0])  # Ensure ID is string
-            instance = self.model_cls.from_storage_dict(instance_dict)  # type: ignore[assignment]
+            instance = self.model_cls.from_storage_dict(instance_dict, trusted=True)  # type: ignore[assignment]
 
         return instance
 
@@ -151,23 +274,15 @@ class UnifiedCRUD:
         await self._ensure_dao_connected(primary_dao, primary_name)
 
         # Create in primary
-        operation = StorageOperation(storage_name=primary_name, operation="create", data=instance.to_storage_dict())
-
         try:
-            result_id = await primary_dao.create(instance)
-            # Create new instance with the ID (can't modify frozen Pydantic model)
-            instance_dict = instance.to_storage_dict()
-            instance_dict["id"] = result_id
-            instance = self.model_cls.from_storage_dict(instance_dict)  # type: ignore[assignment]
-            operation.status = "success"
-            operation.result = result_id
+            result_id = await self._guarded(primary_name, primary_dao, "create", lambda: primary_dao.create(instance), item_id=instance.id)
         except Exception as e:
-            operation.status = "failed"
-            operation.error = str(e)
-            self._operations_log.append(operation)
             raise StorageError(f"Primary create failed: {e}") from e
 
-        self._operations_log.append(operation)
+        # Create new instance with the ID (can't modify frozen Pydantic model)
+        instance_dict = instance.to_storage_dict()
+        instance_dict["id"] = result_id
+        instance = self.model_cls.from_storage_dict(instance_dict, trusted=True)  # type: ignore[assignment]
 
         # Create in other storages in parallel
         other_daos = {k: v for k, v in daos.items() if k != primary_name}
@@ -192,16 +307,16 @@ class UnifiedCRUD:
         primary_name = next(iter(daos.keys()))
         primary_dao = daos[primary_name]
 
-        result_id = await primary_dao.create(instance)
+        await self._ensure_dao_connected(primary_dao, primary_name)
+        result_id = await self._guarded(primary_name, primary_dao, "create", lambda: primary_dao.create(instance), item_id=instance.id)
         # Create new instance with ID
         instance_dict = instance.to_storage_dict()
         instance_dict["id"] = result_id
-        instance = self.model_cls.from_storage_dict(instance_dict)  # type: ignore[assignment]
+        instance = self.model_cls.from_storage_dict(instance_dict, trusted=True)  # type: ignore[assignment]
 
-        # Schedule background sync for other storages
-        other_daos = {k: v for k, v in daos.items() if k != primary_name}
-        if other_daos:
-            asyncio.create_task(self._background_sync_create(instance, other_daos))
+        # Queue durable sync for other storages
+        other_names = [name for name in daos if name != primary_name]
+        await self.outbox.enqueue(self.model_cls, "create", result_id, instance.to_storage_dict(), other_names)  # type: ignore[union-attr]
 
         return instance
 
@@ -210,28 +325,7 @@ class UnifiedCRUD:
         # Ensure DAO is connected
         await self._ensure_dao_connected(dao, storage_name)
 
-        operation = StorageOperation(storage_name=storage_name, operation="create", data=instance.to_storage_dict())
-
-        try:
-            result_id = await dao.create(instance)
-            operation.status = "success"
-            operation.result = result_id
-            return result_id
-        except Exception as e:
-            operation.status = "failed"
-            operation.error = str(e)
-            raise e
-        finally:
-            self._operations_log.append(operation)
-
-    async def _background_sync_create(self, instance: T, daos: dict[str, BaseDAO]):
-        """Background task for eventual consistency"""
-        for storage_name, dao in daos.items():
-            try:
-                await dao.create(instance)
-                logger.info(f"Background sync completed for {storage_name}")
-            except Exception as e:
-                logger.error(f"Background sync failed for {storage_name}: {e}")
+        return await self._guarded(storage_name, dao, "create", lambda: dao.create(instance), item_id=instance.id)
 
     async def _rollback_creates(self, instance_id: str, daos: dict[str, BaseDAO], failed_at: str | None):
         """Rollback successful creates before failure"""
@@ -252,21 +346,217 @@ class UnifiedCRUD:
             raise ValueError("Security context required when security is enabled")
             # In real implementation, check permissions here
 
-        # Get the DAO for the storage
+        # Read-your-writes for updates still buffered in write-behind mode
+        pending = self._pending_writes.get(item_id)
+        if pending is not None:
+            self._write_behind_stats["pending_reads"] += 1
+            return pending.instance
+
+        # An explicit storage bypasses the cache tier, routing and the session
         if storage_name:
-            dao = self.model_cls.get_dao(storage_name)
+            return await self._read_coalesced(storage_name, item_id, lambda: self._load_from(storage_name, item_id))
+
+        # Each record is loaded once per session (identity map)
+        session = get_current_session()
+        if session is not None:
+            known, instance = session.lookup(self.model_cls, item_id)
+            if known:
+                return instance  # type: ignore[return-value]
+
+        if self._cache_storages:
+            instance = await self._read_coalesced(self._cache_storages[0], item_id, lambda: self._read_through(item_id))
         else:
-            # Use primary storage
-            all_daos = self.model_cls.get_all_daos()
-            primary_name = next(iter(all_daos.keys()))
-            dao = all_daos[primary_name]
-            storage_name = primary_name
+            instance = await self._read_coalesced(self._primary_storage_name(), item_id, lambda: self._load_routed(item_id))
 
-        # Ensure DAO is connected
-        await self._ensure_dao_connected(dao, storage_name)
+        if session is not None:
+            return session.register(self.model_cls, item_id, instance)  # type: ignore[return-value]
+        return instance
+
+    async def _read_coalesced(self, storage_name: str, item_id: str, fetch: Callable[[], Awaitable[Any]]) -> T | None:
+        """Read by ID, sharing one backend call among concurrent readers of the same record.
 
-        # Get the instance
-        return await dao.find_by_id(item_id)
+        The backend call runs in its own task so a cancelled waiter does not
+        cancel it for the others; its result or error is fanned out to every
+        waiter. Waiters that joined a running call get a deep copy, so one
+        caller's edits cannot reach the others or the cache tier.
+        """
+        self._read_stats["reads"] += 1
+        key = (self.model_cls.__name__, storage_name, item_id)
+
+        pending = self._inflight_reads.get(key)
+        if pending is not None:
+            self._read_stats["coalesced"] += 1
+            shared = await asyncio.shield(pending)
+            return shared.model_copy(deep=True) if shared is not None else None
+
+        pending = asyncio.ensure_future(fetch())
+        self._inflight_reads[key] = pending
+        self._read_stats["backend_reads"] += 1
+        pending.add_done_callback(lambda future: self._finish_read(key, future))
+        return await asyncio.shield(pending)
+
+    def _finish_read(self, key: tuple[str, str, str], future: asyncio.Future) -> None:
+        """Drop a completed in-flight read and count failures."""
+        if self._inflight_reads.get(key) is future:
+            del self._inflight_reads[key]
+        if not future.cancelled() and future.exception() is not None:
+            self._read_stats["errors"] += 1
+
+    def get_read_stats(self) -> dict[str, int]:
+        """Get read coalescing counters"""
+        return {**self._read_stats, "in_flight": len(self._inflight_reads)}
+
+    async def _read_through(self, item_id: str) -> T | None:
+        """Read from the cache tier, falling back to the storages and filling the cache"""
+        cached = await self._cache_get(item_id)
+        if cached is not None:
+            if cached.get(NEGATIVE_CACHE_MARKER):
+                self._cache_stats["negative_hits"] += 1
+                return None
+            self._cache_stats["hits"] += 1
+            return self.model_cls.from_storage_dict(cached, trusted=True)  # type: ignore[return-value]
+
+        self._cache_stats["misses"] += 1
+        instance: T | None = await self._load_routed(item_id)
+        await self._cache_fill(item_id, instance)
+        return instance
+
+    async def _load_from(self, storage_name: str, item_id: str) -> T | None:
+        """Load a record from one storage, reporting latency and outcome to the router"""
+        dao = self.model_cls.get_dao(storage_name)
+        started = time.perf_counter()
+        try:
+            await self._ensure_dao_connected(dao, storage_name)
+            # Batched with other concurrent lookups when a loader is active
+            result: T | None = await self._guarded(storage_name, dao, "read", lambda: load_by_id(dao, item_id, storage_name))
+        except asyncio.CancelledError:
+            # A hedged read that lost the race was at least this slow
+            self.read_router.record(self.model_cls.__name__, storage_name, time.perf_counter() - started, ok=True)
+            raise
+        except Exception:
+            self.read_router.record(self.model_cls.__name__, storage_name, time.perf_counter() - started, ok=False)
+            raise
+        self.read_router.record(self.model_cls.__name__, storage_name, time.perf_counter() - started, ok=True)
+        return result
+
+    async def _load_routed(self, item_id: str) -> T | None:
+        """Load a record from the best-ranked replica, falling back to the primary storage.
+
+        A replica that fails or does not have the record is backed up by the
+        primary (ground truth). With hedged reads, a second storage is asked
+        when the first misses its p95 deadline and the first answer wins.
+        """
+        primary_name = self._primary_storage_name()
+        if not self._read_replicas:
+            return await self._load_from(primary_name, item_id)
+
+        order = self.read_router.rank(self.model_cls.__name__, [primary_name, *self._read_replicas], primary_name)
+        self._routing_stats["routed"] += 1
+        attempted = {order[0]}
+        result: T | None
+        try:
+            if self.hedged_reads and len(order) > 1:
+                attempted.add(order[1])
+                storage_name, result = await self._load_hedged(order[0], order[1], item_id)
+            else:
+                storage_name, result = order[0], await self._load_from(order[0], item_id)
+        except Exception as e:
+            if primary_name in attempted:
+                raise
+            logger.warning(f"Replica read of {item_id} failed, falling back to {primary_name}: {e}")
+            storage_name, result = order[0], None
+
+        if result is None and storage_name != primary_name:
+            self._routing_stats["fallbacks"] += 1
+            return await self._load_from(primary_name, item_id)
+        return result
+
+    async def _load_hedged(self, first: str, second: str, item_id: str) -> tuple[str, T | None]:
+        """Read from ``first``, also asking ``second`` if ``first`` misses its p95 deadline.
+
+        Returns:
+            Storage that answered first without error, and its result
+        """
+        deadline = self.read_router.hedge_deadline(self.model_cls.__name__, first)
+        first_task: asyncio.Future[T | None] = asyncio.ensure_future(self._load_from(first, item_id))
+        if deadline is None:
+            return first, await first_task
+
+        done, _ = await asyncio.wait({first_task}, timeout=deadline)
+        if done:
+            return first, first_task.result()
+
+        self._routing_stats["hedged"] += 1
+        tasks = {first_task: first, asyncio.ensure_future(self._load_from(second, item_id)): second}
+        pending = set(tasks)
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return tasks[task], task.result()
+                    error = task.exception()
+            raise error  # type: ignore[misc]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def get_routing_stats(self) -> dict[str, Any]:
+        """Get read routing counters and per-storage latency and error rates of this model"""
+        prefix = f"{self.model_cls.__name__}."
+        storages = {key.removeprefix(prefix): value for key, value in self.read_router.get_stats().items() if key.startswith(prefix)}
+        return {**self._routing_stats, "storages": storages}
+
+    async def _cache_get(self, item_id: str) -> dict[str, Any] | None:
+        """Look up a cached record; cache failures count as misses"""
+        cache_name = self._cache_storages[0]
+        try:
+            cache_dao: Any = self.model_cls.get_dao(cache_name)
+            await self._ensure_dao_connected(cache_dao, cache_name)
+            return await cache_dao.get_cached(item_id)
+        except Exception as e:
+            self._cache_stats["errors"] += 1
+            logger.warning(f"Cache read failed in {cache_name} for {item_id}: {e}")
+            return None
+
+    async def _cache_fill(self, item_id: str, instance: T | None) -> None:
+        """Cache a record, or a short-lived "not found" marker when it is None"""
+        if not self._cache_storages or not item_id:
+            return
+
+        if instance is None:
+            data, ttl = {"id": item_id, NEGATIVE_CACHE_MARKER: True}, self.negative_cache_ttl
+        else:
+            data, ttl = instance.to_storage_dict(), self.cache_ttl
+
+        for cache_name in self._cache_storages:
+            try:
+                cache_dao: Any = self.model_cls.get_dao(cache_name)
+                await self._ensure_dao_connected(cache_dao, cache_name)
+                await cache_dao.set_cached(item_id, data, ttl)
+                self._cache_stats["fills"] += 1
+            except Exception as e:
+                self._cache_stats["errors"] += 1
+                logger.warning(f"Cache fill failed in {cache_name} for {item_id}: {e}")
+
+    async def _cache_invalidate(self, item_id: str) -> None:
+        """Drop a record from every cache storage"""
+        for cache_name in self._cache_storages:
+            try:
+                cache_dao = self.model_cls.get_dao(cache_name)
+                await self._ensure_dao_connected(cache_dao, cache_name)
+                await cache_dao.delete(item_id)
+                self._cache_stats["invalidations"] += 1
+            except Exception as e:
+                self._cache_stats["errors"] += 1
+                logger.warning(f"Cache invalidation failed in {cache_name} for {item_id}: {e}")
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get read-through cache counters and hit ratio"""
+        lookups = self._cache_stats["hits"] + self._cache_stats["negative_hits"] + self._cache_stats["misses"]
+        hits = self._cache_stats["hits"] + self._cache_stats["negative_hits"]
+        return {**self._cache_stats, "hit_ratio": hits / lookups if lookups else 0.0}
 
     async def get(self, item_id: str, storage_name: str | None = None) -> T | None:
         """Get instance by ID (convenience method without security context)"""
@@ -276,7 +566,14 @@ class UnifiedCRUD:
         return await self.read(item_id, context=None, storage_name=storage_name)
 
     async def update(self, instance_id: str, data: dict[str, Any], context: SecurityContext | None = None, storages: list[str] | None = None) -> T:
-        """Update instance across storages"""
+        """Update instance across storages.
+
+        The patch is merged into the instance read for the existence and
+        permission checks and the merged instance is returned without reading
+        it back. Secondary storage failures are logged, not raised.
+
+        In write-behind mode the patch is only buffered; see ``flush_writes``.
+        """
         # Get instance from primary storage
         instance: T | None = await self.read(instance_id, context)
         if not instance:
@@ -290,54 +587,230 @@ class UnifiedCRUD:
                 raise PermissionError("No write permission")
             data["modified_by"] = context.user_id
 
-        # Update based on strategy
-        all_daos = self.model_cls.get_all_daos()
-        target_daos = {name: dao for name, dao in all_daos.items() if not storages or name in storages}
+        # Validate the patch before writing anywhere
+        updated = self.model_cls.model_validate({**instance.model_dump(), **data})
 
-        # Execute updates
-        if self.sync_strategy == SyncStrategy.PARALLEL:
-            tasks = []
-            for _storage_name, dao in target_daos.items():
-                tasks.append(dao.update(instance_id, data))
-            await asyncio.gather(*tasks)
+        if self.write_behind_window is not None:
+            await self._buffer_update(instance_id, data, updated, storages)
         else:
-            for _storage_name, dao in target_daos.items():
-                await dao.update(instance_id, data)
+            await self._apply_update(instance_id, data, storages)
+        updated._mark_stored()
 
-        # Return updated instance
-        return await self.read(instance_id, context)
+        session = get_current_session()
+        if session is not None:
+            session.register(self.model_cls, instance_id, updated)
+        return updated
+
+    async def _apply_update(self, instance_id: str, data: dict[str, Any], storages: list[str] | None) -> None:
+        """Write a patch to the storages following the sync strategy.
+
+        Raises:
+            StorageError: The primary storage write failed
+            ValueError: The primary storage does not have the instance
+        """
+        target_daos = self._target_daos(storages)
+        try:
+            results = await self._write_with_strategy("update", instance_id, target_daos, lambda dao: dao.update(instance_id, data), data)
+        finally:
+            # Also after partial failures, the cached copy may be stale
+            await self._cache_invalidate(instance_id)
+
+        primary_name = next(iter(results), None)
+        if primary_name is not None and isinstance(results[primary_name], Exception):
+            raise StorageError(f"Update failed in {primary_name}: {results[primary_name]}") from results[primary_name]
+        if primary_name is not None and results[primary_name] is False:
+            raise ValueError(f"Instance {instance_id} not found in {primary_name}")
+
+    async def _buffer_update(self, instance_id: str, data: dict[str, Any], updated: T, storages: list[str] | None) -> None:
+        """Merge a patch into the record's pending write, starting its flush timer on the first one"""
+        self._write_behind_stats["updates"] += 1
+        key = tuple(storages or ())
+        pending = self._pending_writes.get(instance_id)
+        if pending is not None and pending.storages != key:
+            # Patches for different storages cannot share one write
+            await self.flush_writes(instance_id)
+            pending = None
+
+        if pending is None:
+            pending = PendingWrite(instance=updated, storages=key)
+            pending.timer = asyncio.get_running_loop().call_later(self.write_behind_window, self._start_flush, instance_id)  # type: ignore[arg-type]
+            self._pending_writes[instance_id] = pending
+        else:
+            self._write_behind_stats["coalesced"] += 1
+        pending.patch.update(data)
+        pending.instance = updated
+
+    def _start_flush(self, instance_id: str) -> None:
+        """Flush a record whose window has passed (timer callback)"""
+        task = asyncio.ensure_future(self._flush_pending(instance_id))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Write-behind flush of {self.model_cls.__name__} failed: {task.exception()}")
+
+    async def _flush_pending(self, instance_id: str) -> None:
+        """Write a record's buffered patch, after any earlier flush of the same record"""
+        lock = self._flush_locks.get(instance_id)
+        if lock is None:
+            lock = self._flush_locks[instance_id] = asyncio.Lock()
+
+        async with lock:
+            pending = self._pending_writes.pop(instance_id, None)
+            if pending is None:
+                return
+            if pending.timer is not None:
+                pending.timer.cancel()
+
+            self._write_behind_stats["flushes"] += 1
+            try:
+                await self._apply_update(instance_id, pending.patch, list(pending.storages) or None)
+            except Exception:
+                self._write_behind_stats["failed_flushes"] += 1
+                raise
+
+    async def flush_writes(self, instance_id: str | None = None) -> None:
+        """Write buffered updates now instead of at the end of their window.
+
+        Also waits for flushes already in progress, so the storages hold every
+        update made before the call once it returns.
+
+        Args:
+            instance_id: Flush only this record (default: all)
+
+        Raises:
+            StorageError: A primary storage write failed (the patch is dropped)
+        """
+        instance_ids = [instance_id] if instance_id is not None else list({*self._pending_writes, *self._flush_locks.keys()})
+        outcomes = await asyncio.gather(*(self._flush_pending(item_id) for item_id in instance_ids), return_exceptions=True)
+        errors = {item_id: outcome for item_id, outcome in zip(instance_ids, outcomes, strict=True) if isinstance(outcome, Exception)}
+        if errors:
+            raise StorageError(f"Write-behind flush failed for {len(errors)} {self.model_cls.__name__} records: {errors}")
+
+    def get_write_behind_stats(self) -> dict[str, Any]:
+        """Get write-behind counters, buffered record count and writes saved per flush"""
+        stats = self._write_behind_stats
+        return {**stats, "pending": len(self._pending_writes), "amplification_saved": stats["updates"] / stats["flushes"] if stats["flushes"] else 0.0}
 
     async def delete(self, instance_id: str, context: SecurityContext | None = None, storages: list[str] | None = None) -> bool:
-        """Delete instance from storages"""
-        # Get instance for security check
-        instance: Any = await self.read(instance_id, context)
-        if not instance:
-            return False
+        """Delete instance from storages.
 
-        # Security check
+        Only secured models are read first (for the permission check).
+
+        Returns:
+            True if every storage deleted the instance
+        """
         if self.security_enabled:
             if not context:
                 raise ValueError("Security context required")
-            if hasattr(instance, "check_permission") and not await instance.check_permission(context, Permission.DELETE):  # type: ignore[attr-defined]
+
+            # Get instance for security check
+            instance: Any = await self.read(instance_id, context)
+            if not instance:
+                return False
+            if hasattr(instance, "check_permission") and not await instance.check_permission(context, Permission.DELETE):
                 raise PermissionError("No delete permission")
 
+        # Buffered updates of a deleted record are moot
+        pending = self._pending_writes.pop(instance_id, None)
+        if pending is not None and pending.timer is not None:
+            pending.timer.cancel()
+
         # Delete from storages
-        all_daos = self.model_cls.get_all_daos()
-        target_daos = {name: dao for name, dao in all_daos.items() if not storages or name in storages}
+        target_daos = self._target_daos(storages)
+        results = await self._write_with_strategy("delete", instance_id, target_daos, lambda dao: dao.delete(instance_id))
+
+        await self._cache_invalidate(instance_id)
+        session = get_current_session()
+        if session is not None:
+            session.forget(self.model_cls, instance_id)
+        return bool(results) and all(result is True for result in results.values())
+
+    async def _write_with_strategy(  # noqa: C901
+        self, operation: str, instance_id: str, daos: dict[str, BaseDAO], call: Callable[[BaseDAO], Awaitable[Any]], payload: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Run a write against each storage following the sync strategy.
+
+        SEQUENTIAL writes one storage after another and stops at the first
+        failure; PARALLEL writes all at once. PRIMARY_FIRST writes the primary
+        (first) storage and then all others concurrently; EVENTUAL queues the
+        others (with ``payload``) in the outbox.
+
+        Returns:
+            Result or exception by storage name (queued writes excluded)
+        """
 
-        success = True
-        for storage_name, dao in target_daos.items():
+        async def run(storage_name: str, dao: BaseDAO) -> Any:
+            await self._ensure_dao_connected(dao, storage_name)
             try:
-                result = await dao.delete(instance_id)
-                success = success and result
+                return await self._guarded(storage_name, dao, operation, lambda: call(dao), item_id=instance_id)
+            except CircuitOpenError as e:
+                logger.warning(f"{operation.capitalize()} of {instance_id} skipped in {storage_name}: {e}")
+                return e
             except Exception as e:
-                logger.error(f"Delete failed in {storage_name}: {e}")
-                success = False
+                logger.error(f"{operation.capitalize()} of {instance_id} failed in {storage_name}: {e}")
+                return e
 
-        return success
+        names = list(daos)
+        if not names:
+            return {}
+
+        if self.sync_strategy == SyncStrategy.PARALLEL:
+            return dict(zip(names, await asyncio.gather(*(run(name, daos[name]) for name in names)), strict=True))
+
+        results: dict[str, Any] = {}
+        if self.sync_strategy == SyncStrategy.SEQUENTIAL:
+            for name in names:
+                results[name] = await run(name, daos[name])
+                if isinstance(results[name], Exception):
+                    break
+            return results
+
+        primary_name, secondary_names = names[0], names[1:]
+        results[primary_name] = await run(primary_name, daos[primary_name])
+        if isinstance(results[primary_name], Exception) or not secondary_names:
+            return results
+
+        if self.sync_strategy == SyncStrategy.EVENTUAL:
+            await self.outbox.enqueue(self.model_cls, operation, instance_id, payload or {}, secondary_names)  # type: ignore[union-attr]
+            return results
+
+        results.update(zip(secondary_names, await asyncio.gather(*(run(name, daos[name]) for name in secondary_names)), strict=True))
+        return results
+
+    async def find(
+        self,
+        query: dict[str, Any],
+        context: SecurityContext | None = None,
+        primary_only: bool = True,
+        timeout: float | None = None,
+        first_k: int | None = None,
+        **kwargs,
+    ) -> list[T]:
+        """Find instances with optional security filtering.
+
+        With ``primary_only=False`` all storages are queried concurrently
+        (see ``find_stream``), so the query takes as long as the slowest
+        storage rather than the sum of all.
+
+        Args:
+            query: Query filter
+            context: Security context
+            primary_only: Query only the primary storage
+            timeout: Per-storage timeout in seconds for multi-storage finds
+                (default: Meta.options["find_timeout"])
+            first_k: Return as soon as this many results are merged
+            **kwargs: Passed to the DAOs' find (limit, skip)
+
+        Returns:
+            Matching instances
+        """
+        # Storages must see buffered updates before they are queried
+        if self._pending_writes:
+            await self.flush_writes()
 
-    async def find(self, query: dict[str, Any], context: SecurityContext | None = None, primary_only: bool = True, **kwargs) -> list[T]:
-        """Find instances with optional security filtering"""
         if self.security_enabled and context:
             # Use security-aware find
             if hasattr(self.model_cls, "find_with_security"):
@@ -347,37 +820,387 @@ class UnifiedCRUD:
         # Regular find
         if primary_only:
             # Query only primary storage
-            dao = self.model_cls.get_dao()
-            return await dao.find(query, **kwargs)
-        # Query all storages and merge results
-        all_daos = self.model_cls.get_all_daos()
-        all_results = []
-        seen_ids = set()
+            primary_name = self._primary_storage_name()
+            dao = self.model_cls.get_dao(primary_name)
+            return await self._guarded(primary_name, dao, "find", lambda: dao.find(query, **kwargs))
 
-        for dao in all_daos.values():
-            results = await dao.find(query, **kwargs)
-            for result in results:
-                if result.id not in seen_ids:
-                    all_results.append(result)
-                    seen_ids.add(result.id)
+        # Query all storages and merge results
+        all_results: list[T] = []
+        async with aclosing(self.find_stream(query, timeout, **kwargs)) as stream:
+            async for result in stream:
+                all_results.append(result)
+                if first_k is not None and len(all_results) >= first_k:
+                    break
 
         return all_results
 
+    async def find_stream(self, query: dict[str, Any], timeout: float | None = None, **kwargs) -> AsyncGenerator[T, None]:
+        """Query every storage concurrently and yield merged results.
+
+        Results are yielded in storage-priority order as soon as a storage and
+        all storages before it have answered; the first result per ID wins.
+        Storages that fail or exceed ``timeout`` are skipped. Closing the
+        stream early cancels the queries still running.
+
+        Args:
+            query: Query filter
+            timeout: Per-storage timeout in seconds (default: Meta.options["find_timeout"])
+            **kwargs: Passed to the DAOs' find (limit, skip)
+
+        Yields:
+            Instances, deduplicated by ID
+        """
+        if timeout is None:
+            timeout = self.model_cls.get_metadata().options.get("find_timeout")
+
+        daos = self._target_daos(None)
+        tasks: dict[str, asyncio.Future[list[T] | None]] = {
+            name: asyncio.ensure_future(self._find_in_storage(name, dao, query, timeout, **kwargs)) for name, dao in daos.items()
+        }
+        seen_ids: set[str] = set()
+        failures = 0
+        try:
+            for task in tasks.values():
+                results = await task
+                if results is None:
+                    failures += 1
+                    continue
+                for result in results:
+                    if result.id not in seen_ids:
+                        seen_ids.add(result.id)
+                        yield result
+
+            if tasks and failures == len(tasks):
+                raise StorageError(f"Find failed in every storage of {self.model_cls.__name__}")
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def _find_in_storage(self, storage_name: str, dao: BaseDAO, query: dict[str, Any], timeout: float | None, **kwargs) -> list[T] | None:
+        """Run a find against one storage, returning None if it fails or times out"""
+        try:
+            await self._ensure_dao_connected(dao, storage_name)
+            if timeout is None:
+                return await self._guarded(storage_name, dao, "find", lambda: dao.find(query, **kwargs))
+            return await self._guarded(storage_name, dao, "find", lambda: asyncio.wait_for(dao.find(query, **kwargs), timeout), adaptive_timeout=False)
+        except TimeoutError:
+            logger.warning(f"Find in {storage_name} timed out after {timeout}s; skipping its results")
+        except Exception as e:
+            logger.warning(f"Find in {storage_name} failed; skipping its results: {e}")
+        return None
+
     async def bulk_create(self, items: list[dict[str, Any]], context: SecurityContext | None = None) -> list[str]:
-        """Bulk create multiple instances"""
-        ids: list[str] = []
-        for item in items:
-            instance: Any = await self.create(item, context)
-            ids.append(instance.id)
-        return ids
+        """Bulk create multiple instances, returning the IDs created in every storage"""
+        result = await self.bulk_create_with_report(items, context)
+        return result.succeeded
 
     async def bulk_delete(self, ids: list[str], context: SecurityContext | None = None) -> int:
-        """Bulk delete multiple instances"""
-        count = 0
-        for item_id in ids:
-            if await self.delete(item_id, context):
-                count += 1
-        return count
+        """Bulk delete multiple instances, returning the number deleted from the primary storage"""
+        result = await self.bulk_delete_with_report(ids, context)
+        return result.count
+
+    async def bulk_create_with_report(
+        self, items: list[dict[str, Any]], context: SecurityContext | None = None, storages: list[str] | None = None, chunk_size: int | None = None
+    ) -> BulkResult:
+        """Bulk create with one DAO bulk call per chunk and storage.
+
+        All items are validated up front; invalid ones are reported and
+        skipped. Storages are written in parallel. An item that fails in any
+        storage is reported and removed from the storages it did reach.
+
+        Args:
+            items: Instance data
+            context: Security context (required for secured models)
+            storages: Storages to write (default: all non-cache storages)
+            chunk_size: Items per DAO call (default: Meta.options["bulk_chunk_size"])
+
+        Returns:
+            Created IDs and errors by item
+        """
+        if self.security_enabled and not context:
+            raise ValueError("Security context required for secured models")
+
+        result = BulkResult()
+        instances: dict[str, StorageModel] = {}
+        for index, item in enumerate(items):
+            data = dict(item)
+            if self.security_enabled:
+                data["acl"] = list(data.get("acl", []))
+                SecuredStorageModel.apply_owner_fields(data, context)  # type: ignore[arg-type]
+            try:
+                instance = self.model_cls(**data)
+            except (ValueError, TypeError) as e:
+                result.failed[str(data.get("id") or f"#{index}")] = str(e)
+                continue
+            if instance.id in instances:
+                result.failed[f"#{index}"] = f"Duplicate ID {instance.id}"
+                continue
+            instances[instance.id] = instance  # type: ignore[index]
+
+        if not instances:
+            return result
+
+        target_daos = self._target_daos(storages)
+        outcomes = await asyncio.gather(
+            *(self._bulk_in_storage(name, dao, "create", instances, chunk_size) for name, dao in target_daos.items()), return_exceptions=True
+        )
+        errors = self._merge_bulk_errors(list(target_daos), list(instances), outcomes)
+
+        if errors:
+            # Undo partial writes so storages stay consistent
+            rollback = {item_id: item_id for item_id in errors}
+            await asyncio.gather(
+                *(self._bulk_in_storage(name, dao, "delete", rollback, chunk_size) for name, dao in target_daos.items()), return_exceptions=True
+            )
+            result.failed.update(errors)
+
+        result.succeeded = [item_id for item_id in instances if item_id not in errors]
+        result.count = len(result.succeeded)
+        return result
+
+    async def bulk_delete_with_report(
+        self, ids: list[str], context: SecurityContext | None = None, storages: list[str] | None = None, chunk_size: int | None = None
+    ) -> BulkResult:
+        """Bulk delete with one DAO bulk call per chunk and storage.
+
+        Secured models are read in batches first to check delete permission;
+        non-secured deletes skip the read. Storages are written in parallel.
+
+        Args:
+            ids: IDs to delete
+            context: Security context (required for secured models)
+            storages: Storages to delete from (default: all non-cache storages)
+            chunk_size: IDs per DAO call (default: Meta.options["bulk_chunk_size"])
+
+        Returns:
+            IDs deleted without errors, errors by ID and the primary storage's delete count
+        """
+        result = BulkResult()
+        targets = {item_id: item_id for item_id in dict.fromkeys(ids)}
+
+        if self.security_enabled:
+            if not context:
+                raise ValueError("Security context required")
+            result.failed = await self._check_bulk_delete_permissions(list(targets), context)
+            targets = {item_id: item_id for item_id in targets if item_id not in result.failed}
+
+        if not targets:
+            return result
+
+        target_daos = self._target_daos(storages)
+        outcomes = await asyncio.gather(
+            *(self._bulk_in_storage(name, dao, "delete", targets, chunk_size) for name, dao in target_daos.items()), return_exceptions=True
+        )
+        errors = self._merge_bulk_errors(list(target_daos), list(targets), outcomes)
+        result.failed.update(errors)
+        result.succeeded = [item_id for item_id in targets if item_id not in errors]
+        if outcomes and not isinstance(outcomes[0], BaseException):
+            result.count = outcomes[0][0]
+
+        if self._cache_storages:
+            keys = list(targets)
+            for start in range(0, len(keys), DEFAULT_BULK_CHUNK_SIZE):
+                await asyncio.gather(*(self._cache_invalidate(item_id) for item_id in keys[start : start + DEFAULT_BULK_CHUNK_SIZE]))
+        return result
+
+    async def apply_bulk(  # noqa: C901
+        self,
+        creates: dict[str, T] | None = None,
+        updates: dict[str, dict[str, Any]] | None = None,
+        deletes: list[str] | None = None,
+        storages: list[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> BulkResult:
+        """Write a batch of creates, updates and deletes following the sync strategy.
+
+        Each storage gets one bulk call per chunk and operation, creates first
+        and deletes last. Like single writes, PARALLEL writes all storages at
+        once; the other strategies write the primary storage first and pass on
+        only the items it accepted (SEQUENTIAL storage by storage, PRIMARY_FIRST
+        concurrently, EVENTUAL through the outbox). Buffered write-behind
+        patches of updated records are written first, those of deleted records
+        dropped. Permissions are not checked.
+
+        Args:
+            creates: Instances by ID
+            updates: Changed fields by ID
+            deletes: IDs to delete
+            storages: Storages to write (default: all non-cache storages)
+            chunk_size: Items per DAO call (default: Meta.options["bulk_chunk_size"])
+
+        Returns:
+            Items written to the primary storage and errors by item there
+            (secondary storage failures are logged, not reported)
+        """
+        changes: dict[str, dict[str, Any]] = {
+            "create": dict(creates or {}),
+            "update": {item_id: {**patch, "id": item_id} for item_id, patch in (updates or {}).items()},
+            "delete": {item_id: item_id for item_id in deletes or []},
+        }
+        item_ids = [item_id for items in changes.values() for item_id in items]
+        result = BulkResult()
+        if not item_ids:
+            return result
+
+        await self._settle_buffered(list(changes["update"]), list(changes["delete"]))
+        target_daos = self._target_daos(storages)
+
+        async def apply(storage_name: str, items: dict[str, dict[str, Any]]) -> dict[str, str]:
+            """Write the changes to one storage in order, returning errors by ID"""
+            errors: dict[str, str] = {}
+            for operation, operation_items in items.items():
+                if not operation_items:
+                    continue
+                try:
+                    errors.update((await self._bulk_in_storage(storage_name, target_daos[storage_name], operation, operation_items, chunk_size))[1])
+                except Exception as e:
+                    errors.update(dict.fromkeys(operation_items, str(e)))
+            return errors
+
+        def without(items: dict[str, dict[str, Any]], errors: dict[str, str]) -> dict[str, dict[str, Any]]:
+            return {operation: {key: value for key, value in operation_items.items() if key not in errors} for operation, operation_items in items.items()}
+
+        primary_name, secondary_names = next(iter(target_daos)), list(target_daos)[1:]
+        secondary_errors: dict[str, dict[str, str]] = {}
+        if self.sync_strategy == SyncStrategy.PARALLEL:
+            outcomes = await asyncio.gather(*(apply(name, changes) for name in target_daos))
+            primary_errors = outcomes[0]
+            secondary_errors = dict(zip(secondary_names, outcomes[1:], strict=True))
+        else:
+            primary_errors = await apply(primary_name, changes)
+            written = without(changes, primary_errors)
+            if self.sync_strategy == SyncStrategy.SEQUENTIAL:
+                for name in secondary_names:
+                    secondary_errors[name] = await apply(name, written)
+                    written = without(written, secondary_errors[name])
+            elif self.sync_strategy == SyncStrategy.EVENTUAL:
+                writes = [("create", item_id, instance.to_storage_dict()) for item_id, instance in written["create"].items()]
+                writes += [("update", item_id, (updates or {})[item_id]) for item_id in written["update"]]
+                writes += [("delete", item_id, {}) for item_id in written["delete"]]
+                await self.outbox.enqueue_many(self.model_cls, writes, secondary_names)  # type: ignore[union-attr]
+            elif secondary_names:
+                secondary_errors = dict(zip(secondary_names, await asyncio.gather(*(apply(name, written) for name in secondary_names)), strict=True))
+
+        for name, errors in secondary_errors.items():
+            for item_id, error in errors.items():
+                logger.warning(f"Bulk write of {self.model_cls.__name__} {item_id} failed in secondary storage {name}: {error}")
+
+        # Every change may have left a stale (or negative) cache entry
+        if self._cache_storages:
+            for start in range(0, len(item_ids), DEFAULT_BULK_CHUNK_SIZE):
+                await asyncio.gather(*(self._cache_invalidate(item_id) for item_id in item_ids[start : start + DEFAULT_BULK_CHUNK_SIZE]))
+
+        for item_id, instance in changes["create"].items():
+            if item_id not in primary_errors:
+                instance._mark_stored()
+        result.failed = {item_id: f"{primary_name}: {error}" for item_id, error in primary_errors.items()}
+        result.succeeded = [item_id for item_id in item_ids if item_id not in primary_errors]
+        result.count = len(result.succeeded)
+        return result
+
+    async def _settle_buffered(self, update_ids: list[str], delete_ids: list[str]) -> None:
+        """Write buffered patches of records about to be updated and drop those of records about to be deleted"""
+        for item_id in delete_ids:
+            pending = self._pending_writes.pop(item_id, None)
+            if pending is not None and pending.timer is not None:
+                pending.timer.cancel()
+        buffered = [item_id for item_id in update_ids if item_id in self._pending_writes or item_id in self._flush_locks]
+        outcomes = await asyncio.gather(*(self._flush_pending(item_id) for item_id in buffered), return_exceptions=True)
+        for item_id, outcome in zip(buffered, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Write-behind flush of {self.model_cls.__name__} {item_id} failed: {outcome}")
+
+    async def _check_bulk_delete_permissions(self, ids: list[str], context: SecurityContext) -> dict[str, str]:
+        """Read instances in batches and report the ones that cannot be deleted"""
+        async with batch_loading():
+            instances = await asyncio.gather(*(self.read(item_id, context) for item_id in ids), return_exceptions=True)
+
+        denied: dict[str, str] = {}
+        for item_id, instance in zip(ids, instances, strict=True):
+            if isinstance(instance, BaseException):
+                denied[item_id] = str(instance)
+            elif instance is None:
+                denied[item_id] = "Not found"
+            elif not await instance.check_permission(context, Permission.DELETE):  # type: ignore[attr-defined]
+                denied[item_id] = "No delete permission"
+        return denied
+
+    async def _bulk_in_storage(
+        self, storage_name: str, dao: BaseDAO, operation: str, items: dict[str, Any], chunk_size: int | None
+    ) -> tuple[int, dict[str, str]]:
+        """Run a bulk create, update or delete against one storage in chunks.
+
+        A failing chunk is retried item by item so errors are attributed to
+        single items. Creates are not idempotent and bulk creates may commit
+        part of a chunk before failing, so only the items the storage does not
+        have yet are re-created. DAOs without ``bulk_<operation>`` get
+        concurrent single-item calls per chunk.
+
+        Args:
+            storage_name: Storage name
+            dao: Storage DAO
+            operation: "create" (items are instances), "update" (items are patches
+                including "id") or "delete" (items are IDs)
+            items: Payload by item ID
+            chunk_size: Items per call
+
+        Returns:
+            Number of records affected and errors by item ID
+        """
+        await self._ensure_dao_connected(dao, storage_name)
+        chunk_size = chunk_size or int(self.model_cls.get_metadata().options.get("bulk_chunk_size", DEFAULT_BULK_CHUNK_SIZE))
+        bulk = getattr(dao, f"bulk_{operation}", None)
+        single = (lambda patch: dao.update(patch["id"], patch)) if operation == "update" else getattr(dao, operation)
+
+        affected = 0
+        errors: dict[str, str] = {}
+        keys = list(items)
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start : start + chunk_size]
+            payload = [items[key] for key in chunk]
+            if bulk is not None:
+                try:
+                    # Chunks take longer than single calls, so only the breaker state applies
+                    outcome = await self._guarded(storage_name, dao, f"bulk_{operation}", partial(bulk, payload), adaptive_timeout=False)
+                    affected += outcome if isinstance(outcome, int) else len(outcome)
+                    continue
+                except Exception as e:
+                    logger.warning(f"Bulk {operation} of {len(chunk)} items failed in {storage_name}, retrying per item: {e}")
+                if operation == "create":
+                    try:
+                        stored = await self._guarded(storage_name, dao, "find", partial(dao.find_by_ids, chunk))
+                    except Exception as e:
+                        # Without knowing what was written, re-creating could duplicate items
+                        errors.update(dict.fromkeys(chunk, f"Bulk create failed and written items could not be determined: {e}"))
+                        continue
+                    affected += len(stored)
+                    chunk = [key for key in chunk if key not in stored]
+
+            outcomes = await asyncio.gather(
+                *(self._guarded(storage_name, dao, operation, partial(single, items[key]), item_id=key) for key in chunk),
+                return_exceptions=True,
+            )
+            for key, outcome in zip(chunk, outcomes, strict=True):
+                if isinstance(outcome, Exception):
+                    errors[key] = str(outcome)
+                elif outcome:
+                    affected += 1
+
+        return affected, errors
+
+    @staticmethod
+    def _merge_bulk_errors(storage_names: list[str], item_ids: list[str], outcomes: list[Any]) -> dict[str, str]:
+        """Combine per-storage bulk outcomes into one error message per item"""
+        errors: dict[str, list[str]] = {}
+        for storage_name, outcome in zip(storage_names, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                # The whole storage failed (e.g. connection); every item is affected
+                for item_id in item_ids:
+                    errors.setdefault(item_id, []).append(f"{storage_name}: {outcome}")
+                continue
+            for item_id, error in outcome[1].items():
+                errors.setdefault(item_id, []).append(f"{storage_name}: {error}")
+        return {item_id: "; ".join(messages) for item_id, messages in errors.items()}
 
     async def query(self, query: dict[str, Any], context: SecurityContext | None = None, **kwargs) -> list[T]:
         """Query for instances (alias for find)"""
@@ -409,16 +1232,61 @@ class UnifiedCRUD:
 
         return success
 
+    async def reconcile(
+        self, source: str | None = None, targets: list[str] | None = None, delete_extra: bool = False, dry_run: bool = False, **kwargs
+    ) -> dict[str, ReconcileReport]:
+        """Find and repair drift between storages by comparing bucketed content digests.
+
+        Only records whose digests differ are read and rewritten; see
+        ``Reconciler``. Buffered write-behind updates are flushed first.
+
+        Args:
+            source: Ground-truth storage (default: primary)
+            targets: Storages to repair (default: all others except the cache tier)
+            delete_extra: Delete records found only in a target
+            dry_run: Only report the differences
+            **kwargs: Reconciler settings (prefix_length, scan_batch_size, move_batch_size)
+
+        Returns:
+            Report by target storage
+        """
+        if self._pending_writes:
+            await self.flush_writes()
+        source = source or self._primary_storage_name()
+        targets = targets or [name for name in self._target_daos(None) if name != source]
+        for name, dao in self.model_cls.get_all_daos().items():
+            if name == source or name in targets:
+                await self._ensure_dao_connected(dao, name)
+
+        reports = await Reconciler(self.model_cls, **kwargs).reconcile(source, targets, delete_extra, dry_run)
+        for report in reports.values():
+            await asyncio.gather(*(self._cache_invalidate(item_id) for item_id in [*report.updated, *report.deleted]))
+        return reports
+
+    def get_outbox_stats(self) -> dict[str, int]:
+        """Get outbox counters and queue depth (empty without an outbox)"""
+        return self.outbox.get_stats() if self.outbox else {}
+
     def get_operations_log(self) -> list[StorageOperation]:
-        """Get log of all operations performed"""
-        return self._operations_log
+        """Get the most recent write operations, oldest first"""
+        return self._operations_log.entries()
+
+    def get_operation_metrics(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Get call counts and latency histograms by storage and operation"""
+        return self._operations_log.get_metrics()
 
     def clear_operations_log(self):
-        """Clear operations log"""
-        self._operations_log = []
+        """Clear operations log and metrics"""
+        self._operations_log.clear()
 
     async def cleanup(self):
-        """Disconnect all connected DAOs"""
+        """Write buffered updates and disconnect all connected DAOs"""
+        if self._pending_writes:
+            try:
+                await self.flush_writes()
+            except StorageError as e:
+                logger.error(f"Buffered updates lost during cleanup: {e}")
+
         all_daos = self.model_cls.get_all_daos()
         for name in self._connected_daos:
             if name in all_daos:
@@ -433,7 +1301,7 @@ class UnifiedCRUD:
 _crud_registry: dict[type[StorageModel], UnifiedCRUD] = {}
 
 
-def get_crud[T: StorageModel](model_cls: type[T], **kwargs) -> UnifiedCRUD:
+def get_crud[T: StorageModel](model_cls: type[T], **kwargs) -> UnifiedCRUD[T]:
     """Get or create UnifiedCRUD instance for a model"""
     if model_cls not in _crud_registry:
         _crud_registry[model_cls] = UnifiedCRUD(model_cls, **kwargs)
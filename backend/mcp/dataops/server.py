@@ -4,6 +4,7 @@ This module provides the DataOps MCP server implementation that is used
 by the run_stdio.py and run_websocket.py scripts.
 """
 
+import asyncio
 import json
 from dataclasses import dataclass
 from typing import Any
@@ -11,15 +12,15 @@ from typing import Any
 import yaml
 from loguru import logger
 
+# Import from parent modules
 from backend.dataops.bpmn_model import (
     Event,
     Gateway,
     Process,
     Task,
 )
-
-# Import from parent modules
 from backend.dataops.security_model import SecuredStorageModel
+from backend.dataops.session import Session
 from backend.dataops.storage_model import StorageModel
 from backend.dataops.unified_crud import UnifiedCRUD
 from backend.mcp.mcp_server import BaseMCPServer
@@ -308,26 +309,23 @@ class DataOpsMCPServer(BaseMCPServer):
 
     async def _handle_batch(self, operations: list[dict], transaction: bool = False, context: Any = None) -> DataOpsResponse:
         """Handle batch operations"""
-        results = []
-        errors = []
+        results: list[Any] = []
+        errors: list[str] = []
 
         try:
-            for op in operations:
-                operation = op.get("operation")
-                model = op.get("model")
-                data = op.get("data")
+            index = 0
+            while index < len(operations):
                 # Use operation-specific context if provided, otherwise use batch context
-                op_context = op.get("context", context)
+                run_context = operations[index].get("context", context)
+                end = index + 1
+                while end < len(operations) and operations[end].get("context", context) == run_context:
+                    end += 1
 
-                result = await self._handle_dataops(operation, model, data, context=op_context)
-
-                if result.success:
-                    results.append(result.data)
-                else:
-                    errors.append(result.error)
-                    if transaction:
-                        # Rollback on error in transaction mode
-                        return DataOpsResponse(success=False, error=f"Transaction failed: {result.error}", data={"completed": results, "failed": errors})
+                failed = await self._run_batch_session(operations[index:end], run_context, transaction, results, errors)
+                if failed is not None:
+                    # Rollback on error in transaction mode
+                    return DataOpsResponse(success=False, error=f"Transaction failed: {failed}", data={"completed": results, "failed": errors})
+                index = end
 
             return DataOpsResponse(success=len(errors) == 0, data={"results": results, "errors": errors, "executed": len(results), "failed": len(errors)})
 
@@ -335,6 +333,39 @@ class DataOpsMCPServer(BaseMCPServer):
             logger.error(f"Batch operation failed: {e}")
             return DataOpsResponse(success=False, error=str(e))
 
+    async def _run_batch_session(self, operations: list[dict], context: Any, transaction: bool, results: list[Any], errors: list[str]) -> str | None:
+        """Run consecutive batch operations of one security context in their own session.
+
+        Records loaded by several operations are fetched once (identity map,
+        batched lookups). Each context gets its own session, so a record
+        loaded for one caller is never handed to another from the identity map.
+
+        Returns:
+            The error that failed the transaction, if any
+        """
+        async with Session(context):
+            index = 0
+            while index < len(operations):
+                # Consecutive reads run concurrently so their lookups share one query per storage
+                end = index + 1
+                if not transaction and operations[index].get("operation") == "read":
+                    while end < len(operations) and operations[end].get("operation") == "read":
+                        end += 1
+
+                group_results = await asyncio.gather(
+                    *(self._handle_dataops(op.get("operation"), op.get("model"), op.get("data"), context=context) for op in operations[index:end])
+                )
+                index = end
+
+                for result in group_results:
+                    if result.success:
+                        results.append(result.data)
+                    else:
+                        errors.append(result.error)
+                        if transaction:
+                            return result.error
+        return None
+
 
 # Example models for demonstration
 class UserModel(SecuredStorageModel):
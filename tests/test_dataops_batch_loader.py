@@ -0,0 +1,242 @@
+"""
+Tests for the per-request find_by_id batch loader
+"""
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from backend.dataops.batch_loader import batch_loading, get_batch_loader, load_by_id
+from backend.dataops.implementations.postgresql_dao import PostgreSQLDAO
+from backend.dataops.implementations.redis_dao import RedisDAO
+from backend.dataops.storage_model import StorageModel
+from backend.dataops.storage_types import StorageConfig, StorageType
+
+
+class BatchItem(StorageModel):
+    """Test model for batch loading"""
+
+    name: str
+
+    class Meta:
+        storage_configs = {"graph": StorageConfig(storage_type=StorageType.GRAPH)}
+        path = "batch_items"
+
+
+class RecordingDAO:
+    """DAO stand-in that records single and multi-ID lookups"""
+
+    model_cls = BatchItem
+
+    def __init__(self, records: dict[str, Any], error: Exception | None = None):
+        self.records = records
+        self.error = error
+        self.single_calls: list[str] = []
+        self.batch_calls: list[list[str]] = []
+
+    async def find_by_id(self, item_id: str) -> Any:
+        self.single_calls.append(item_id)
+        return self.records.get(item_id)
+
+    async def find_by_ids(self, item_ids: list[str]) -> dict[str, Any]:
+        self.batch_calls.append(list(item_ids))
+        if self.error:
+            raise self.error
+        return {item_id: self.records[item_id] for item_id in item_ids if item_id in self.records}
+
+
+class SingleLookupDAO:
+    """DAO stand-in without multi-ID support"""
+
+    model_cls = BatchItem
+
+    def __init__(self, records: dict[str, Any]):
+        self.records = records
+        self.single_calls: list[str] = []
+
+    async def find_by_id(self, item_id: str) -> Any:
+        self.single_calls.append(item_id)
+        return self.records.get(item_id)
+
+
+class FakeRedis:
+    """Redis client stand-in for multi-key reads"""
+
+    def __init__(self, values: dict[str, str]):
+        self.values = values
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> "FakeRedis":  # noqa: ARG002
+        return self
+
+    async def __aenter__(self) -> "FakeRedis":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        pass
+
+    def hset(self, *args: Any) -> None:
+        pass
+
+    async def execute(self) -> None:
+        pass
+
+
+class FakePool:
+    """asyncpg pool stand-in whose connections answer every fetch with the same rows"""
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.rows = rows
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator["FakePool"]:
+        yield self
+
+    async def fetch(self, query: str, *args: Any) -> list[dict[str, Any]]:  # noqa: ARG002
+        return self.rows
+
+
+class TestBatchLoader:
+    """Test coalescing of concurrent find_by_id calls"""
+
+    @pytest.mark.asyncio
+    async def test_without_loader_calls_find_by_id(self):
+        """Outside a batch scope lookups go straight to the DAO"""
+        dao = RecordingDAO({"a": 1})
+
+        assert get_batch_loader() is None
+        assert await load_by_id(dao, "a", "graph") == 1
+        assert dao.single_calls == ["a"]
+        assert dao.batch_calls == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_query(self):
+        """Lookups from the same tick become one multi-ID query"""
+        dao = RecordingDAO({"a": 1, "b": 2})
+
+        async with batch_loading() as loader:
+            results = await asyncio.gather(*(load_by_id(dao, item_id, "graph") for item_id in ["a", "b", "a", "missing"]))
+
+        assert results == [1, 2, 1, None]
+        assert dao.batch_calls == [["a", "b", "missing"]]
+        assert loader.stats == {"loads": 4, "batches": 1, "keys": 3}
+
+    @pytest.mark.asyncio
+    async def test_callers_of_one_id_get_their_own_copy(self):
+        """Changes made by one caller do not show up in another caller's record"""
+        dao = RecordingDAO({"a": BatchItem(id="a", name="A")})
+
+        async with batch_loading():
+            first, second = await asyncio.gather(load_by_id(dao, "a", "graph"), load_by_id(dao, "a", "graph"))
+
+        assert dao.batch_calls == [["a"]]
+        assert first == second
+        first.name = "changed"
+        assert second.name == "A"
+
+    @pytest.mark.asyncio
+    async def test_storages_are_batched_separately(self):
+        """Each (model, storage) pair gets its own query"""
+        graph_dao = RecordingDAO({"a": "graph-a"})
+        cache_dao = RecordingDAO({"a": "cache-a"})
+
+        async with batch_loading():
+            results = await asyncio.gather(load_by_id(graph_dao, "a", "graph"), load_by_id(cache_dao, "a", "cache"))
+
+        assert results == ["graph-a", "cache-a"]
+        assert graph_dao.batch_calls == cache_dao.batch_calls == [["a"]]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size(self):
+        """Large batches are split into several queries"""
+        dao = RecordingDAO({str(i): i for i in range(5)})
+
+        async with batch_loading(max_batch_size=2):
+            results = await asyncio.gather(*(load_by_id(dao, str(i), "graph") for i in range(5)))
+
+        assert results == list(range(5))
+        assert dao.batch_calls == [["0", "1"], ["2", "3"], ["4"]]
+
+    @pytest.mark.asyncio
+    async def test_pending_fetches_are_referenced(self):
+        """Fetch tasks are kept alive by the loader until they finish"""
+        release = asyncio.Event()
+
+        class SlowDAO(RecordingDAO):
+            async def find_by_ids(self, item_ids: list[str]) -> dict[str, Any]:
+                await release.wait()
+                return await super().find_by_ids(item_ids)
+
+        dao = SlowDAO({"a": 1})
+
+        async with batch_loading() as loader:
+            load = asyncio.ensure_future(load_by_id(dao, "a", "graph"))
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert len(loader._fetches) == 1
+            release.set()
+            assert await load == 1
+            await asyncio.sleep(0)
+            assert not loader._fetches
+
+    @pytest.mark.asyncio
+    async def test_fallback_without_find_by_ids(self):
+        """DAOs without find_by_ids are queried per ID"""
+        dao = SingleLookupDAO({"a": 1, "b": 2})
+
+        async with batch_loading():
+            results = await asyncio.gather(load_by_id(dao, "a", "graph"), load_by_id(dao, "b", "graph"))
+
+        assert results == [1, 2]
+        assert sorted(dao.single_calls) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        """A failed batch query fails all of its callers"""
+        dao = RecordingDAO({}, error=RuntimeError("boom"))
+
+        async with batch_loading():
+            results = await asyncio.gather(load_by_id(dao, "a", "graph"), load_by_id(dao, "b", "graph"), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_nested_scopes_share_loader(self):
+        """Nested batch scopes reuse the outer loader"""
+        async with batch_loading() as outer, batch_loading() as inner:
+            assert inner is outer
+        assert get_batch_loader() is None
+
+    @pytest.mark.asyncio
+    async def test_storage_model_find_by_id_is_batched(self, monkeypatch):
+        """StorageModel.find_by_id goes through the active loader"""
+        dao = RecordingDAO({"a": BatchItem(id="a", name="A"), "b": BatchItem(id="b", name="B")})
+        monkeypatch.setattr(BatchItem, "get_dao", classmethod(lambda _cls, _storage_name=None: dao))
+
+        async with batch_loading():
+            first, second = await asyncio.gather(BatchItem.find_by_id("a"), BatchItem.find_by_id("b"))
+
+        assert (first.name, second.name) == ("A", "B")
+        assert dao.batch_calls == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_dict_backends_return_model_instances(self):
+        """Redis and PostgreSQL DAOs created for a model hydrate their records"""
+        redis_dao = RedisDAO(BatchItem, StorageConfig(storage_type=StorageType.CACHE))
+        redis_dao.client = FakeRedis({"batch_items:a": json.dumps({"id": "a", "name": "A"})})  # type: ignore[assignment]
+        postgres_dao = PostgreSQLDAO(BatchItem, StorageConfig(storage_type=StorageType.RELATIONAL))
+        postgres_dao.pool = FakePool([{"id": "b", "name": "B"}])  # type: ignore[assignment]
+        postgres_dao._table_created = True
+
+        async with batch_loading():
+            cached, stored = await asyncio.gather(load_by_id(redis_dao, "a", "cache"), load_by_id(postgres_dao, "b", "relational"))
+
+        assert isinstance(cached, BatchItem)
+        assert cached.name == "A"
+        assert isinstance(stored, BatchItem)
+        assert stored.name == "B"
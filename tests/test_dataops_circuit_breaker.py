@@ -0,0 +1,116 @@
+"""
+Tests for storage circuit breakers and adaptive timeouts
+"""
+import asyncio
+
+import pytest
+
+from backend.dataops.circuit_breaker import CircuitBreaker, CircuitState, get_circuit_breaker
+from backend.dataops.exceptions import CircuitOpenError, StorageError, StorageTimeoutError
+
+
+async def succeed(delay: float = 0.0) -> str:
+    await asyncio.sleep(delay)
+    return "ok"
+
+
+async def fail() -> None:
+    raise ConnectionError("down")
+
+
+async def reject() -> None:
+    raise ValueError("bad filter")
+
+
+async def fail_wrapped() -> None:
+    raise StorageError("Failed to find item") from ConnectionRefusedError("refused")
+
+
+class TestCircuitBreaker:
+    """Test state transitions and timeouts"""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_failures(self):
+        """The threshold of consecutive failures opens the circuit"""
+        breaker = CircuitBreaker("test", failure_threshold=3)
+
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await breaker.call(fail)
+
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(succeed)
+        assert breaker.get_stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_success_resets_failure_count(self):
+        """Only consecutive failures count"""
+        breaker = CircuitBreaker("test", failure_threshold=2)
+
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+        await breaker.call(succeed)
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_application_errors_do_not_open(self):
+        """Only transport, timeout and availability errors count as failures"""
+        breaker = CircuitBreaker("test", failure_threshold=1)
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await breaker.call(reject)
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.get_stats()["failures"] == 0
+
+        # DAOs wrap driver errors; the cause decides
+        with pytest.raises(StorageError):
+            await breaker.call(fail_wrapped)
+        assert breaker.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_closes_or_reopens(self):
+        """After the reset timeout one trial call decides the state"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.01)
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+
+        await asyncio.sleep(0.02)
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+        assert breaker.state == CircuitState.OPEN
+
+        await asyncio.sleep(0.02)
+        assert await breaker.call(succeed) == "ok"
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_timeout_follows_observed_latency(self):
+        """Slow calls fail relative to the backend's usual latency"""
+        breaker = CircuitBreaker("test", min_samples=5, min_timeout=0.01, timeout_multiplier=3.0)
+        assert breaker.timeout() == breaker.default_timeout
+
+        for _ in range(5):
+            await breaker.call(lambda: succeed(0.005))
+        assert 0.01 <= breaker.timeout() < 0.1
+
+        with pytest.raises(StorageTimeoutError):
+            await breaker.call(lambda: succeed(0.5))
+        assert breaker.get_stats()["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_breakers_are_per_dao_instance(self):
+        """Each DAO gets its own breaker, reused across lookups"""
+
+        class DAO:
+            pass
+
+        first, second = DAO(), DAO()
+
+        assert get_circuit_breaker(first, "a") is get_circuit_breaker(first, "a")
+        assert get_circuit_breaker(first, "a") is not get_circuit_breaker(second, "b")
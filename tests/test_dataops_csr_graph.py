@@ -0,0 +1,84 @@
+"""
+Tests for the in-memory CSR graph engine
+"""
+import numpy as np
+import pytest
+
+from backend.dataops.implementations.graph.csr_graph import CSRGraph
+
+
+def make_graph() -> CSRGraph:
+    """Two components: a -> b -> c -> a plus d -> e, and an isolated node f"""
+    nodes = [("0x1", "a"), ("0x2", "b"), ("0x3", "c"), ("0x4", "d"), ("0x5", "e"), ("0x6", "f")]
+    edges = [("0x1", "0x2"), ("0x2", "0x3"), ("0x3", "0x1"), ("0x4", "0x5")]
+    return CSRGraph.from_edge_list(nodes, edges)
+
+
+class TestCSRGraph:
+    """Test CSR construction and analytics"""
+
+    def test_csr_layout(self):
+        """Edges are stored as uint32 CSR rows"""
+        graph = make_graph()
+
+        assert graph.num_nodes == 6
+        assert graph.num_edges == 4
+        assert graph.indices.dtype == np.uint32
+        assert graph.indptr.tolist() == [0, 1, 2, 3, 4, 4, 4]
+        assert graph.out_degree().tolist() == [1, 1, 1, 1, 0, 0]
+        assert graph.in_degree().tolist() == [1, 1, 1, 0, 1, 0]
+
+    def test_unknown_targets_are_unlabelled(self):
+        """Targets outside the exported type get nodes without labels"""
+        graph = CSRGraph.from_edge_list([("0x1", "a")], [("0x1", "0x9")])
+
+        assert graph.uids == ["0x1", "0x9"]
+        assert graph.labels == ["a", None]
+        assert graph.components_by_label() == [["a"]]
+
+    def test_connected_components(self):
+        """Union-find groups weakly connected nodes"""
+        components = make_graph().components_by_label()
+
+        assert [sorted(component) for component in components] == [["a", "b", "c"], ["d", "e"], ["f"]]
+
+    def test_connected_components_long_chain(self):
+        """Long paths do not hit recursion limits"""
+        count = 50000
+        nodes = [(str(i), str(i)) for i in range(count)]
+        edges = [(str(i), str(i + 1)) for i in range(count - 1)]
+
+        components = CSRGraph.from_edge_list(nodes, edges).components_by_label()
+
+        assert len(components) == 1
+        assert len(components[0]) == count
+
+    def test_pagerank(self):
+        """Ranks sum to one and a symmetric cycle ranks evenly"""
+        graph = make_graph()
+        rank = graph.pagerank()
+
+        assert rank.sum() == pytest.approx(1.0)
+        assert rank[0] == pytest.approx(rank[1]) == pytest.approx(rank[2])
+        assert rank[4] > rank[3]
+
+    def test_bfs(self):
+        """BFS distances follow edge direction unless undirected"""
+        graph = make_graph()
+
+        assert graph.bfs(0).tolist() == [0, 1, 2, -1, -1, -1]
+        assert graph.bfs(0, max_depth=1).tolist() == [0, 1, -1, -1, -1, -1]
+        assert graph.bfs(4).tolist() == [-1, -1, -1, -1, 0, -1]
+        assert graph.bfs(4, directed=False).tolist() == [-1, -1, -1, 1, 0, -1]
+
+    def test_with_updates_replaces_outgoing_edges(self):
+        """Incremental refresh replaces only the changed nodes' edges"""
+        graph = make_graph()
+
+        updated = graph.with_updates([("0x5", "e"), ("0x7", "g")], [("0x5", "0x1"), ("0x7", "0x6")])
+
+        assert updated.num_nodes == 7
+        assert updated.num_edges == 6
+        assert [sorted(component) for component in updated.components_by_label()] == [["a", "b", "c", "d", "e"], ["f", "g"]]
+        # Original snapshot is left untouched
+        assert graph.num_edges == 4
@@ -0,0 +1,685 @@
+"""
+Tests for DgraphDAO query and mutation building (no live Dgraph required)
+"""
+import hashlib
+import itertools
+import json
+import re
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+import grpc
+import pytest
+
+from backend.dataops.circuit_breaker import CircuitBreaker, CircuitState
+from backend.dataops.exceptions import StorageError, StorageTimeoutError
+from backend.dataops.implementations.dgraph_dao import DgraphDAO
+from backend.dataops.implementations.graph.dgraph_client import LoadBalancedDgraphClient
+from backend.dataops.security_model import Role
+from backend.dataops.storage_model import StorageModel
+from backend.dataops.storage_types import ReadConsistency, StorageConfig, StorageType
+
+
+class SampleNode(StorageModel):
+    """Test model stored in Dgraph"""
+
+    name: str
+    tags: list[str] = []
+
+    class Meta:
+        storage_configs = {"graph": StorageConfig(storage_type=StorageType.GRAPH)}
+        path = "sample_nodes"
+
+
+class FakeTxn:
+    """Records requests sent through a Dgraph transaction"""
+
+    def __init__(self, client: "FakeClient", read_only: bool = False, best_effort: bool = False):
+        self.client = client
+        self.read_only = read_only
+        self.best_effort = best_effort
+
+    def create_mutation(self, set_obj=None, del_obj=None, set_nquads=None, del_nquads=None, cond=None) -> dict[str, Any]:
+        return {"set_obj": set_obj, "del_obj": del_obj, "set_nquads": set_nquads, "del_nquads": del_nquads, "cond": cond}
+
+    def create_request(self, query=None, variables=None, mutations=None, commit_now=None) -> dict[str, Any]:
+        return {"query": query, "variables": variables, "mutations": mutations or [], "commit_now": commit_now}
+
+    def do_request(self, request: dict[str, Any]) -> SimpleNamespace:
+        self.client.requests.append(request)
+        return SimpleNamespace(json=json.dumps(self.client.next_response()))
+
+    def query(self, query: str, variables: dict[str, Any] | None = None) -> SimpleNamespace:
+        self.client.requests.append({"query": query, "variables": variables, "mutations": [], "read_only": self.read_only, "best_effort": self.best_effort})
+        return SimpleNamespace(json=json.dumps(self.client.next_response()))
+
+    def mutate(self, **kwargs: Any) -> SimpleNamespace:
+        self.client.requests.append({"mutations": [kwargs]})
+        # Assign uids to blank nodes like Dgraph does
+        labels = sorted(set(re.findall(r"^_:(\w+) ", kwargs.get("set_nquads") or "", re.MULTILINE)))
+        uids = {label: f"0x{next(self.client.uid_counter):x}" for label in labels}
+        return SimpleNamespace(json="{}", uids=uids)
+
+    def commit(self) -> None:
+        self.client.commits += 1
+
+    def discard(self) -> None:
+        pass
+
+
+class FakeClient:
+    """Minimal stand-in for pydgraph.DgraphClient"""
+
+    def __init__(self, responses: list[dict[str, Any]] | None = None):
+        self.responses = list(responses or [])
+        self.requests: list[dict[str, Any]] = []
+        self.commits = 0
+        self.alters: list[Any] = []
+        self.uid_counter = itertools.count(1)
+
+    def alter(self, operation: Any) -> None:
+        self.alters.append(operation)
+
+    def next_response(self) -> dict[str, Any]:
+        return self.responses.pop(0) if self.responses else {}
+
+    def txn(self, read_only: bool = False, best_effort: bool = False) -> FakeTxn:
+        return FakeTxn(self, read_only=read_only, best_effort=best_effort)
+
+
+def make_dao(responses: list[dict[str, Any]] | None = None) -> DgraphDAO:
+    """Create a DAO wired to a fake client"""
+    dao = DgraphDAO(SampleNode, StorageConfig(storage_type=StorageType.GRAPH))
+    dao.client = FakeClient(responses)
+    return dao
+
+
+class TestDgraphUpsert:
+    """Test single round trip update/delete"""
+
+    @pytest.mark.asyncio
+    async def test_update_is_single_upsert(self):
+        """Update resolves the uid and mutates in one request"""
+        dao = make_dao([{"item": [{"uid": "0x1"}]}])
+
+        assert await dao.update("node-1", {"name": "renamed", "tags": ["a"], "id": "ignored"})
+
+        assert len(dao.client.requests) == 1
+        request = dao.client.requests[0]
+        assert request["commit_now"] is True
+        assert 'eq(sample_nodes.id, "node-1")' in request["query"]
+        assert "v as uid" in request["query"]
+
+        mutation = request["mutations"][0]
+        assert mutation["cond"] == "@if(gt(len(v), 0))"
+        assert mutation["set_obj"] == {"uid": "uid(v)", "sample_nodes.name": "renamed", "sample_nodes.tags": '["a"]'}
+
+    @pytest.mark.asyncio
+    async def test_update_missing_returns_false(self):
+        """Update reports not-found from the upsert query result"""
+        dao = make_dao([{"item": []}])
+        assert not await dao.update("missing", {"name": "x"})
+
+    @pytest.mark.asyncio
+    async def test_delete_is_single_upsert(self):
+        """Delete sends one conditional delete mutation"""
+        dao = make_dao([{"item": [{"uid": "0x1"}]}])
+
+        assert await dao.delete("node-1")
+
+        assert len(dao.client.requests) == 1
+        request = dao.client.requests[0]
+        assert request["commit_now"] is True
+        assert request["mutations"] == [{"set_obj": None, "del_obj": None, "set_nquads": None, "del_nquads": "uid(v) * * .", "cond": "@if(gt(len(v), 0))"}]
+
+    @pytest.mark.asyncio
+    async def test_ids_are_quoted(self):
+        """IDs are JSON-quoted so they cannot break out of the DQL string"""
+        dao = make_dao([{"item": []}])
+        await dao.delete('bad") { uid } }')
+        assert 'eq(sample_nodes.id, "bad\\") { uid } }")' in dao.client.requests[0]["query"]
+
+
+class TestDgraphBulk:
+    """Test set-based bulk update/delete"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_sends_one_upsert_per_chunk(self):
+        """Bulk update resolves UIDs and mutates in a single request per chunk"""
+        dao = make_dao([{"items": [{"sample_nodes.id": "a"}, {"sample_nodes.id": "b"}]}])
+
+        updated = await dao.bulk_update([{"id": "a", "name": "A"}, {"id": "b", "name": "B"}, {"id": "missing", "name": "M"}])
+
+        assert updated == 2
+        assert len(dao.client.requests) == 1
+        request = dao.client.requests[0]
+        assert request["commit_now"] is True
+        assert 'items(func: eq(sample_nodes.id, ["a", "b", "missing"]))' in request["query"]
+        assert 'u0 as var(func: eq(sample_nodes.id, "a"))' in request["query"]
+        assert [mutation["set_obj"] for mutation in request["mutations"]] == [
+            {"uid": "uid(u0)", "sample_nodes.name": "A"},
+            {"uid": "uid(u1)", "sample_nodes.name": "B"},
+            {"uid": "uid(u2)", "sample_nodes.name": "M"},
+        ]
+        assert request["mutations"][1]["cond"] == "@if(gt(len(u1), 0))"
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_chunks(self):
+        """Bulk delete sends one upsert per chunk"""
+        dao = make_dao([{"items": [{"uid": "0x1"}, {"uid": "0x2"}]}, {"items": [{"uid": "0x3"}]}])
+
+        deleted = await dao.bulk_delete(["a", "b", "c"], chunk_size=2)
+
+        assert deleted == 3
+        assert len(dao.client.requests) == 2
+        assert 'eq(sample_nodes.id, ["a", "b"])' in dao.client.requests[0]["query"]
+        assert 'eq(sample_nodes.id, ["c"])' in dao.client.requests[1]["query"]
+        assert all(request["commit_now"] for request in dao.client.requests)
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_atomic_commits_once(self):
+        """Atomic bulk delete commits all chunks together"""
+        dao = make_dao([{"items": [{"uid": "0x1"}]}, {"items": [{"uid": "0x2"}]}])
+
+        assert await dao.bulk_delete(["a", "b"], chunk_size=1, atomic=True) == 2
+        assert not any(request["commit_now"] for request in dao.client.requests)
+        assert dao.client.commits == 1
+
+    def test_chunk_size_from_config(self):
+        """Chunk size falls back to the storage options"""
+        dao = make_dao()
+        dao.config.options["bulk_chunk_size"] = 2
+        assert list(dao._chunks([1, 2, 3])) == [[1, 2], [3]]
+
+
+class TestDgraphProjection:
+    """Test field projection in reads"""
+
+    def test_default_projection_lists_model_predicates(self):
+        """Without fields all model predicates are listed explicitly"""
+        dao = make_dao()
+        projection = dao._build_projection()
+
+        assert "expand(_all_)" not in projection
+        assert projection.splitlines() == ["uid"] + [f"sample_nodes.{field}" for field in SampleNode.model_fields]
+
+    def test_projection_is_cached(self):
+        """Projections are cached per field set"""
+        dao = make_dao()
+        first = dao._build_projection(["name"])
+        assert dao._build_projection(["name"]) is first
+        assert first.splitlines() == ["uid", "sample_nodes.id", "sample_nodes.name"]
+        assert "expand(_all_)" in dao._build_projection(["name"], expand_edges=True)
+
+    def test_unknown_field_rejected(self):
+        """Unknown fields cannot be injected into the query"""
+        dao = make_dao()
+        with pytest.raises(ValueError, match="Unknown fields"):
+            dao._build_projection(["name } }"])
+
+    @pytest.mark.asyncio
+    async def test_find_by_id_with_fields_returns_partial_instance(self):
+        """Projected reads build instances without requiring every field"""
+        dao = make_dao([{"item": [{"uid": "0x1", "sample_nodes.id": "node-1", "sample_nodes.tags": '["x"]'}]}])
+
+        node = await dao.find_by_id("node-1", fields=["tags"])
+
+        assert node.id == "node-1"
+        assert node.tags == ["x"]
+        assert "sample_nodes.name" not in dao.client.requests[0]["query"]
+
+    @pytest.mark.asyncio
+    async def test_partial_instance_parses_datetimes(self):
+        """Projected datetime fields come back as datetimes, not ISO strings"""
+        dao = make_dao([{"item": [{"uid": "0x1", "sample_nodes.id": "node-1", "sample_nodes.created_at": "2025-01-02T03:04:05"}]}])
+
+        node = await dao.find_by_id("node-1", fields=["created_at"])
+
+        assert node.created_at == datetime(2025, 1, 2, 3, 4, 5)
+
+
+class TestDgraphChangeTracking:
+    """Test that instances read from Dgraph save only their changes"""
+
+    @pytest.mark.asyncio
+    async def test_save_sends_only_changed_fields(self, monkeypatch):
+        """A loaded node is tracked: no write without changes, one upsert with only the changes otherwise"""
+        dao = make_dao(
+            [
+                {"item": [{"uid": "0x1", "sample_nodes.id": "node-1", "sample_nodes.name": "a", "sample_nodes.created_at": "2025-01-02T03:04:05"}]},
+                {"item": [{"uid": "0x1"}]},
+            ]
+        )
+        monkeypatch.setattr(SampleNode, "_daos", {"graph": dao})
+
+        node = await dao.find_by_id("node-1")
+        assert node.get_changes() == {}
+        await node.save()
+        assert len(dao.client.requests) == 1
+
+        node.name = "b"
+        await node.save()
+
+        assert len(dao.client.requests) == 2
+        set_obj = dao.client.requests[1]["mutations"][0]["set_obj"]
+        assert set(set_obj) == {"uid", "sample_nodes.name", "sample_nodes.updated_at"}
+        assert set_obj["sample_nodes.name"] == "b"
+
+
+class TestDgraphSchemaFingerprint:
+    """Test schema alter is skipped when the fingerprint matches"""
+
+    @pytest.fixture(autouse=True)
+    def reset_applied_schemas(self):
+        """Forget schemas applied by earlier tests"""
+        DgraphDAO._applied_schemas.clear()
+        yield
+        DgraphDAO._applied_schemas.clear()
+
+    def test_alter_on_missing_fingerprint_then_cached(self):
+        """First connect alters and records the fingerprint, later connects skip"""
+        dao = make_dao([{"meta": []}])
+        dao._ensure_schema()
+
+        assert len(dao.client.alters) == 1
+        assert "sample_nodes.id: string @index(exact) ." in dao.client.alters[0].schema
+        fingerprint_request = dao.client.requests[-1]
+        assert fingerprint_request["mutations"][0]["set_obj"]["dataops_schema.type"] == "sample_nodes"
+
+        # Same schema in the same process: no query and no alter
+        other = make_dao()
+        other._ensure_schema()
+        assert other.client.alters == []
+        assert other.client.requests == []
+
+    def test_matching_stored_fingerprint_skips_alter(self):
+        """A fingerprint recorded in Dgraph by another process is honoured"""
+        fingerprint = hashlib.sha256(make_dao()._build_schema().encode("utf-8")).hexdigest()
+        dao = make_dao([{"meta": [{"dataops_schema.fingerprint": fingerprint}]}])
+
+        dao._ensure_schema()
+
+        assert dao.client.alters == []
+        assert len(dao.client.requests) == 1
+
+
+class FailingClient(FakeClient):
+    """Fake client whose transactions fail with a gRPC status"""
+
+    def __init__(self, code: grpc.StatusCode):
+        super().__init__()
+        self.code = code
+
+    def txn(self, read_only: bool = False, best_effort: bool = False) -> FakeTxn:
+        txn = FakeTxn(self, read_only=read_only, best_effort=best_effort)
+        error = grpc.RpcError()
+        error.code = lambda: self.code
+
+        def fail(*_args, **_kwargs):
+            raise error
+
+        txn.query = fail
+        return txn
+
+
+class TestLoadBalancedClient:
+    """Test multi-alpha load balancing"""
+
+    def make_client(self, policy: str = "least_outstanding") -> LoadBalancedDgraphClient:
+        """Create a balancer over three fake alphas"""
+        client = LoadBalancedDgraphClient(["alpha1:9080", "alpha2:9080", "alpha3:9080"], policy=policy)
+        for node in client.nodes:
+            node.client = FakeClient()
+        return client
+
+    def test_alpha_addresses_from_options(self):
+        """DAO reads alpha_addresses from storage options"""
+        dao = make_dao()
+        assert dao._alpha_addresses() == ["localhost:9080"]
+
+        dao.config.options["alpha_addresses"] = "a:9080, b:9080"
+        assert dao._alpha_addresses() == ["a:9080", "b:9080"]
+
+    def test_round_robin(self):
+        """Round-robin cycles through the alphas"""
+        client = self.make_client("round_robin")
+        assert [client.txn(read_only=True).node.address for _ in range(4)] == ["alpha1:9080", "alpha2:9080", "alpha3:9080", "alpha1:9080"]
+
+    def test_least_outstanding_spreads_reads(self):
+        """Completed requests spread subsequent reads across alphas"""
+        client = self.make_client()
+        for _ in range(6):
+            client.txn(read_only=True).query("{ q(func: uid(0x1)) { uid } }")
+
+        assert [stats["requests"] for stats in client.get_stats()] == [2, 2, 2]
+        assert all(stats["outstanding"] == 0 for stats in client.get_stats())
+
+    def test_unhealthy_alpha_leaves_rotation(self):
+        """Alphas failing with UNAVAILABLE are skipped until retry_after elapses"""
+        client = self.make_client("round_robin")
+        client.nodes[0].client = FailingClient(grpc.StatusCode.UNAVAILABLE)
+
+        with pytest.raises(grpc.RpcError):
+            client.txn(read_only=True).query("{}")
+
+        assert not client.nodes[0].healthy
+        assert {client.txn(read_only=True).node.address for _ in range(4)} == {"alpha2:9080", "alpha3:9080"}
+
+        client.nodes[0].unhealthy_until = 0.0
+        assert client.nodes[0].healthy
+
+
+class StalledClient(FakeClient):
+    """Fake client whose queries block like a stalled alpha until the gRPC deadline"""
+
+    def __init__(self):
+        super().__init__()
+        self.timeouts: list[float | None] = []
+
+    def txn(self, read_only: bool = False, best_effort: bool = False) -> FakeTxn:
+        txn = FakeTxn(self, read_only=read_only, best_effort=best_effort)
+        error = grpc.RpcError()
+        error.code = lambda: grpc.StatusCode.DEADLINE_EXCEEDED
+
+        def stall(*_args, timeout: float | None = None, **_kwargs):
+            self.timeouts.append(timeout)
+            time.sleep(0.3 if timeout is None else timeout)
+            raise error
+
+        txn.query = stall
+        return txn
+
+
+class TestDgraphCircuitBreaker:
+    """Test that the breaker's timeout applies to blocking pydgraph calls"""
+
+    @pytest.mark.asyncio
+    async def test_blocking_query_trips_breaker(self):
+        """A stalled alpha times out on schedule, opens the circuit and gets the deadline as its gRPC timeout"""
+        stalled = StalledClient()
+        dao = make_dao()
+        dao.client = LoadBalancedDgraphClient(["alpha1:9080"])
+        dao.client.nodes[0].client = stalled
+        breaker = CircuitBreaker("dgraph", failure_threshold=1, default_timeout=0.05)
+
+        started = time.monotonic()
+        with pytest.raises(StorageTimeoutError):
+            await breaker.call(lambda: dao.find_by_id("a"))
+
+        assert time.monotonic() - started < 0.2
+        assert breaker.state == CircuitState.OPEN
+        assert 0 < stalled.timeouts[0] <= 0.05
+
+
+class TestDgraphReadConsistency:
+    """Test per-call and per-model read consistency"""
+
+    @pytest.mark.asyncio
+    async def test_default_is_read_only(self):
+        """Reads default to read-only transactions"""
+        dao = make_dao([{"item": []}])
+        await dao.find_by_id("node-1")
+        assert dao.client.requests[0]["read_only"] is True
+        assert dao.client.requests[0]["best_effort"] is False
+
+    @pytest.mark.asyncio
+    async def test_per_call_consistency(self):
+        """Per-call consistency overrides the model default"""
+        dao = make_dao([{"count": [{"total": 3}]}, {"items": []}])
+
+        assert await dao.count({}, consistency=ReadConsistency.BEST_EFFORT) == 3
+        await dao.find({}, consistency="strong")
+
+        assert dao.client.requests[0]["best_effort"] is True
+        assert dao.client.requests[1]["read_only"] is False
+
+    @pytest.mark.asyncio
+    async def test_model_default_from_meta_options(self):
+        """Meta.options['read_consistency'] sets the model default"""
+        dao = DgraphDAO(Role, StorageConfig(storage_type=StorageType.GRAPH))
+        dao.client = FakeClient([{"items": []}])
+
+        await dao.find({})
+
+        assert dao.client.requests[0]["best_effort"] is True
+
+
+class TestDgraphGraphSnapshot:
+    """Test paged edge export into the CSR snapshot"""
+
+    def page(self, *nodes: tuple[str, str, list[str]]) -> dict[str, Any]:
+        return {"nodes": [{"uid": uid, "sample_nodes.id": node_id, "sample_nodes.links": [{"uid": t} for t in targets]} for uid, node_id, targets in nodes]}
+
+    @pytest.mark.asyncio
+    async def test_paged_export(self):
+        """Nodes are paged by uid and only edge uids are selected"""
+        dao = make_dao([self.page(("0x1", "a", ["0x2"]), ("0x2", "b", [])), self.page(("0x3", "c", []))])
+        dao.metadata.options["graph_export_page_size"] = 2
+        try:
+            components = await dao.find_connected_components(edge_types=["links"])
+        finally:
+            del dao.metadata.options["graph_export_page_size"]
+
+        assert [sorted(component) for component in components] == [["a", "b"], ["c"]]
+        first, second = dao.client.requests
+        assert "first: 2)" in first["query"]
+        assert "after: 0x2" in second["query"]
+        assert "sample_nodes.links { uid }" in first["query"]
+        assert "expand(_all_)" not in first["query"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_cached_and_refreshed(self):
+        """Snapshots are reused and refreshed from updated nodes only"""
+        dao = make_dao([self.page(("0x1", "a", []), ("0x2", "b", [])), self.page(("0x2", "b", ["0x1"]))])
+
+        first = await dao.get_degrees(edge_types=["links"])
+        cached = await dao.get_degrees(edge_types=["links"])
+        snapshot = await dao.get_graph_snapshot(edge_types=["links"], refresh=True)
+
+        assert first == cached == {"a": {"in": 0, "out": 0, "total": 0}, "b": {"in": 0, "out": 0, "total": 0}}
+        assert len(dao.client.requests) == 2
+        assert "ge(sample_nodes.updated_at" in dao.client.requests[1]["query"]
+        assert snapshot.num_edges == 1
+        assert await dao.get_bfs_distances("b", edge_types=["links"]) == {"b": 0, "a": 1}
+
+    @pytest.mark.asyncio
+    async def test_edge_predicates_from_schema(self):
+        """Without explicit edge types, uid predicates of the type are used"""
+        schema = {"schema": [{"predicate": "sample_nodes.links", "type": "uid"}, {"predicate": "sample_nodes.name", "type": "string"}]}
+        dao = make_dao([schema, self.page(("0x1", "a", []))])
+
+        ranks = await dao.get_pagerank()
+
+        assert ranks == {"a": pytest.approx(1.0)}
+        assert "sample_nodes.links { uid }" in dao.client.requests[1]["query"]
+        assert "sample_nodes.name" not in dao.client.requests[1]["query"]
+
+
+class TestDgraphKHop:
+    """Test frontier-based k-hop traversal"""
+
+    @pytest.mark.asyncio
+    async def test_levels_follow_requested_edges(self):
+        """Each level is one bounded query over the requested predicates"""
+        dao = make_dao(
+            [
+                {"level": [{"uid": "0x1", "sample_nodes.id": "a"}]},
+                {"level": [{"uid": "0x2", "sample_nodes.id": "b"}, {"uid": "0x3", "sample_nodes.id": "c"}]},
+                {"level": [{"uid": "0x4", "sample_nodes.id": "d"}]},
+            ]
+        )
+
+        result = await dao.k_hop_query("a", k=2, edge_types=["links"], max_fanout=50)
+
+        assert result["levels"] == [
+            [{"uid": "0x1", "id": "a"}],
+            [{"uid": "0x2", "id": "b"}, {"uid": "0x3", "id": "c"}],
+            [{"uid": "0x4", "id": "d"}],
+        ]
+        second, third = dao.client.requests[1]["query"], dao.client.requests[2]["query"]
+        assert "e0 as sample_nodes.links" in second
+        assert "expand(_all_)" not in second
+        assert "@recurse" not in second
+        assert "first: 50" in second
+        assert "func: uid(0x2, 0x3)" in third
+        assert "NOT uid(" in third
+        assert all(uid in third.split("NOT uid(")[1] for uid in ("0x1", "0x2", "0x3"))
+
+    @pytest.mark.asyncio
+    async def test_stops_when_frontier_empty(self):
+        """Traversal ends early once no unvisited neighbours remain"""
+        dao = make_dao([{"level": [{"uid": "0x1", "sample_nodes.id": "a"}]}, {"level": []}])
+
+        levels = [level async for level in dao.iter_k_hop("a", k=5, edge_types=["links"])]
+
+        assert [level["depth"] for level in levels] == [0]
+        assert len(dao.client.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_start_node(self):
+        """Unknown start nodes yield no levels"""
+        dao = make_dao([{"level": []}])
+
+        assert await dao.k_hop_query("missing", k=2, edge_types=["links"]) == {"start_node": "missing", "hops": 2, "levels": []}
+
+
+class TestDgraphNodeDegree:
+    """Test server-side degree aggregates"""
+
+    SCHEMA = {"schema": [{"predicate": "sample_nodes.links", "type": "uid"}, {"predicate": "sample_nodes.owner", "type": "uid"}]}
+    REVERSE = {"schema": [{"predicate": "sample_nodes.links", "reverse": True}, {"predicate": "sample_nodes.owner", "reverse": True}]}
+
+    @pytest.mark.asyncio
+    async def test_batched_degrees(self):
+        """One aggregate query answers for all requested nodes"""
+        nodes = {
+            "nodes": [
+                {"sample_nodes.id": "a", "out0": 2, "out1": 1, "in0": 3, "in1": 0},
+                {"sample_nodes.id": "b", "out0": 0, "out1": 0, "in0": 1, "in1": 1},
+            ]
+        }
+        dao = make_dao([self.SCHEMA, self.REVERSE, nodes])
+
+        degrees = await dao.get_node_degrees(["a", "b", "missing"])
+
+        assert degrees == {
+            "a": {"in": 3, "out": 3, "total": 6},
+            "b": {"in": 2, "out": 0, "total": 2},
+            "missing": {"in": 0, "out": 0, "total": 0},
+        }
+        query = dao.client.requests[2]["query"]
+        assert 'eq(sample_nodes.id, ["a", "b", "missing"])' in query
+        assert "out0: count(sample_nodes.links)" in query
+        assert "in1: count(~sample_nodes.owner)" in query
+        assert "expand(_all_)" not in query
+        assert len(dao.client.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_in_degree_without_reverse_index_is_refused(self):
+        """Predicates without @reverse are not counted by exporting every edge"""
+        dao = make_dao([{"schema": [{"predicate": "sample_nodes.links"}]}])
+
+        with pytest.raises(StorageError, match="@reverse index on sample_nodes.links"):
+            await dao.get_node_degrees(["a"], edge_types=["links"])
+        assert len(dao.client.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_out_degree_without_reverse_index(self):
+        """Out-degrees need no reverse index"""
+        dao = make_dao([{"nodes": [{"sample_nodes.id": "a", "out0": 1}]}])
+
+        assert await dao.get_node_degree("a", direction="out", edge_types=["links"]) == {"out": 1}
+        assert "~" not in dao.client.requests[0]["query"]
+
+    def test_declared_edges_have_reverse_index(self, monkeypatch):
+        """Meta.options["edge_predicates"] become [uid] @reverse predicates of the type"""
+        dao = make_dao()
+        monkeypatch.setitem(dao.metadata.options, "edge_predicates", ["links"])
+
+        schema = dao._build_schema()
+
+        assert "sample_nodes.links: [uid] @reverse ." in schema
+        assert "\n  sample_nodes.links" in schema
+
+    @pytest.mark.asyncio
+    async def test_single_node_direction(self):
+        """get_node_degree filters the batched result by direction"""
+        dao = make_dao([self.REVERSE, {"nodes": [{"sample_nodes.id": "a", "out0": 2, "in0": 5}]}])
+
+        assert await dao.get_node_degree("a", direction="in", edge_types=["links"]) == {"in": 5}
+        assert len(dao.client.requests) == 2
+
+
+class TestDgraphCreate:
+    """Test create mutations and the streaming importer"""
+
+    @pytest.mark.asyncio
+    async def test_create_uses_set_obj(self):
+        """create commits one prefixed set_obj mutation"""
+        dao = make_dao()
+
+        node_id = await dao.create(SampleNode(id="node-1", name="alpha", tags=["x"]))
+
+        assert node_id == "node-1"
+        mutation = dao.client.requests[0]["mutations"][0]
+        assert mutation["commit_now"] is True
+        assert mutation["set_obj"]["sample_nodes.name"] == "alpha"
+        assert mutation["set_obj"]["sample_nodes.tags"] == '["x"]'
+        assert mutation["set_obj"]["dgraph.type"] == "sample_nodes"
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_chunks(self):
+        """bulk_create writes one mutation per chunk"""
+        dao = make_dao()
+        nodes = [SampleNode(id=f"node-{i}", name=f"n{i}") for i in range(5)]
+
+        ids = await dao.bulk_create(nodes, chunk_size=2)
+
+        assert ids == [f"node-{i}" for i in range(5)]
+        assert [len(request["mutations"][0]["set_obj"]) for request in dao.client.requests] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_import_stream(self):
+        """Nodes and edges are imported as N-Quad chunks with uid mapping"""
+        dao = make_dao([{"nodes": [{"uid": "0xff", "sample_nodes.id": "existing"}]}])
+        progress: list[dict[str, Any]] = []
+
+        async def stream():
+            yield SampleNode(id="a", name="A")
+            yield SampleNode(id="b", name='B "quoted"')
+            yield ("a", "links", "b")
+            yield SampleNode(id="c", name="C")
+            yield ("c", "links", "a")
+            yield ("c", "links", "existing")
+            yield ("c", "links", "missing")
+
+        stats = await dao.import_stream(stream(), chunk_size=3, concurrency=2, progress=progress.append)
+
+        assert stats["nodes"] == 3
+        assert stats["edges"] == 3
+        assert stats["skipped_edges"] == 1
+        assert stats["chunks"] == len(progress) == 3
+        nquads = [request["mutations"][0]["set_nquads"] for request in dao.client.requests if "mutations" in request and request["mutations"]]
+        assert '_:n2 <sample_nodes.name> "B \\"quoted\\"" .' in nquads[0]
+        assert "_:n1 <sample_nodes.links> _:n2 ." in nquads[0]
+        # Edges to nodes of in-flight chunks or outside the stream are resolved afterwards
+        assert nquads[2].splitlines() == ["<0x3> <sample_nodes.links> <0x1> .", "<0x3> <sample_nodes.links> <0xff> ."]
+        assert 'eq(sample_nodes.id, ["existing", "missing"])' in dao.client.requests[2]["query"]
+
+
+class TestDgraphFindByIds:
+    """Test multi-ID lookups"""
+
+    @pytest.mark.asyncio
+    async def test_find_by_ids_single_query(self):
+        """IDs are looked up with one eq list query"""
+        dao = make_dao([{"items": [{"uid": "0x1", "sample_nodes.id": "a", "sample_nodes.name": "A"}]}])
+
+        found = await dao.find_by_ids(["a", "b", "a"])
+
+        assert list(found) == ["a"]
+        assert found["a"].name == "A"
+        assert len(dao.client.requests) == 1
+        assert 'eq(sample_nodes.id, ["a", "b"])' in dao.client.requests[0]["query"]
@@ -8,8 +8,9 @@ import yaml
 
 from backend.dataops.enhanced_decorators import sensitive_field
 from backend.dataops.security_model import SecuredStorageModel, SecurityContext
+from backend.dataops.session import get_current_session
 from backend.dataops.storage_model import StorageModel
-from backend.mcp.dataops.server import DataOpsMCPServer
+from backend.mcp.dataops.server import DataOpsMCPServer, DataOpsResponse
 
 
 class SampleModel(StorageModel):
@@ -210,6 +211,32 @@ class TestDataOpsMCPServer:
         assert response.success is False
         assert "Transaction failed" in response.error or "Batch operation failed" in response.error
 
+    @pytest.mark.asyncio
+    async def test_dataops_batch_session_per_context(self, server, context, monkeypatch):
+        """Operations with their own context never share the batch context's identity map"""
+        other = {"user_id": "other_user", "roles": ["member"], "session_id": "other_session"}
+        seen = []
+
+        async def handle(operation, model, data=None, data_format="dict", context=None):  # noqa: ARG001
+            seen.append((context, get_current_session()))
+            return DataOpsResponse(success=True, data={})
+
+        monkeypatch.setattr(server, "_handle_dataops", handle)
+        operations = [
+            {"operation": "read", "model": "SampleModel", "data": {"id": "a"}},
+            {"operation": "read", "model": "SampleModel", "data": {"id": "b"}},
+            {"operation": "read", "model": "SampleModel", "data": {"id": "a"}, "context": other},
+            {"operation": "read", "model": "SampleModel", "data": {"id": "a"}},
+        ]
+
+        response = await server._handle_batch(operations=operations, context=context)
+
+        assert response.data["executed"] == 4
+        sessions = [session for _, session in seen]
+        assert [session.context for session in sessions] == [context, context, other, context]
+        assert sessions[0] is sessions[1]
+        assert len({id(session) for session in sessions}) == 3
+
     def test_model_info_structure(self, server):
         """Test model info structure"""
         info = server._get_model_info(SampleModel)
@@ -0,0 +1,149 @@
+"""
+Tests for the compiled per-class storage codecs
+"""
+from datetime import datetime
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from backend.dataops.bpmn_model import ProcessInstance
+from backend.dataops.dao import BaseDAO
+from backend.dataops.security_model import ACLEntry, Permission, SecuredStorageModel
+from backend.dataops.storage_model import StorageModel
+
+
+class CodecItem(SecuredStorageModel):
+    """Secured test model with nested, datetime and container fields"""
+
+    name: str
+    due: datetime | None = None
+    labels: tuple[str, ...] = ()
+    payload: dict[str, int] = {}
+
+
+class TestModelCodec:
+    """Test compilation, dumping and hydration"""
+
+    def test_codec_is_compiled_per_class(self):
+        """Each subclass gets its own codec with precomputed field lists"""
+        codec = CodecItem.get_codec()
+
+        assert codec is CodecItem.get_codec()
+        assert codec is not ProcessInstance.get_codec()
+        assert set(codec.datetime_fields) == {"created_at", "updated_at", "due"}
+        assert set(codec.adapters) == {"acl", "auth_rules", "labels"}
+        assert codec.required_fields == {"name"}
+
+    def test_round_trip(self):
+        """Validated and trusted loads both restore the original instance"""
+        item = CodecItem(
+            name="a",
+            due=datetime(2025, 1, 2, 3, 4, 5),
+            labels=("x", "y"),
+            acl=[ACLEntry(principal_id="u1", principal_type="user", permissions=[Permission.READ], granted_by="system")],
+        )
+        data = item.to_storage_dict()
+        assert data["due"] == "2025-01-02T03:04:05"
+
+        for trusted in (False, True):
+            loaded = CodecItem.from_storage_dict(dict(data), trusted=trusted)
+            # Compared by data: only the loaded instance carries change tracking state
+            assert loaded.model_dump() == item.model_dump()
+            assert isinstance(loaded.acl[0], ACLEntry)
+            assert loaded.labels == ("x", "y")
+
+        assert CodecItem.from_storage_dict(CodecItem(name="b").to_storage_dict(), trusted=True).labels == ()
+
+    def test_trusted_load_skips_validation(self):
+        """Trusted records are not re-validated and the input is left alone"""
+        data = CodecItem(name="a").to_storage_dict()
+        data["payload"] = {"n": "not-a-number"}
+
+        with pytest.raises(ValidationError):
+            CodecItem.from_storage_dict(data)
+        loaded = CodecItem.from_storage_dict(data, trusted=True)
+        assert loaded.payload == {"n": "not-a-number"}
+        assert loaded.model_fields_set == set(data)
+        assert isinstance(data["created_at"], str)
+
+    def test_trusted_load_validates_incomplete_records(self):
+        """Records missing a required field fall back to validation"""
+        with pytest.raises(ValidationError):
+            CodecItem.from_storage_dict({"id": "a"}, trusted=True)
+
+    def test_base_model_compiles_lazily(self):
+        """The base class builds its codec on first use"""
+        assert StorageModel.get_codec().model_cls is StorageModel
+
+
+class UpsertDAO:
+    """Records upserts; create/update stand in for a backend without native upsert"""
+
+    def __init__(self, existing: set[str] | None = None):
+        self.existing = existing or set()
+        self.calls: list[tuple[str, Any]] = []
+
+    async def upsert(self, instance: StorageModel, changes: dict[str, Any] | None = None) -> str:
+        return await BaseDAO.upsert(self, instance, changes)  # type: ignore[arg-type]
+
+    async def update(self, item_id: str, data: dict[str, Any]) -> bool:
+        self.calls.append(("update", dict(data)))
+        return item_id in self.existing
+
+    async def create(self, instance: StorageModel) -> str:
+        self.calls.append(("create", instance.id))
+        self.existing.add(instance.id)
+        return instance.id
+
+
+class TestChangeTracking:
+    """Test dirty-field tracking and save"""
+
+    def test_loaded_instance_tracks_assigned_and_in_place_changes(self):
+        """Assignments and edits of mutable fields are reported, nothing else"""
+        item = CodecItem.from_storage_dict(CodecItem(name="a", payload={"n": 1}).to_storage_dict(), trusted=True)
+        assert item.get_changes() == {}
+
+        item.name = "b"
+        item.payload["m"] = 2
+        assert item.get_changes() == {"name": "b", "payload": {"n": 1, "m": 2}}
+
+        item.acl.append(ACLEntry(principal_id="u1", principal_type="user", permissions=[Permission.READ], granted_by="system"))
+        assert set(item.get_changes()) == {"name", "payload", "acl"}
+        assert set(item.model_copy(deep=True).get_changes()) == {"name", "payload", "acl"}
+        assert item == item.model_copy()
+
+    def test_new_instance_state_is_unknown(self):
+        """Instances never loaded or saved have no change set"""
+        assert CodecItem(name="a").get_changes() is None
+
+    async def test_save_sends_only_changes(self, monkeypatch):
+        """One update with the changed fields; no call at all without changes"""
+        item = CodecItem.from_storage_dict(CodecItem(name="a").to_storage_dict(), trusted=True)
+        dao = UpsertDAO({item.id})
+        monkeypatch.setattr(CodecItem, "_daos", dict.fromkeys(CodecItem.get_storage_configs(), dao))
+
+        await item.save()
+        assert dao.calls == []
+
+        item.name = "b"
+        await item.save()
+        assert len(dao.calls) == 1
+        operation, data = dao.calls[0]
+        assert operation == "update"
+        assert set(data) == {"name", "updated_at"}
+        assert item.get_changes() == {}
+
+    async def test_save_creates_missing_records(self, monkeypatch):
+        """New instances are written whole, then tracked"""
+        item = CodecItem(name="a")
+        dao = UpsertDAO()
+        monkeypatch.setattr(CodecItem, "_daos", dict.fromkeys(CodecItem.get_storage_configs(), dao))
+
+        await item.save()
+        assert [operation for operation, _ in dao.calls] == ["update", "create"]
+        assert dao.calls[0][1] == item.to_storage_dict()
+
+        await item.save()
+        assert len(dao.calls) == 2
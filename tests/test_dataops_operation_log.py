@@ -0,0 +1,54 @@
+"""
+Tests for the bounded operations log and its metrics
+"""
+from backend.dataops.operation_log import MAX_ERROR_LENGTH, OperationLog
+
+
+class TestOperationLog:
+    """Test retention and aggregation"""
+
+    def test_keeps_only_recent_entries(self):
+        """The log never grows past its capacity"""
+        log = OperationLog(capacity=3)
+
+        for index in range(10):
+            log.record("graph", "create", "success", item_id=str(index))
+
+        assert len(log) == 3
+        assert [entry.item_id for entry in log.entries()] == ["7", "8", "9"]
+        assert log.get_metrics()["graph"]["create"]["count"] == 10
+
+    def test_metrics_count_outcomes_and_latency(self):
+        """Counters and histogram percentiles are kept per storage and operation"""
+        log = OperationLog()
+        for _ in range(94):
+            log.record("graph", "update", "success", 0.002)
+        for _ in range(5):
+            log.record("graph", "update", "failed", 0.3, error="down")
+        log.record("graph", "update", "skipped", 0.0)
+        log.observe("document", "read", "success", 0.02)
+
+        update = log.get_metrics()["graph"]["update"]
+        assert (update["count"], update["failed"], update["skipped"]) == (100, 5, 1)
+        assert update["p50"] == 0.0025
+        assert update["p99"] == 0.5
+        assert update["max_latency"] == 0.3
+        assert sum(update["histogram"].values()) == 100
+        assert log.get_metrics()["document"]["read"]["count"] == 1
+        assert len(log) == 100
+
+    def test_long_errors_are_truncated(self):
+        """Entries hold a bounded error message"""
+        log = OperationLog()
+        log.record("graph", "create", "failed", error="x" * 10_000)
+
+        assert len(log.entries()[0].error) == MAX_ERROR_LENGTH + 3
+
+    def test_clear(self):
+        """Clearing drops entries and metrics"""
+        log = OperationLog()
+        log.record("graph", "create", "success")
+        log.clear()
+
+        assert log.entries() == []
+        assert log.get_metrics() == {}
@@ -0,0 +1,192 @@
+"""
+Tests for the durable EVENTUAL-mode outbox
+"""
+import asyncio
+from typing import Any
+
+import pytest
+
+from backend.dataops.outbox import SyncOutbox, default_outbox_path
+from backend.dataops.storage_model import StorageModel
+from backend.dataops.storage_types import StorageConfig, StorageType
+from backend.dataops.unified_crud import SyncStrategy, UnifiedCRUD
+
+
+class OutboxItem(StorageModel):
+    """Test model with a primary and a secondary storage"""
+
+    name: str
+
+    class Meta:
+        storage_configs = {
+            "graph": StorageConfig(storage_type=StorageType.GRAPH),
+            "document": StorageConfig(storage_type=StorageType.DOCUMENT),
+        }
+        path = "outbox_items"
+
+
+class RecordingDAO:
+    """In-memory DAO with bulk methods that can be made to fail"""
+
+    def __init__(self):
+        self.records: dict[str, dict[str, Any]] = {}
+        self.calls: list[tuple[str, int]] = []
+        self.failures = 0
+
+    def _check(self, name: str, size: int) -> None:
+        self.calls.append((name, size))
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("unavailable")
+
+    async def connect(self) -> None:
+        pass
+
+    async def create(self, instance: OutboxItem) -> str:
+        self.records[instance.id] = instance.to_storage_dict()
+        return instance.id
+
+    async def bulk_create(self, instances: list[OutboxItem]) -> list[str]:
+        self._check("bulk_create", len(instances))
+        for instance in instances:
+            self.records[instance.id] = instance.to_storage_dict()
+        return [instance.id for instance in instances]
+
+    async def find_by_id(self, item_id: str) -> OutboxItem | None:
+        record = self.records.get(item_id)
+        return OutboxItem.from_storage_dict(dict(record)) if record else None
+
+    async def update(self, item_id: str, data: dict[str, Any]) -> bool:
+        self.records[item_id].update(data)
+        return True
+
+    async def bulk_update(self, updates: list[dict[str, Any]]) -> int:
+        self._check("bulk_update", len(updates))
+        for update in updates:
+            self.records[update["id"]].update(update)
+        return len(updates)
+
+    async def bulk_delete(self, ids: list[str]) -> int:
+        self._check("bulk_delete", len(ids))
+        return sum(1 for item_id in ids if self.records.pop(item_id, None) is not None)
+
+
+@pytest.fixture
+def daos():
+    """Install recording DAOs on the test model"""
+    graph, document = RecordingDAO(), RecordingDAO()
+    OutboxItem._daos = {"graph": graph, "document": document}
+    yield {"graph": graph, "document": document}
+    OutboxItem._daos = {}
+
+
+@pytest.fixture
+async def outbox(tmp_path):
+    """Outbox in a temporary file with fast retries"""
+    box = SyncOutbox(tmp_path / "outbox.db", base_delay=0.01, max_delay=0.02, poll_interval=0.01)
+    yield box
+    await box.stop()
+    box.close()
+
+
+class TestSyncOutbox:
+    """Test persistence, batching and retries"""
+
+    @pytest.mark.asyncio
+    async def test_entries_survive_reopen(self, tmp_path, daos):
+        """Queued writes are read back from disk by a new outbox"""
+        first = SyncOutbox(tmp_path / "outbox.db")
+        await first.enqueue(OutboxItem, "create", "a", {"id": "a", "name": "A"}, ["document"])
+        await first.stop()
+        first.close()
+
+        second = SyncOutbox(tmp_path / "outbox.db")
+        second.register(OutboxItem)
+        assert second.depth == 1
+        await second.flush(timeout=1)
+        await second.stop()
+        second.close()
+
+        assert daos["document"].records["a"]["name"] == "A"
+
+    @pytest.mark.asyncio
+    async def test_consecutive_operations_are_batched_in_order(self, outbox, daos):
+        """Runs of the same operation become one bulk call, applied FIFO"""
+        outbox.autostart = False
+        for item_id in ("a", "b", "c"):
+            await outbox.enqueue(OutboxItem, "create", item_id, {"id": item_id, "name": item_id}, ["document"])
+        await outbox.enqueue(OutboxItem, "update", "a", {"name": "A2"}, ["document"])
+        await outbox.enqueue(OutboxItem, "delete", "b", {}, ["document"])
+
+        await outbox.flush(timeout=1)
+
+        assert daos["document"].calls == [("bulk_create", 3), ("bulk_update", 1), ("bulk_delete", 1)]
+        assert daos["document"].records == {"a": {**daos["document"].records["a"], "name": "A2"}, "c": daos["document"].records["c"]}
+        assert outbox.get_stats()["depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_back_off_and_retry(self, outbox, daos):
+        """A failing storage is retried until the writes land"""
+        daos["document"].failures = 2
+        await outbox.enqueue(OutboxItem, "create", "a", {"id": "a", "name": "A"}, ["document"])
+
+        await outbox.flush(timeout=2)
+
+        assert "a" in daos["document"].records
+        stats = outbox.get_stats()
+        assert stats["failed_batches"] == 2
+        assert stats["applied"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unregistered_entries_do_not_block_registered_ones(self, outbox, daos):
+        """Entries of models this process does not know wait without starving the rest"""
+        outbox.autostart = False
+        outbox.batch_size, outbox.concurrency = 1, 1
+        # Left behind by a process with other models
+        outbox._insert([("OtherModel", "document", "create", f"x{n}", "{}") for n in range(3)])
+        outbox._depth += 3
+        await outbox.enqueue(OutboxItem, "create", "a", {"id": "a", "name": "A"}, ["document"])
+
+        await asyncio.wait_for(outbox.flush(), 1)
+
+        assert "a" in daos["document"].records
+        assert outbox.depth == 3
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_storage_backs_off_and_drainer_survives(self, outbox, daos):
+        """A storage whose DAO cannot be created fails its group only"""
+        await outbox.enqueue(OutboxItem, "create", "a", {"id": "a", "name": "A"}, ["missing"])
+        await outbox.enqueue(OutboxItem, "create", "b", {"id": "b", "name": "B"}, ["document"])
+
+        for _ in range(100):
+            if "b" in daos["document"].records and outbox.get_stats()["failed_batches"] >= 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert "b" in daos["document"].records
+        assert outbox.get_stats()["failed_batches"] >= 2
+        assert not outbox._drainer.done()
+        assert outbox.depth == 1
+
+    def test_default_path_comes_from_environment(self, tmp_path, monkeypatch):
+        """The default file is configurable and lives outside the source tree"""
+        monkeypatch.setenv("DATAOPS_OUTBOX_PATH", str(tmp_path / "box.db"))
+        assert default_outbox_path() == tmp_path / "box.db"
+
+        monkeypatch.delenv("DATAOPS_OUTBOX_PATH")
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+        assert default_outbox_path() == tmp_path / "state" / "dataops" / "outbox.db"
+
+    @pytest.mark.asyncio
+    async def test_eventual_crud_writes_primary_then_drains(self, outbox, daos):
+        """EVENTUAL mode returns after the primary write and converges via the outbox"""
+        crud = UnifiedCRUD(OutboxItem, sync_strategy=SyncStrategy.EVENTUAL, security_enabled=False, outbox=outbox)
+
+        instance = await crud.create({"name": "A"})
+        assert instance.id in daos["graph"].records
+
+        await crud.update(instance.id, {"name": "B"})
+        await outbox.flush(timeout=1)
+
+        assert daos["document"].records[instance.id]["name"] == "B"
+        assert crud.get_outbox_stats()["enqueued"] == 2
@@ -172,7 +172,7 @@ class TestUnifiedCRUD:
         assert crud.model_cls == SampleModel
         assert crud.sync_strategy == SyncStrategy.PRIMARY_FIRST
         assert crud.security_enabled is True
-        assert crud._operations_log == []
+        assert crud.get_operations_log() == []
 
     def test_sync_strategy_enum(self):
         """Test sync strategy enum values"""
@@ -191,11 +191,8 @@ class TestUnifiedCRUD:
 
     def test_operations_log(self, crud):
         """Test operations log management"""
-        from backend.dataops.unified_crud import StorageOperation
-
         # Add operation to log
-        op = StorageOperation(storage_name="graph", operation="create", data={"name": "test"}, status="success")
-        crud._operations_log.append(op)
+        crud._operations_log.record("graph", "create", "success", 0.01, item_id="test")
 
         # Check log
         log = crud.get_operations_log()
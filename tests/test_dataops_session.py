@@ -0,0 +1,174 @@
+"""
+Tests for the unit-of-work session and its identity map
+"""
+from typing import Any
+
+import pytest
+
+from backend.dataops.outbox import SyncOutbox
+from backend.dataops.session import Session, get_current_session
+from backend.dataops.storage_model import StorageModel
+from backend.dataops.storage_types import StorageConfig, StorageType
+from backend.dataops.unified_crud import SyncStrategy, UnifiedCRUD, _crud_registry, get_crud
+
+
+class SessionItem(StorageModel):
+    """Test model with a primary and a secondary storage"""
+
+    name: str
+    tags: list[str] = []
+
+    class Meta:
+        storage_configs = {
+            "graph": StorageConfig(storage_type=StorageType.GRAPH),
+            "document": StorageConfig(storage_type=StorageType.DOCUMENT),
+        }
+        path = "session_items"
+
+
+class RecordingDAO:
+    """In-memory DAO recording every call"""
+
+    def __init__(self):
+        self.model_cls = SessionItem
+        self.records: dict[str, dict[str, Any]] = {}
+        self.calls: list[tuple[str, Any]] = []
+
+    async def connect(self) -> None:
+        pass
+
+    async def find_by_id(self, item_id: str) -> SessionItem | None:
+        self.calls.append(("find_by_id", item_id))
+        record = self.records.get(item_id)
+        return SessionItem.from_storage_dict(dict(record)) if record else None
+
+    async def find_by_ids(self, item_ids: list[str]) -> dict[str, SessionItem]:
+        self.calls.append(("find_by_ids", item_ids))
+        return {item_id: SessionItem.from_storage_dict(dict(self.records[item_id])) for item_id in item_ids if item_id in self.records}
+
+    async def create(self, instance: SessionItem) -> str:
+        self.calls.append(("create", instance.id))
+        self.records[instance.id] = instance.to_storage_dict()
+        return instance.id
+
+    async def update(self, item_id: str, data: dict[str, Any]) -> bool:
+        self.calls.append(("update", item_id))
+        self.records[item_id].update(data)
+        return True
+
+    async def delete(self, item_id: str) -> bool:
+        self.calls.append(("delete", item_id))
+        return self.records.pop(item_id, None) is not None
+
+    async def bulk_create(self, instances: list[SessionItem]) -> list[str]:
+        self.calls.append(("bulk_create", [instance.id for instance in instances]))
+        for instance in instances:
+            self.records[instance.id] = instance.to_storage_dict()
+        return [instance.id for instance in instances]
+
+    async def bulk_update(self, updates: list[dict[str, Any]]) -> int:
+        self.calls.append(("bulk_update", updates))
+        for update in updates:
+            self.records[update["id"]].update(update)
+        return len(updates)
+
+    async def bulk_delete(self, ids: list[str]) -> int:
+        self.calls.append(("bulk_delete", ids))
+        return sum(1 for item_id in ids if self.records.pop(item_id, None) is not None)
+
+
+@pytest.fixture
+def daos():
+    """Install recording DAOs holding two records"""
+    graph, document = RecordingDAO(), RecordingDAO()
+    for dao in (graph, document):
+        for item_id in ("a", "b"):
+            dao.records[item_id] = SessionItem(id=item_id, name=item_id.upper(), tags=["x"] * 50).to_storage_dict()
+    SessionItem._daos = {"graph": graph, "document": document}
+    yield {"graph": graph, "document": document}
+    SessionItem._daos = {}
+
+
+class TestSession:
+    """Test identity map, dirty tracking and batched flushes"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_loads_share_one_instance(self, daos):
+        """Every load path returns the session's instance after one backend call"""
+        crud = get_crud(SessionItem)
+        async with Session() as session:
+            first = await crud.read("a")
+            assert await crud.read("a") is first
+            assert await SessionItem.find_by_id("a") is first
+            assert await session.get(SessionItem, "a") is first
+            assert session.stats["hits"] == 3
+
+        assert daos["graph"].calls == [("find_by_ids", ["a"])]
+        assert get_current_session() is None
+
+    @pytest.mark.asyncio
+    async def test_commit_groups_changes_per_storage(self, daos):
+        """Creates, in-place changes and deletes become one bulk call each per storage"""
+        async with Session() as session:
+            first, second = await session.get(SessionItem, "a"), await session.get(SessionItem, "b")
+            first.name = "A2"
+            session.delete(second)
+            created = session.add(SessionItem(name="C"))
+            assert session.dirty == [first]
+
+        for dao in daos.values():
+            assert [call for call, _ in dao.calls if call.startswith("bulk_")] == ["bulk_create", "bulk_update", "bulk_delete"]
+            assert ("bulk_update", [{"name": "A2", "id": "a"}]) in dao.calls
+            assert dao.records["a"]["name"] == "A2"
+            assert "b" not in dao.records
+            assert created.id in dao.records
+
+    @pytest.mark.asyncio
+    async def test_eventual_flush_queues_secondary_writes(self, daos, tmp_path, monkeypatch):
+        """With EVENTUAL sync, a flush writes the primary storage and leaves the others to the outbox"""
+        outbox = SyncOutbox(tmp_path / "outbox.db", autostart=False)
+        monkeypatch.setitem(_crud_registry, SessionItem, UnifiedCRUD(SessionItem, sync_strategy=SyncStrategy.EVENTUAL, outbox=outbox))
+        async with Session() as session:
+            (await session.get(SessionItem, "a")).name = "A2"
+            created = session.add(SessionItem(name="C"))
+
+        assert daos["graph"].records["a"]["name"] == "A2"
+        assert [call for call, _ in daos["document"].calls] == []
+        assert outbox.depth == 2
+
+        await outbox.flush(timeout=1)
+        outbox.close()
+        assert daos["document"].records["a"]["name"] == "A2"
+        assert created.id in daos["document"].records
+
+    @pytest.mark.asyncio
+    async def test_clean_session_writes_nothing(self, daos):
+        """Loading without changing anything sends no writes"""
+        async with Session() as session:
+            await session.get(SessionItem, "a")
+
+        assert [call for call, _ in daos["document"].calls] == []
+        assert session.stats["flushes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_discard_pending_changes(self, daos):
+        """A failing block writes nothing"""
+        with pytest.raises(RuntimeError):
+            async with Session() as session:
+                (await session.get(SessionItem, "a")).name = "lost"
+                session.add(SessionItem(name="C"))
+                raise RuntimeError("abort")
+
+        assert daos["graph"].records["a"]["name"] == "A"
+        assert len(daos["graph"].records) == 2
+
+    @pytest.mark.asyncio
+    async def test_update_reuses_loaded_instance(self, daos):
+        """UnifiedCRUD.update inside a session does not reload the record"""
+        crud = get_crud(SessionItem)
+        async with Session() as session:
+            await session.get(SessionItem, "a")
+            updated = await crud.update("a", {"name": "A3"})
+            assert await crud.read("a") is updated
+
+        assert [call for call, _ in daos["graph"].calls] == ["find_by_ids", "update"]
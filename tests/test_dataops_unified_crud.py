@@ -0,0 +1,726 @@
+"""
+Tests for UnifiedCRUD read paths and multi-storage behaviour (in-memory DAOs)
+"""
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from backend.dataops.exceptions import CircuitOpenError, StorageError
+from backend.dataops.read_routing import ReadRouter
+from backend.dataops.reconciliation import DEFAULT_BUCKET_PREFIX, DigestTree, time_bucket
+from backend.dataops.storage_model import StorageModel
+from backend.dataops.storage_types import StorageConfig, StorageType
+from backend.dataops.unified_crud import UnifiedCRUD
+
+
+class CrudItem(StorageModel):
+    """Test model stored in a graph and a cache"""
+
+    name: str
+    count: int = 0
+
+    class Meta:
+        storage_configs = {
+            "graph": StorageConfig(storage_type=StorageType.GRAPH),
+            "cache": StorageConfig(storage_type=StorageType.CACHE),
+        }
+        path = "crud_items"
+
+
+class MirroredItem(StorageModel):
+    """Test model stored in two primary-like storages"""
+
+    name: str
+
+    class Meta:
+        storage_configs = {
+            "graph": StorageConfig(storage_type=StorageType.GRAPH),
+            "document": StorageConfig(storage_type=StorageType.DOCUMENT),
+        }
+        path = "mirrored_items"
+        options = {"bulk_chunk_size": 2}
+
+
+class MemoryDAO:
+    """In-memory DAO recording every call"""
+
+    def __init__(self, delay: float = 0.0, error: Exception | None = None):
+        self.model_cls = CrudItem
+        self.records: dict[str, CrudItem] = {}
+        self.entries: dict[str, tuple[dict[str, Any], int]] = {}
+        self.calls: list[tuple[str, Any]] = []
+        self.delay = delay
+        self.error = error
+
+    async def _call(self, name: str, arg: Any) -> None:
+        self.calls.append((name, arg))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+
+    def count_calls(self, name: str) -> int:
+        return sum(1 for call, _ in self.calls if call == name)
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def create(self, instance: CrudItem) -> str:
+        await self._call("create", instance.id)
+        self.records[instance.id] = instance.model_copy()
+        return instance.id
+
+    async def find_by_id(self, item_id: str) -> CrudItem | None:
+        await self._call("find_by_id", item_id)
+        return self.records.get(item_id)
+
+    async def find_by_ids(self, item_ids: list[str]) -> dict[str, CrudItem]:
+        await self._call("find_by_ids", item_ids)
+        return {item_id: self.records[item_id] for item_id in item_ids if item_id in self.records}
+
+    async def find(self, query: dict[str, Any], limit: int | None = None, skip: int = 0) -> list[CrudItem]:
+        await self._call("find", query)
+        matches = [record for record in self.records.values() if all(getattr(record, key) == value for key, value in query.items())]
+        return matches[skip : skip + limit if limit else None]
+
+    async def update(self, item_id: str, data: dict[str, Any]) -> bool:
+        await self._call("update", item_id)
+        if item_id not in self.records:
+            return False
+        self.records[item_id] = self.records[item_id].model_copy(update=data)
+        return True
+
+    async def delete(self, item_id: str) -> bool:
+        await self._call("delete", item_id)
+        deleted = self.entries.pop(item_id, None) is not None
+        return self.records.pop(item_id, None) is not None or deleted
+
+    async def get_cached(self, item_id: str) -> dict[str, Any] | None:
+        await self._call("get_cached", item_id)
+        entry = self.entries.get(item_id)
+        return dict(entry[0]) if entry else None
+
+    async def set_cached(self, item_id: str, data: dict[str, Any], ttl: int) -> None:
+        await self._call("set_cached", item_id)
+        self.entries[item_id] = (dict(data), ttl)
+
+
+class BulkMemoryDAO(MemoryDAO):
+    """In-memory DAO with bulk operations that fail whole chunks on bad IDs"""
+
+    def __init__(self, failing: set[str] | None = None):
+        super().__init__()
+        self.failing = failing or set()
+
+    async def create(self, instance: CrudItem) -> str:
+        if instance.id in self.failing:
+            raise RuntimeError(f"rejected {instance.id}")
+        return await super().create(instance)
+
+    async def bulk_create(self, instances: list[CrudItem]) -> list[str]:
+        await self._call("bulk_create", [instance.id for instance in instances])
+        if any(instance.id in self.failing for instance in instances):
+            raise RuntimeError("chunk rejected")
+        for instance in instances:
+            self.records[instance.id] = instance
+        return [instance.id for instance in instances]
+
+    async def bulk_delete(self, ids: list[str]) -> int:
+        await self._call("bulk_delete", ids)
+        return sum(1 for item_id in ids if self.records.pop(item_id, None) is not None)
+
+
+@pytest.fixture
+def daos():
+    """Install in-memory DAOs on the test model"""
+    graph, cache = MemoryDAO(), MemoryDAO()
+    CrudItem._daos = {"graph": graph, "cache": cache}
+    yield {"graph": graph, "cache": cache}
+    CrudItem._daos = {}
+
+
+class TestReadCoalescing:
+    """Test singleflight deduplication of concurrent reads"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_backend_call(self, daos):
+        """Concurrent reads of one record hit the backend once"""
+        daos["graph"].records["a"] = CrudItem(id="a", name="A")
+        daos["graph"].delay = 0.01
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+
+        results = await asyncio.gather(*(crud.read("a", storage_name="graph") for _ in range(10)))
+
+        assert all(result.name == "A" for result in results)
+        assert daos["graph"].count_calls("find_by_id") == 1
+        assert crud.get_read_stats() == {"reads": 10, "backend_reads": 1, "coalesced": 9, "errors": 0, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_coalesced_readers_get_their_own_copy(self, daos):
+        """Editing one coalesced result does not change what the others see"""
+        daos["graph"].records["a"] = CrudItem(id="a", name="A")
+        daos["graph"].delay = 0.01
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+
+        first, second = await asyncio.gather(crud.read("a", storage_name="graph"), crud.read("a", storage_name="graph"))
+        first.name = "changed"
+
+        assert first is not second
+        assert second.name == "A"
+
+    @pytest.mark.asyncio
+    async def test_errors_fan_out(self, daos):
+        """A failing backend read fails every waiter once"""
+        daos["graph"].delay = 0.01
+        daos["graph"].error = RuntimeError("down")
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+
+        results = await asyncio.gather(*(crud.read("a", storage_name="graph") for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert daos["graph"].count_calls("find_by_id") == 1
+        assert crud.get_read_stats()["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sequential_reads_are_not_coalesced(self, daos):
+        """Completed reads are not reused"""
+        daos["graph"].records["a"] = CrudItem(id="a", name="A")
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+
+        await crud.read("a", storage_name="graph")
+        await crud.read("a", storage_name="graph")
+
+        assert daos["graph"].count_calls("find_by_id") == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self, daos):
+        """Cancelling one reader leaves the shared call running"""
+        daos["graph"].records["a"] = CrudItem(id="a", name="A")
+        daos["graph"].delay = 0.02
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+
+        first = asyncio.create_task(crud.read("a", storage_name="graph"))
+        second = asyncio.create_task(crud.read("a", storage_name="graph"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second).name == "A"
+        assert daos["graph"].count_calls("find_by_id") == 1
+
+
+class TestReadThroughCache:
+    """Test the CACHE storage as a read-through tier"""
+
+    @pytest.mark.asyncio
+    async def test_miss_fills_cache_then_hits(self, daos):
+        """The first read goes to the primary, later reads are served by the cache"""
+        daos["graph"].records["a"] = CrudItem(id="a", name="A")
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+
+        first = await crud.read("a")
+        second = await crud.read("a")
+
+        assert first.name == second.name == "A"
+        assert daos["graph"].count_calls("find_by_id") == 1
+        assert daos["cache"].entries["a"][1] == 300
+        stats = crud.get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+    @pytest.mark.asyncio
+    async def test_missing_records_are_cached_briefly(self, daos, monkeypatch):
+        """Not-found results are cached with the model's negative TTL"""
+        monkeypatch.setattr(CrudItem.get_metadata(), "options", {"cache_ttl": 60, "cache_negative_ttl": 5})
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+
+        assert await crud.read("missing") is None
+        assert await crud.read("missing") is None
+
+        assert daos["graph"].count_calls("find_by_id") == 1
+        assert daos["cache"].entries["missing"][1] == 5
+        assert crud.get_cache_stats()["negative_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_create_writes_through(self, daos):
+        """Creates skip the cache fan-out and replace a cached miss"""
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+        assert await crud.read("a") is None
+
+        await crud.create({"id": "a", "name": "A"})
+
+        assert daos["cache"].count_calls("create") == 0
+        assert (await crud.read("a")).name == "A"
+        assert daos["graph"].count_calls("find_by_id") == 1
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_invalidate(self, daos):
+        """Writes drop the cached copy so the next read sees the change"""
+        daos["graph"].records["a"] = CrudItem(id="a", name="A")
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+        await crud.read("a")
+
+        updated = await crud.update("a", {"count": 2})
+        assert updated.count == 2
+        assert daos["cache"].count_calls("update") == 0
+        assert (await crud.read("a")).count == 2
+
+        assert await crud.delete("a") is True
+        assert await crud.read("a") is None
+        assert crud.get_cache_stats()["invalidations"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_failures_fall_back_to_primary(self, daos):
+        """A broken cache degrades to primary reads"""
+        daos["graph"].records["a"] = CrudItem(id="a", name="A")
+        daos["cache"].error = RuntimeError("down")
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+
+        assert (await crud.read("a")).name == "A"
+        assert crud.get_cache_stats()["errors"] == 2
+
+
+@pytest.fixture
+def mirrored_daos():
+    """Install bulk-capable in-memory DAOs on the mirrored model"""
+    graph, document = BulkMemoryDAO(), BulkMemoryDAO()
+    MirroredItem._daos = {"graph": graph, "document": document}
+    yield {"graph": graph, "document": document}
+    MirroredItem._daos = {}
+
+
+class TestBulkOperations:
+    """Test chunked, per-storage bulk create and delete"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_uses_one_call_per_chunk_and_storage(self, mirrored_daos):
+        """Valid items go out in chunks; invalid items are reported up front"""
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+        items = [{"id": f"i{n}", "name": f"Item {n}"} for n in range(5)] + [{"id": "bad"}]
+
+        result = await crud.bulk_create_with_report(items)
+
+        assert result.succeeded == ["i0", "i1", "i2", "i3", "i4"]
+        assert list(result.failed) == ["bad"]
+        for dao in mirrored_daos.values():
+            assert dao.count_calls("bulk_create") == 3
+            assert dao.count_calls("create") == 0
+            assert set(dao.records) == set(result.succeeded)
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_reports_and_rolls_back_failed_items(self, mirrored_daos):
+        """A rejected item fails alone and is removed from the storages it reached"""
+        mirrored_daos["document"].failing = {"i1"}
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        result = await crud.bulk_create_with_report([{"id": f"i{n}", "name": "x"} for n in range(3)])
+
+        assert result.succeeded == ["i0", "i2"]
+        assert result.failed == {"i1": "document: rejected i1"}
+        assert set(mirrored_daos["graph"].records) == {"i0", "i2"}
+        assert set(mirrored_daos["document"].records) == {"i0", "i2"}
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_retry_skips_items_already_written(self, mirrored_daos):
+        """Items a failed bulk create already committed are not created again"""
+        dao = mirrored_daos["document"]
+        dao.failing = {"i3"}
+        bulk_create = dao.bulk_create
+
+        async def partial_bulk_create(instances: list[CrudItem]) -> list[str]:
+            # Commit the items ahead of the rejected one, like a sub-chunked backend
+            for instance in instances:
+                if instance.id in dao.failing:
+                    break
+                dao.records[instance.id] = instance
+            return await bulk_create(instances)
+
+        dao.bulk_create = partial_bulk_create
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        result = await crud.bulk_create_with_report([{"id": f"i{n}", "name": "x"} for n in range(4)])
+
+        assert result.succeeded == ["i0", "i1", "i2"]
+        assert result.failed == {"i3": "document: rejected i3"}
+        assert dao.count_calls("find_by_ids") == 1
+        # Only the rejected i3 was retried, and it fails before being recorded
+        assert dao.count_calls("create") == 0
+        assert set(dao.records) == {"i0", "i1", "i2"}
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_skips_reads_when_not_secured(self, mirrored_daos):
+        """Non-secured bulk deletes go straight to bulk_delete"""
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+        ids = await crud.bulk_create([{"id": f"i{n}", "name": "x"} for n in range(3)])
+
+        assert await crud.bulk_delete(ids + ["missing"]) == 3
+        for dao in mirrored_daos.values():
+            assert dao.count_calls("find_by_id") == 0
+            assert dao.count_calls("bulk_delete") == 2
+            assert dao.records == {}
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_falls_back_to_single_creates(self, daos):
+        """DAOs without bulk_create get per-item creates; the cache tier is skipped"""
+        crud = UnifiedCRUD(CrudItem, security_enabled=False)
+
+        assert await crud.bulk_create([{"id": "a", "name": "A"}, {"id": "b", "name": "B"}]) == ["a", "b"]
+        assert daos["graph"].count_calls("create") == 2
+        assert daos["cache"].calls == []
+
+
+class TestUpdateDeleteRoundTrips:
+    """Test that update and delete avoid redundant backend calls"""
+
+    @pytest.mark.asyncio
+    async def test_update_returns_merged_instance_without_reread(self, mirrored_daos):
+        """One read, one primary write, then the secondaries"""
+        mirrored_daos["graph"].records["a"] = MirroredItem(id="a", name="A")
+        mirrored_daos["document"].records["a"] = MirroredItem(id="a", name="A")
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        updated = await crud.update("a", {"name": "B"})
+
+        assert updated.name == "B"
+        assert mirrored_daos["graph"].count_calls("find_by_id") == 1
+        assert mirrored_daos["document"].count_calls("find_by_id") == 0
+        assert mirrored_daos["document"].records["a"].name == "B"
+
+    @pytest.mark.asyncio
+    async def test_invalid_patch_writes_nothing(self, mirrored_daos):
+        """The merged instance is validated before any storage is touched"""
+        mirrored_daos["graph"].records["a"] = MirroredItem(id="a", name="A")
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        with pytest.raises(ValueError):
+            await crud.update("a", {"name": None})
+        assert mirrored_daos["graph"].count_calls("update") == 0
+
+    @pytest.mark.asyncio
+    async def test_secondary_failures_do_not_fail_update(self, mirrored_daos):
+        """Under PRIMARY_FIRST only the primary write is required"""
+        mirrored_daos["graph"].records["a"] = MirroredItem(id="a", name="A")
+        mirrored_daos["document"].error = RuntimeError("down")
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        assert (await crud.update("a", {"name": "B"})).name == "B"
+        assert [entry.status for entry in crud.get_operations_log()] == ["success", "failed"]
+
+    @pytest.mark.asyncio
+    async def test_unsecured_delete_skips_read(self, mirrored_daos):
+        """Non-secured deletes go straight to the storages"""
+        mirrored_daos["graph"].records["a"] = MirroredItem(id="a", name="A")
+        mirrored_daos["document"].records["a"] = MirroredItem(id="a", name="A")
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        assert await crud.delete("a") is True
+        assert await crud.delete("a") is False
+        assert mirrored_daos["graph"].count_calls("find_by_id") == 0
+
+
+class TestScatterGatherFind:
+    """Test concurrent multi-storage find"""
+
+    @pytest.mark.asyncio
+    async def test_storages_are_queried_concurrently(self, mirrored_daos):
+        """Latency is that of the slowest storage, not the sum"""
+        for dao in mirrored_daos.values():
+            dao.delay = 0.05
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        started = time.monotonic()
+        await crud.find({}, primary_only=False)
+
+        assert time.monotonic() - started < 0.09
+
+    @pytest.mark.asyncio
+    async def test_first_result_per_id_wins_in_priority_order(self, mirrored_daos):
+        """The primary's copy wins even when a secondary answers first"""
+        mirrored_daos["graph"].records = {"a": MirroredItem(id="a", name="graph")}
+        mirrored_daos["document"].records = {"a": MirroredItem(id="a", name="document"), "b": MirroredItem(id="b", name="document")}
+        mirrored_daos["graph"].delay = 0.02
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        results = await crud.find({}, primary_only=False)
+
+        assert [(result.id, result.name) for result in results] == [("a", "graph"), ("b", "document")]
+
+    @pytest.mark.asyncio
+    async def test_slow_storage_is_skipped_after_timeout(self, mirrored_daos):
+        """A storage exceeding the timeout does not hold up the others"""
+        mirrored_daos["graph"].records = {"a": MirroredItem(id="a", name="graph")}
+        mirrored_daos["document"].records = {"b": MirroredItem(id="b", name="document")}
+        mirrored_daos["graph"].delay = 1.0
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        results = await crud.find({}, primary_only=False, timeout=0.02)
+
+        assert [result.id for result in results] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_first_k_returns_early(self, mirrored_daos):
+        """Taking the first K results does not wait for later storages"""
+        mirrored_daos["graph"].records = {"a": MirroredItem(id="a", name="graph"), "b": MirroredItem(id="b", name="graph")}
+        mirrored_daos["document"].delay = 1.0
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        started = time.monotonic()
+        results = await crud.find({}, primary_only=False, first_k=2)
+
+        assert [result.id for result in results] == ["a", "b"]
+        assert time.monotonic() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_all_storages_failing_raises(self, mirrored_daos):
+        """Partial results are fine, no results at all are an error"""
+        for dao in mirrored_daos.values():
+            dao.error = RuntimeError("down")
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        with pytest.raises(StorageError):
+            await crud.find({}, primary_only=False)
+
+
+@pytest.fixture
+def replicated(mirrored_daos, monkeypatch):
+    """Let the document storage serve reads of the mirrored model"""
+    monkeypatch.setattr(MirroredItem.get_metadata(), "options", {"read_replicas": ["document"]})
+    for dao in mirrored_daos.values():
+        dao.records["a"] = MirroredItem(id="a", name="A")
+    return mirrored_daos
+
+
+class TestReadRouting:
+    """Test latency-aware replica selection"""
+
+    @pytest.mark.asyncio
+    async def test_reads_move_to_the_faster_replica(self, replicated):
+        """Once measured, the faster storage serves the reads"""
+        replicated["graph"].delay = 0.02
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False, read_router=ReadRouter())
+
+        for _ in range(6):
+            assert (await crud.read("a")).name == "A"
+
+        assert replicated["graph"].count_calls("find_by_id") == 1
+        assert replicated["document"].count_calls("find_by_id") == 5
+        assert crud.get_routing_stats()["storages"]["document"]["samples"] == 5
+
+    @pytest.mark.asyncio
+    async def test_replica_miss_falls_back_to_primary(self, replicated):
+        """A replica without the record is backed up by the ground truth"""
+        del replicated["document"].records["a"]
+        router = ReadRouter()
+        router.record("MirroredItem", "graph", 0.5, ok=True)
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False, read_router=router)
+
+        assert (await crud.read("a")).name == "A"
+        assert crud.get_routing_stats()["fallbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_replica_is_skipped(self, replicated):
+        """Errors fall back to the primary until the replica is marked unhealthy"""
+        replicated["document"].error = RuntimeError("down")
+        router = ReadRouter(probe_interval=60)
+        router.record("MirroredItem", "graph", 0.5, ok=True)
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False, read_router=router)
+
+        for _ in range(6):
+            assert (await crud.read("a")).name == "A"
+
+        assert replicated["document"].count_calls("find_by_id") == 4
+        assert not router.is_healthy("MirroredItem", "document")
+
+    @pytest.mark.asyncio
+    async def test_hedged_read_beats_a_stalled_storage(self, replicated, monkeypatch):
+        """A read past the p95 deadline is raced against the next storage"""
+        monkeypatch.setattr(MirroredItem.get_metadata(), "options", {"read_replicas": ["document"], "hedged_reads": True})
+        router = ReadRouter(min_hedge_samples=1)
+        router.record("MirroredItem", "document", 0.001, ok=True)
+        router.record("MirroredItem", "graph", 0.002, ok=True)
+        replicated["document"].delay = 1.0
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False, read_router=router)
+
+        started = time.monotonic()
+        assert (await crud.read("a")).name == "A"
+
+        assert time.monotonic() - started < 0.5
+        assert crud.get_routing_stats()["hedged"] == 1
+
+
+class TestCircuitBreakers:
+    """Test circuit breakers in the UnifiedCRUD fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_open_secondary_is_skipped(self, mirrored_daos, monkeypatch):
+        """Writes skip a secondary whose circuit is open"""
+        monkeypatch.setattr(MirroredItem.get_metadata(), "options", {"circuit_breaker": {"failure_threshold": 1}})
+        mirrored_daos["graph"].records["a"] = MirroredItem(id="a", name="A")
+        mirrored_daos["document"].error = ConnectionError("down")
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        await crud.update("a", {"name": "B"})
+        await crud.update("a", {"name": "C"})
+
+        assert mirrored_daos["document"].count_calls("update") == 1
+        assert [entry.status for entry in crud.get_operations_log()] == ["success", "failed", "success", "skipped"]
+        assert crud.get_circuit_stats()["document"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_open_primary_fails_fast(self, mirrored_daos, monkeypatch):
+        """Reads of a model whose primary circuit is open are rejected without a call"""
+        monkeypatch.setattr(MirroredItem.get_metadata(), "options", {"circuit_breaker": {"failure_threshold": 2}})
+        mirrored_daos["graph"].error = ConnectionError("down")
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await crud.read("a")
+        with pytest.raises(CircuitOpenError):
+            await crud.read("a")
+
+        assert mirrored_daos["graph"].count_calls("find_by_id") == 2
+
+
+class TestOperationsLog:
+    """Test the UnifiedCRUD operations log and metrics"""
+
+    @pytest.mark.asyncio
+    async def test_writes_are_logged_reads_only_counted(self, mirrored_daos, monkeypatch):  # noqa: ARG002
+        """Writes land in the bounded log without payloads; reads only feed the metrics"""
+        monkeypatch.setattr(MirroredItem.get_metadata(), "options", {"operations_log_size": 2})
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        first = await crud.create({"name": "A"})
+        second = await crud.create({"name": "B"})
+        await crud.read(first.id)
+
+        log = crud.get_operations_log()
+        assert [(entry.storage_name, entry.item_id) for entry in log] == [("graph", second.id), ("document", second.id)]
+        assert not hasattr(log[0], "data")
+        metrics = crud.get_operation_metrics()
+        assert metrics["graph"]["create"]["count"] == 2
+        assert metrics["graph"]["read"]["count"] == 1
+
+
+class TestWriteBehind:
+    """Test write-behind coalescing of updates"""
+
+    @pytest.mark.asyncio
+    async def test_updates_are_merged_into_one_write(self, mirrored_daos):
+        """Updates inside the window become one write per storage, readable before it"""
+        mirrored_daos["graph"].records["a"] = MirroredItem(id="a", name="A")
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False, write_behind_window=60)
+
+        for index in range(10):
+            await crud.update("a", {"name": f"v{index}"})
+
+        assert (await crud.read("a")).name == "v9"
+        assert mirrored_daos["graph"].count_calls("update") == 0
+
+        await crud.flush_writes()
+        assert mirrored_daos["graph"].count_calls("update") == 1
+        assert mirrored_daos["document"].count_calls("update") == 1
+        assert mirrored_daos["graph"].records["a"].name == "v9"
+        stats = crud.get_write_behind_stats()
+        assert (stats["updates"], stats["coalesced"], stats["flushes"], stats["pending"]) == (10, 9, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_window_flushes_automatically(self, mirrored_daos):
+        """Buffered updates are written when the window ends"""
+        mirrored_daos["graph"].records["a"] = MirroredItem(id="a", name="A")
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False, write_behind_window=0.01)
+
+        await crud.update("a", {"name": "B"})
+        await asyncio.sleep(0.05)
+
+        assert mirrored_daos["graph"].records["a"].name == "B"
+        assert crud.get_write_behind_stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_drops_buffered_updates(self, mirrored_daos):
+        """A deleted record's pending updates are never written"""
+        mirrored_daos["graph"].records["a"] = MirroredItem(id="a", name="A")
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False, write_behind_window=60)
+
+        await crud.update("a", {"name": "B"})
+        await crud.delete("a")
+        await crud.flush_writes()
+
+        assert mirrored_daos["graph"].count_calls("update") == 0
+        assert await crud.read("a") is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_writes_settle_buffered_updates(self, mirrored_daos):
+        """apply_bulk writes buffered patches before its own and drops those of deleted records"""
+        for dao in mirrored_daos.values():
+            dao.records.update({item_id: MirroredItem(id=item_id, name=item_id) for item_id in ("a", "b")})
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False, write_behind_window=60)
+        await crud.update("a", {"name": "buffered"})
+        await crud.update("b", {"name": "buffered"})
+
+        result = await crud.apply_bulk(updates={"a": {"name": "bulk"}}, deletes=["b"])
+
+        assert result.succeeded == ["a", "b"]
+        assert crud.get_write_behind_stats()["pending"] == 0
+        for dao in mirrored_daos.values():
+            assert [item_id for call, item_id in dao.calls if call == "update"] == ["a", "a"]
+            assert dao.records["a"].name == "bulk"
+            assert "b" not in dao.records
+
+
+class TestReconciliation:
+    """Test digest-based reconciliation between storages"""
+
+    @pytest.mark.asyncio
+    async def test_only_differing_records_are_moved(self, mirrored_daos):
+        """Missing and changed records are copied; matching ones are not touched"""
+        items = [MirroredItem(name=f"item{index}") for index in range(20)]
+        for item in items:
+            mirrored_daos["graph"].records[item.id] = item
+            mirrored_daos["document"].records[item.id] = item.model_copy()
+        del mirrored_daos["document"].records[items[3].id]
+        mirrored_daos["document"].records[items[7].id] = items[7].model_copy(update={"name": "stale"})
+        extra = MirroredItem(name="orphan")
+        mirrored_daos["document"].records[extra.id] = extra
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        report = (await crud.reconcile(move_batch_size=10))["document"]
+
+        assert report.created == [items[3].id]
+        assert report.updated == [items[7].id]
+        assert report.extra == [extra.id]
+        assert report.deleted == []
+        assert mirrored_daos["document"].records[items[7].id].name == "item7"
+        assert mirrored_daos["graph"].calls[-1] == ("find_by_ids", [items[7].id])
+        # Differing buckets are compared from the digest trees, not rescanned
+        assert [dao.count_calls("find") for dao in mirrored_daos.values()] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_in_sync_storages_are_only_scanned(self, mirrored_daos):
+        """Equal digest trees end the job after one scan per storage"""
+        for index in range(5):
+            item = MirroredItem(name=f"item{index}")
+            mirrored_daos["graph"].records[item.id] = item
+            mirrored_daos["document"].records[item.id] = item.model_copy()
+        crud = UnifiedCRUD(MirroredItem, security_enabled=False)
+
+        report = (await crud.reconcile(delete_extra=True))["document"]
+
+        assert (report.source_records, report.target_records, report.differing_buckets) == (5, 5, 0)
+        assert [dao.count_calls("find") for dao in mirrored_daos.values()] == [1, 1]
+        assert [call for call, _ in mirrored_daos["document"].calls] == ["find"]
+
+    def test_digest_tree_narrows_to_leaf_buckets(self):
+        """Tree comparison reports only the buckets holding differences"""
+        ids = ["0190a000-0000-7000-8000-000000000001", "0190b000-0000-7000-8000-000000000002", "custom-id"]
+        left, right = DigestTree(), DigestTree()
+        for item_id in ids:
+            left.add(item_id, "x")
+            right.add(item_id, "y" if item_id == ids[1] else "x")
+
+        assert left.diff(right) == {time_bucket(ids[1], DEFAULT_BUCKET_PREFIX)} == {"0190b000"}
+        assert time_bucket(ids[2], DEFAULT_BUCKET_PREFIX).startswith("~")